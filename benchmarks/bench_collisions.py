@@ -0,0 +1,116 @@
+"""Compare brute-force, linear-scan and grid broadphase collision passes at increasing entity counts.
+
+Game.handle_collisions scans every target below cfg.BROADPHASE_MIN_TARGETS enemies + obstacles
+and builds grids above it; the scan and grid columns force one path each, the game column
+times whichever path the game takes at that size.
+
+Run from the repo root:
+
+    python -m benchmarks.bench_collisions
+"""
+import random
+import time
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.entities import Bullet, Enemy, Obstacle
+
+SCALES = [10, 50, 100, 250, 500, 1000]
+REPEATS = 5
+
+
+def populate(g, n, seed=0):
+    """n player bullets plus n enemies and n obstacles spread over the playfield."""
+    rng = random.Random(seed)
+    random.seed(seed)
+    g.bullets = [Bullet(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), -cfg.BULLET_SPEED)
+                 for _ in range(n)]
+    g.enemies = [Enemy(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), 30, 24, 100.0, hp=10**6)
+                 for _ in range(n)]
+    g.obstacles = [Obstacle(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), 30, 90.0)
+                   for _ in range(n)]
+
+
+def naive_collisions(g: Game):
+    """Reference O(bullets x targets) collision pass over g, for equivalence tests and this benchmark."""
+    player = g.player
+    # bullets vs enemies
+    for b in list(g.bullets):
+        if b.owner == "player":
+            for e in list(g.enemies):
+                if b.rect().colliderect(e.rect()):
+                    g.bullets.remove(b)
+                    if e.hit(1):
+                        g.enemies.remove(e)
+                        player.score += 10
+                        g.kills += 1
+                    break
+            else:
+                # bullets vs obstacles (player bullets can damage asteroids)
+                for ob in list(g.obstacles):
+                    if b.rect().colliderect(ob.rect()):
+                        g.bullets.remove(b)
+                        ob.hp -= 1
+                        # small score for damaging
+                        player.score += 2
+                        if ob.hp <= 0:
+                            ob.explode_into(g.debris)
+                            g.obstacles.remove(ob)
+                            player.score += 5
+                        break
+        else:
+            # enemy bullet vs player
+            if b.rect().colliderect(player.rect()):
+                g.bullets.remove(b)
+                player.health -= 1
+
+    # player vs obstacles: obstacle is destroyed and spawns debris
+    for ob in list(g.obstacles):
+        if ob.rect().colliderect(player.rect()):
+            ob.explode_into(g.debris)
+            g.obstacles.remove(ob)
+            player.health -= ob.damage
+
+    # player vs enemies
+    for en in list(g.enemies):
+        if en.rect().colliderect(player.rect()):
+            g.enemies.remove(en)
+            player.health -= 1
+
+
+def time_pass(g, n, method):
+    best = float("inf")
+    for r in range(REPEATS):
+        populate(g, n, seed=r)
+        t0 = time.perf_counter()
+        method(g)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def forced(min_targets):
+    """handle_collisions with BROADPHASE_MIN_TARGETS temporarily set to min_targets."""
+    def method(g):
+        saved = cfg.BROADPHASE_MIN_TARGETS
+        cfg.BROADPHASE_MIN_TARGETS = min_targets
+        try:
+            g.handle_collisions()
+        finally:
+            cfg.BROADPHASE_MIN_TARGETS = saved
+    return method
+
+
+def main():
+    g = Game(headless=True)
+    print(f"{'entities':>8} {'naive ms':>10} {'scan ms':>10} {'grid ms':>10} {'game ms':>10} {'speedup':>8}")
+    for n in SCALES:
+        naive = time_pass(g, n, naive_collisions)
+        scan = time_pass(g, n, forced(float("inf")))
+        grid = time_pass(g, n, forced(0))
+        game = time_pass(g, n, Game.handle_collisions)
+        print(f"{n:>8} {naive * 1000:>10.2f} {scan * 1000:>10.2f} {grid * 1000:>10.2f} {game * 1000:>10.2f} "
+              f"{naive / game:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Measure how long it takes to get a headless game going.
+
+Cold numbers come from fresh interpreters (module import plus the first Game, which loads
+the sprite assets); warm numbers are further Game constructions in one process, which is
+what batch workers and agent environments pay per game.
+
+    python -m benchmarks.bench_startup
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+COLD_RUNS = 5
+WARM_GAMES = 200
+
+_COLD = """
+import time
+t0 = time.perf_counter()
+from jet_runner.game import Game
+t1 = time.perf_counter()
+g = Game(headless=True, verbose=False)
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def cold(runs: int = COLD_RUNS):
+    """(import seconds, first-game seconds) medians over fresh interpreters."""
+    imports, firsts = [], []
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", _COLD], cwd=root, capture_output=True, text=True,
+                             check=True).stdout.split()
+        imports.append(float(out[-2]))
+        firsts.append(float(out[-1]))
+    return statistics.median(imports), statistics.median(firsts)
+
+
+def warm(games: int = WARM_GAMES):
+    """Per-game construction seconds for games built back to back in this process."""
+    from jet_runner.game import Game
+
+    Game(headless=True, verbose=False)
+    times = []
+    for _ in range(games):
+        t0 = time.perf_counter()
+        Game(headless=True, verbose=False)
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main():
+    imp, first = cold()
+    print(f"cold: import {imp * 1000:.1f} ms, first Game() {first * 1000:.1f} ms (median of {COLD_RUNS})")
+    times = warm()
+    times.sort()
+    print(f"warm: Game() median {statistics.median(times) * 1000:.3f} ms, "
+          f"p95 {times[int(len(times) * 0.95)] * 1000:.3f} ms over {len(times)} games "
+          f"({len(times) / sum(times):.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Stress-scenario benchmarks for the update, collision and draw hot paths.
+
+Each scenario builds a seeded Game holding the same number of bullets, enemies, obstacles,
+debris and scenery, then times Game.update, Game.handle_collisions and Game.draw (into the
+headless offscreen surface) separately. The "typical" scenario instead plays an ordinary game
+(a handful of enemies and obstacles) and times the mean update and draw per tick, the load
+that batch and fast-forward runs pay on every tick. Every metric is the median of several
+samples taken after untimed warm-up rounds.
+
+Results are printed as JSON and compared against a stored baseline; any metric above its
+threshold (see compare) is reported and exits non-zero.
+
+    python -m benchmarks.bench_suite                     # compare with benchmarks/baseline.json
+    python -m benchmarks.bench_suite --update-baseline   # record a new baseline on this machine
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.entities import Bullet
+from jet_runner import spawner
+from jet_runner.policies import SweepPolicy
+
+SIZES = (10, 100, 1000)
+PHASES = ("update", "collisions", "draw")
+REPEATS = 15  # timed samples per metric; each metric reports their median
+WARMUP_ROUNDS = 2  # untimed rounds first, to warm sprite caches and the allocator
+SAMPLE_ENTITIES = 100  # scenarios with fewer entities per type time several fresh copies per sample
+TYPICAL_WARMUP = 300  # ticks played before timing, so spawns reach their usual population
+TYPICAL_TICKS = 600
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def build_game(n: int, seed: int = 0) -> Game:
+    """A headless game with n of each entity type spread over the playfield."""
+    g = Game(headless=True, seed=seed, verbose=False)
+    g.player.health = 10**9
+    rng = random.Random(seed)
+
+    def place(e):
+        e.x = rng.uniform(0, cfg.WIDTH)
+        e.y = rng.uniform(0, cfg.HEIGHT)
+        return e
+
+    g.enemies = [place(spawner.spawn_enemy(rng=g.rng_enemies)) for _ in range(n)]
+    g.obstacles = [place(spawner.spawn_obstacle(rng=g.rng_obstacles)) for _ in range(n)]
+    g.scenery = [place(spawner.spawn_scenery(rng=g.rng_scenery, max_alpha=180)) for _ in range(n)]
+    g.bullets = [Bullet(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT),
+                        -cfg.BULLET_SPEED if i % 4 else cfg.ENEMY_BULLET_SPEED,
+                        owner="player" if i % 4 else "enemy") for i in range(n)]
+    if n:
+        xs, ys, vxs, vys = zip(*[(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), rng.uniform(-80, 80),
+                                  rng.uniform(30, 120)) for _ in range(n)])
+        g.debris.emit(xs, ys, 6, 4, vxs, vys, 60.0)
+    return g
+
+
+def time_phase(n: int, phase: str, repeats: int) -> float:
+    """Median milliseconds of one call of the phase on a freshly built scenario.
+
+    Small scenarios run in a few hundred microseconds, too short for one timing to be stable,
+    so each sample times the phase once on each of SAMPLE_ENTITIES // n fresh copies and
+    reports the mean.
+    """
+    copies = max(1, SAMPLE_ENTITIES // max(n, 1))
+    samples = []
+    for r in range(WARMUP_ROUNDS + repeats):
+        games = [build_game(n, seed=r) for _ in range(copies)]
+        calls = [{"update": lambda g=g: g.update(1.0 / cfg.FPS),
+                  "collisions": g.handle_collisions,
+                  "draw": g.draw}[phase] for g in games]
+        t0 = time.perf_counter()
+        for call in calls:
+            call()
+        elapsed = (time.perf_counter() - t0) / copies
+        if r >= WARMUP_ROUNDS:
+            samples.append(elapsed * 1000.0)
+    # the median is what a rerun on the same machine reproduces; a minimum rewards lucky runs
+    return statistics.median(samples)
+
+
+def time_typical(repeats: int) -> dict:
+    """Median over repeats of the mean milliseconds per tick of update and draw during ordinary play."""
+    samples = {"update": [], "draw": []}
+    for r in range(repeats):
+        g = Game(headless=True, seed=r, input_policy=SweepPolicy(), verbose=False)
+        g.player.health = 10**9
+        for _ in range(TYPICAL_WARMUP):
+            g.tick(1.0 / cfg.FPS)
+            g.draw()
+        total = dict.fromkeys(samples, 0.0)
+        for _ in range(TYPICAL_TICKS):
+            t0 = time.perf_counter()
+            g.tick(1.0 / cfg.FPS)
+            t1 = time.perf_counter()
+            g.draw()
+            total["update"] += t1 - t0
+            total["draw"] += time.perf_counter() - t1
+        for phase, t in total.items():
+            samples[phase].append(t * 1000.0 / TYPICAL_TICKS)
+    return {phase: statistics.median(col) for phase, col in samples.items()}
+
+
+def calibrate(repeats: int = REPEATS) -> float:
+    """Median milliseconds of a fixed pure-Python workload, a yardstick for machine speed."""
+    samples = []
+    for r in range(WARMUP_ROUNDS + repeats):
+        t0 = time.perf_counter()
+        acc = 0
+        for i in range(200_000):
+            acc += i * i % 7
+        if r >= WARMUP_ROUNDS:
+            samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def run_suite(sizes=SIZES, repeats: int = REPEATS) -> dict:
+    results = {f"n{n}": {phase: round(time_phase(n, phase, repeats), 4) for phase in PHASES} for n in sizes}
+    results["typical"] = {phase: round(ms, 4) for phase, ms in time_typical(repeats).items()}
+    results["calibration"] = round(calibrate(repeats), 4)
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Return (scenario, phase, now_ms, threshold_ms) for every metric above its threshold.
+
+    The threshold is max(baseline, rescaled baseline) * (1 + tolerance), where the rescaled
+    baseline follows the calibration ratio when both runs carry one. Taking the larger of the
+    two means a metric must be slow against both: the pure-Python calibration loop doesn't
+    track NumPy- or SDL-bound phases closely enough to be trusted on its own.
+    """
+    scale = 1.0
+    if results.get("calibration") and baseline.get("calibration"):
+        scale = results["calibration"] / baseline["calibration"]
+    regressions = []
+    for scenario, phases in results.items():
+        if not isinstance(phases, dict):
+            continue
+        for phase, ms in phases.items():
+            base = baseline.get(scenario, {}).get(phase)
+            if base is None:
+                continue
+            threshold = max(base, base * scale) * (1.0 + tolerance)
+            if ms > threshold:
+                regressions.append((scenario, phase, ms, threshold))
+    return regressions
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Jet Runner hot-path benchmarks")
+    p.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Entities of each type per scenario")
+    p.add_argument("--repeats", type=int, default=REPEATS, help="Timed samples per metric (median reported)")
+    p.add_argument("--baseline", default=BASELINE)
+    p.add_argument("--tolerance", type=float, default=0.5, help="Allowed slowdown over baseline (0.5 = 50%%)")
+    p.add_argument("--update-baseline", action="store_true", help="Write the results as the new baseline")
+    p.add_argument("--out", default=None, help="Also write the results JSON to this file")
+    args = p.parse_args(argv)
+
+    results = run_suite(args.sizes, args.repeats)
+    print(json.dumps(results, indent=2))
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update-baseline first", file=sys.stderr)
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    for scenario, phase, ms, threshold in regressions:
+        print(f"REGRESSION {scenario} {phase}: {ms:.3f} ms > threshold {threshold:.3f} ms "
+              f"(+{(ms / threshold - 1.0):.0%})", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+# Process-wide sprite assets for Jet Runner
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+import pygame
+
+import jet_runner.config as cfg
+
+ASSETS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "assets"))
+
+
+class AssetManager:
+    """Loads each image at most once per process and keeps it converted to the display format.
+
+    A missing file falls back to the generate() callback; the generated surface is cached in
+    memory only, the assets directory is never written to. Images loaded before a display
+    exists are converted on the first request after one appears.
+    """
+
+    def __init__(self, directory: str = ASSETS_DIR):
+        self.directory = directory
+        self._images: Dict[str, Tuple[Optional[pygame.Surface], bool]] = {}
+        self.loads = 0
+        self.generated = 0
+
+    def image(self, name: str, generate: Callable[[], pygame.Surface] = None) -> Optional[pygame.Surface]:
+        entry = self._images.get(name)
+        if entry is not None:
+            surf, converted = entry
+            if converted or surf is None or pygame.display.get_surface() is None:
+                return surf
+        else:
+            surf = self._load(name, generate)
+        converted = pygame.display.get_surface() is not None
+        if surf is not None and converted:
+            surf = surf.convert_alpha()
+        self._images[name] = (surf, converted)
+        return surf
+
+    def _load(self, name: str, generate) -> Optional[pygame.Surface]:
+        path = os.path.join(self.directory, name)
+        try:
+            surf = pygame.image.load(path)
+            self.loads += 1
+            return surf
+        except (OSError, pygame.error):
+            pass
+        if generate is None:
+            return None
+        self.generated += 1
+        return generate()
+
+    def clear(self):
+        self._images.clear()
+
+
+def generate_jet() -> pygame.Surface:
+    s = pygame.Surface((64, 64), flags=pygame.SRCALPHA)
+    # body
+    pygame.draw.polygon(s, cfg.COLOR_PLAYER, [(8,50), (32,10), (56,50), (40,44), (24,44)])
+    # cockpit
+    pygame.draw.circle(s, (220, 240, 255), (32,22), 6)
+    # nozzle highlight
+    pygame.draw.polygon(s, (90,90,120), [(24,44),(40,44),(32,54)])
+    return s
+
+
+def generate_flame() -> pygame.Surface:
+    f = pygame.Surface((20, 30), flags=pygame.SRCALPHA)
+    # layered flame shapes
+    pygame.draw.polygon(f, (255, 200, 30), [(10,0),(0,18),(20,18)])
+    pygame.draw.polygon(f, (255,120,10), [(10,4),(3,20),(17,20)])
+    pygame.draw.polygon(f, (200,30,10), [(10,10),(6,24),(14,24)])
+    return f
+
+
+ASSETS = AssetManager()
@@ -0,0 +1,68 @@
+# Pre-rendered parallax starfield for the Jet Runner background
+import random
+from typing import List, Tuple
+
+import pygame
+
+import jet_runner.config as cfg
+
+_KEY = (0, 0, 0)  # transparent colour of the layer surfaces
+
+
+class Starfield:
+    """A few screen-sized, vertically tileable star layers scrolling at depth-scaled speeds.
+
+    Each layer is rendered once with its stars already blended against the background colour
+    and a colour key for the empty sky, so a frame costs two cheap blits per layer no matter
+    how many stars there are.
+    """
+
+    def __init__(self, layers=cfg.STARFIELD_LAYERS, max_alpha: int = 255, rng=None, size=(cfg.WIDTH, cfg.HEIGHT)):
+        rng = rng or random
+        self.size = size
+        self.speeds: List[float] = []
+        self.offsets: List[float] = []
+        self.surfaces: List[pygame.Surface] = []
+        for depth, count in layers:
+            self.speeds.append(cfg.SCENERY_MIN_SPEED * depth)
+            self.offsets.append(rng.uniform(0, size[1]))
+            self.surfaces.append(self._render_layer(depth, count, max_alpha, rng))
+
+    def _render_layer(self, depth: float, count: int, max_alpha: int, rng) -> pygame.Surface:
+        w, h = self.size
+        layer = pygame.Surface((w, h))
+        layer.fill(_KEY)
+        # same opacity rule as scenery: far (small depth) layers are fainter
+        alpha = max(10, min(max_alpha, int(60 + depth * 180))) / 255.0
+        for _ in range(count):
+            r = max(1, int(rng.uniform(4, 10) * (0.5 + depth) / 2))
+            x = rng.randrange(w)
+            y = rng.randrange(h)
+            base = rng.randint(180, 255)
+            col = tuple(max(1, int(base * alpha + bg * (1 - alpha))) for bg in cfg.COLOR_BG)
+            # draw at y and its wrapped copies so the layer tiles seamlessly
+            for wy in (y - h, y, y + h):
+                pygame.draw.circle(layer, col, (x, wy), r)
+                pygame.draw.line(layer, col, (x - r - 1, wy), (x + r + 1, wy), 1)
+                pygame.draw.line(layer, col, (x, wy - r - 1), (x, wy + r + 1), 1)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()
+        layer.set_colorkey(_KEY, pygame.RLEACCEL)
+        return layer
+
+    def update(self, dt: float):
+        h = self.size[1]
+        self.offsets = [(off + speed * dt) % h for off, speed in zip(self.offsets, self.speeds)]
+
+    def blit_items(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """The two (layer, position) blits of every layer, far to near."""
+        h = self.size[1]
+        items = []
+        for layer, off in zip(self.surfaces, self.offsets):
+            y = int(off)
+            items.append((layer, (0, y)))
+            items.append((layer, (0, y - h)))
+        return items
+
+    def draw(self, surf: pygame.Surface) -> List[pygame.Rect]:
+        return surf.blits(self.blit_items())
@@ -0,0 +1,172 @@
+"""Run many seeded headless games in parallel for balance tuning.
+
+Each game runs at uncapped simulation speed (fast-forward) under a scripted input policy.
+Settings are swept as a grid: every combination of --set values is played --games times.
+Only BALANCE_SETTINGS constants can be swept: the others are either not read while a game
+runs (ENEMY_FIRE_CHANCE, for one) or bound at import time, so overriding them would change
+nothing.
+
+    python -m jet_runner.batch --games 200 --duration 120 --policy random \\
+        --set SPAWN_ENEMY_INTERVAL=0.8,1.2 --set enemy_bullets=True,False --out results.csv
+"""
+import argparse
+import ast
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from jet_runner.workers import context as workers_context
+import jet_runner.config as cfg
+
+# lower-case settings are Game keyword arguments, upper-case ones override jet_runner.config
+GAME_KWARGS = ("enemy_bullets", "allow_nebulae", "max_scenery_alpha")
+# config constants the game reads while it runs, so a per-game override takes effect
+BALANCE_SETTINGS = ("PLAYER_SPEED", "PLAYER_HEALTH", "PLAYER_FIRE_COOLDOWN", "BULLET_SPEED", "ENEMY_BULLET_SPEED",
+                    "ENEMY_MIN_SPEED", "ENEMY_MAX_SPEED", "SCENERY_MIN_SPEED", "SCENERY_MAX_SPEED",
+                    "SPAWN_ENEMY_INTERVAL", "SPAWN_OBSTACLE_INTERVAL", "SPAWN_SCENERY_INTERVAL", "SPAWN_BODY_INTERVAL")
+
+
+def run_game(job: Dict) -> Dict:
+    """Play one headless game described by job and return its result row. Runs in a worker process."""
+    from jet_runner.game import Game
+    from jet_runner.policies import make_policy
+
+    settings = job["settings"]
+    overrides = {k: v for k, v in settings.items() if k.isupper()}
+    saved = {k: getattr(cfg, k) for k in overrides}
+    try:
+        for k, v in overrides.items():
+            setattr(cfg, k, v)
+        kwargs = {k: v for k, v in settings.items() if k in GAME_KWARGS}
+        g = Game(headless=True, seed=job["seed"], input_policy=make_policy(job["policy"], job["seed"]),
+                 verbose=False, **kwargs)
+        t0 = time.perf_counter()
+        g.run(max_seconds=job["duration"], fast_forward=True)
+        wall = time.perf_counter() - t0
+    finally:
+        for k, v in saved.items():
+            setattr(cfg, k, v)
+    row = {"config": job["config"], "seed": job["seed"], "policy": job["policy"]}
+    row.update(settings)
+    row.update(score=g.player.score, health=g.player.health, survival=round(g.elapsed, 4), kills=g.kills,
+               died=g.player.health <= 0, ticks=g.ticks, wall=round(wall, 4))
+    return row
+
+
+def parse_sets(pairs: List[str]) -> Dict[str, list]:
+    """Parse NAME=v1,v2,... sweep definitions into {name: [values]}."""
+    grid = {}
+    for pair in pairs:
+        name, _, values = pair.partition("=")
+        name = name.strip()
+        if not values:
+            raise ValueError(f"--set expects NAME=VALUE[,VALUE...], got {pair!r}")
+        if not name.isupper() and name not in GAME_KWARGS:
+            raise ValueError(f"unknown setting {name!r}")
+        if name.isupper() and not hasattr(cfg, name):
+            raise ValueError(f"jet_runner.config has no {name!r}")
+        if name.isupper() and name not in BALANCE_SETTINGS:
+            raise ValueError(f"{name} is not read while a game runs, so sweeping it would change nothing; "
+                             f"choose from {', '.join(BALANCE_SETTINGS)}")
+        grid[name] = [ast.literal_eval(v.strip()) for v in values.split(",")]
+    return grid
+
+
+def make_jobs(grid: Dict[str, list], games: int, duration: float, policy: str, seed: int) -> List[Dict]:
+    names = list(grid)
+    jobs = []
+    for ci, combo in enumerate(itertools.product(*(grid[n] for n in names))):
+        settings = dict(zip(names, combo))
+        for gi in range(games):
+            # same seeds across configurations so settings are compared on identical games
+            jobs.append({"config": ci, "seed": seed + gi, "policy": policy, "duration": duration,
+                         "settings": settings})
+    return jobs
+
+
+def summarize(rows: List[Dict], names: List[str]) -> List[Dict]:
+    """Aggregate per-configuration means of the result fields."""
+    groups: Dict[int, List[Dict]] = {}
+    for r in rows:
+        groups.setdefault(r["config"], []).append(r)
+    summary = []
+    for ci in sorted(groups):
+        grp = groups[ci]
+        entry = {"config": ci, "games": len(grp)}
+        entry.update({n: grp[0][n] for n in names})
+        for f in ("score", "health", "survival", "kills"):
+            entry[f] = sum(r[f] for r in grp) / len(grp)
+        entry["death_rate"] = sum(r["died"] for r in grp) / len(grp)
+        summary.append(entry)
+    return summary
+
+
+def format_table(summary: List[Dict]) -> str:
+    if not summary:
+        return ""
+    cols = list(summary[0])
+    rows = [[f"{v:.2f}" if isinstance(v, float) else str(v) for v in (e[c] for c in cols)] for e in summary]
+    widths = [max(len(c), *(len(r[i]) for r in rows)) for i, c in enumerate(cols)]
+    lines = ["  ".join(c.rjust(w) for c, w in zip(cols, widths))]
+    lines += ["  ".join(v.rjust(w) for v, w in zip(r, widths)) for r in rows]
+    return "\n".join(lines)
+
+
+def write_results(path: str, rows: List[Dict], summary: List[Dict]):
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=list(rows[0]))
+            w.writeheader()
+            w.writerows(rows)
+    else:
+        with open(path, "w") as f:
+            json.dump({"summary": summary, "games": rows}, f, indent=2)
+
+
+def run_batch(jobs: List[Dict], workers: int = None) -> List[Dict]:
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [run_game(j) for j in jobs]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=workers_context()) as ex:
+        # a few chunks per worker keeps everyone busy without per-game IPC overhead
+        chunk = max(1, len(jobs) // (workers * 4))
+        return list(ex.map(run_game, jobs, chunksize=chunk))
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Jet Runner batch simulation")
+    p.add_argument("--games", type=int, default=20, help="Games per settings combination")
+    p.add_argument("--duration", type=float, default=60.0, help="Simulated seconds per game")
+    p.add_argument("--policy", default="random", help="Input policy: idle, sweep or random")
+    p.add_argument("--seed", type=int, default=0, help="Seed of the first game")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p.add_argument("--set", dest="sets", action="append", default=[], metavar="NAME=V1,V2",
+                   help="Sweep a config constant (e.g. SPAWN_ENEMY_INTERVAL) or Game option (e.g. enemy_bullets)")
+    p.add_argument("--out", default=None, help="Write per-game results to this .csv or .json file")
+    args = p.parse_args(argv)
+    if args.games < 1:
+        p.error("--games must be at least 1")
+
+    try:
+        grid = parse_sets(args.sets)
+    except (ValueError, SyntaxError) as e:
+        p.error(str(e))
+    jobs = make_jobs(grid, args.games, args.duration, args.policy, args.seed)
+    t0 = time.perf_counter()
+    rows = run_batch(jobs, args.workers)
+    wall = time.perf_counter() - t0
+    summary = summarize(rows, list(grid))
+    print(format_table(summary))
+    sim = sum(r["survival"] for r in rows)
+    print(f"{len(rows)} games in {wall:.2f}s - {len(rows) / wall:.1f} games/s, {sim / wall:.0f} simulated s/s")
+    if args.out:
+        write_results(args.out, rows, summary)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
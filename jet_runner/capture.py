@@ -0,0 +1,101 @@
+# Background frame capture for Jet Runner (raw RGB stream or PNG sequence)
+import os
+import queue
+import threading
+
+import numpy as np
+import pygame
+
+import jet_runner.config as cfg
+
+FORMATS = ("raw", "png")
+
+
+class FrameWriter:
+    """Streams rendered frames to disk from a writer thread without stalling the game loop.
+
+    submit() copies the frame out of the surface's pixel buffer (a zero-copy surfarray view)
+    into one of a fixed set of preallocated buffers and queues it. When every buffer is still
+    waiting to be written the frame is dropped and counted instead of blocking the caller;
+    with realtime off (runs without a frame deadline, e.g. fast-forward) submit() waits for a
+    free buffer instead, so no frame is lost.
+    "raw" appends packed RGB24 frames to one file (ffmpeg -f rawvideo -pix_fmt rgb24 -s WxH);
+    "png" writes path/frame_000000.png, path/frame_000001.png, ...
+    """
+
+    def __init__(self, path: str, size=(cfg.WIDTH, cfg.HEIGHT), fmt: str = "raw",
+                 queue_size: int = cfg.CAPTURE_QUEUE_SIZE):
+        if fmt not in FORMATS:
+            raise ValueError(f"unknown capture format {fmt!r}; choose from {', '.join(FORMATS)}")
+        self.path = path
+        self.size = tuple(size)
+        self.fmt = fmt
+        w, h = self.size
+        self._free = queue.SimpleQueue()
+        for _ in range(queue_size):
+            self._free.put(np.empty((h, w, 3), dtype=np.uint8))
+        self._pending = queue.Queue(maxsize=queue_size)
+        if fmt == "raw":
+            self._file = open(path, "wb")
+        else:
+            os.makedirs(path, exist_ok=True)
+            self._file = None
+        self.submitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.realtime = True
+        self.error = None
+        self._thread = threading.Thread(target=self._work, name="frame-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, surface: pygame.Surface) -> bool:
+        """Queue a copy of surface for writing; returns False if the frame had to be dropped."""
+        index = self.submitted
+        self.submitted += 1
+        if self.realtime:
+            try:
+                buf = self._free.get_nowait()
+            except queue.Empty:
+                self.dropped += 1
+                return False
+        else:
+            buf = self._free.get()
+        view = pygame.surfarray.pixels3d(surface)  # (w, h, 3), locks the surface while alive
+        np.copyto(buf, view.transpose(1, 0, 2))
+        del view
+        self._pending.put_nowait((index, buf))
+        return True
+
+    def _work(self):
+        w, h = self.size
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            index, buf = item
+            try:
+                if self.error is None:
+                    if self._file is not None:
+                        self._file.write(memoryview(buf))
+                    else:
+                        img = pygame.image.frombuffer(buf, (w, h), "RGB")
+                        pygame.image.save(img, os.path.join(self.path, f"frame_{index:06d}.png"))
+                    self.written += 1
+            except Exception as e:  # surfaced by close(); keep draining so submit() never blocks
+                self.error = e
+            finally:
+                self._free.put(buf)
+
+    def close(self):
+        """Flush queued frames and stop the writer thread; re-raises a write error, if any."""
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self.error is not None:
+            raise self.error
+
+    def stats(self) -> dict:
+        return {"submitted": self.submitted, "written": self.written, "dropped": self.dropped}
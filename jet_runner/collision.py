@@ -0,0 +1,61 @@
+# Broadphase collision helpers for Jet Runner
+from typing import Dict, List, Tuple
+
+import pygame
+
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """Uniform grid mapping cells to indices of the rects that overlap them.
+
+    Rects are stored by index so callers can keep their own parallel lists and test
+    candidates in original list order, which keeps results identical to a brute-force scan.
+    """
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def _span(self, rect: pygame.Rect):
+        cs = self.cell_size
+        x0 = rect.x // cs
+        y0 = rect.y // cs
+        # right/bottom edges are exclusive; always cover at least one cell
+        x1 = max(rect.x, rect.right - 1) // cs
+        y1 = max(rect.y, rect.bottom - 1) // cs
+        return x0, y0, x1, y1
+
+    def clear(self):
+        self.cells.clear()
+
+    def insert(self, idx: int, rect: pygame.Rect):
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [idx]
+                else:
+                    bucket.append(idx)
+
+    def build(self, rects: List[pygame.Rect]):
+        self.cells.clear()
+        for i, r in enumerate(rects):
+            self.insert(i, r)
+        return self
+
+    def query(self, rect: pygame.Rect) -> List[int]:
+        """Return candidate indices whose cells overlap rect, in ascending index order."""
+        x0, y0, x1, y1 = self._span(rect)
+        cells = self.cells
+        if x0 == x1 and y0 == y1:
+            return cells.get((x0, y0), [])
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found)
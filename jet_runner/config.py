@@ -15,7 +15,8 @@ PLAYER_FIRE_COOLDOWN = 0.25  # seconds
 
 SPAWN_ENEMY_INTERVAL = 1.2  # seconds
 SPAWN_OBSTACLE_INTERVAL = 0.9
-SPAWN_SCENERY_INTERVAL = 0.5
+SPAWN_SCENERY_INTERVAL = 0.5  # when stars are spawned as scenery entities
+SPAWN_BODY_INTERVAL = 1.25  # planets/comets/nebulae only, with stars drawn by the starfield
 
 ENEMY_FIRE_CHANCE = 0.25  # chance per firing opportunity
 ENEMY_BULLET_SPEED = 220.0
@@ -51,3 +52,48 @@ ASTEROID_PALETTES = [
     ((170, 170, 150), (110, 110, 90)), # pale rock
     ((140, 160, 180), (90, 110, 130)), # bluish rock
 ]
+
+# Rendering caches
+SCENERY_CACHE_SIZE = 256  # max pre-rendered scenery surfaces kept (LRU)
+STAR_TWINKLE_FRAMES = 4  # cached intensity frames per star
+STARFIELD_LAYERS = ((0.2, 70), (0.35, 45), (0.5, 25))  # (depth, stars) per background layer, far to near
+NEBULA_NOISE_OCTAVES = 4  # noise layers in generated nebula textures
+ENEMY_ATLAS_SIZE_STEP = 6  # enemy sprite sizes are quantized to this many pixels
+ENEMY_ATLAS_PHASES = 12  # pre-rendered tentacle phases per enemy sprite
+ASTEROID_CACHE_SIZE = 128  # max pre-rendered asteroid surfaces kept (LRU)
+ASTEROID_SEED_BUCKETS = 16  # crater layouts per asteroid size/palette
+DIRTY_RECT_MAX_FRACTION = 0.5  # dirty-rect mode flips the whole screen above this share of dirty area
+PARTICLE_CAPACITY = 1024  # initial particle slots per emitter (grows on demand)
+CAPTURE_QUEUE_SIZE = 8  # frame buffers in flight to the capture writer; further frames are dropped
+
+# Collisions
+BROADPHASE_MIN_TARGETS = 256  # with fewer enemies + obstacles, collisions scan every target instead of building grids
+
+# Profiling
+PROFILE_FRAMES = 3600  # frames kept in the profiler ring buffer
+
+# Stress mode
+STRESS_RAMP_GROWTH = 1.25  # spawn multiplier factor applied after every window that stays within budget
+STRESS_RAMP_WINDOW = 60  # frames per ramp step; the median frame time of a window is compared to budget
+
+# Adaptive quality (jet_runner.quality)
+# (name, scenery density, nebulae, translucent scenery, animated enemies), best first
+QUALITY_TIERS = (
+    ("high", 1.0, True, True, True),
+    ("medium", 0.6, False, True, True),
+    ("low", 0.3, False, False, False),
+)
+QUALITY_WINDOW = 30  # frames averaged per governor decision
+QUALITY_DOWN_AT = 0.9  # step down when the average frame time exceeds this share of 1/FPS
+QUALITY_UP_AT = 0.6  # step up when it stays below this share of 1/FPS ...
+QUALITY_UP_WINDOWS = 4  # ... for this many consecutive windows
+
+# Threaded simulation (jet_runner.simulation)
+SIM_INPUT_QUEUE = 64  # input samples buffered for the simulation thread (oldest dropped beyond this)
+SIM_MAX_LAG = 0.25  # seconds the simulation may fall behind its schedule before it stops catching up
+SIM_LERP_MAX_STEP = 64  # pixels per tick beyond which an object is drawn where it is instead of interpolated
+
+# Agent environment (jet_runner.env)
+ENV_MAX_ENTITIES = 16  # nearest enemies / obstacles / enemy bullets reported per feature observation
+ENV_FRAME_SIZE = (120, 160)  # downsampled frame observation size (width, height)
+ENV_HEALTH_REWARD = 50.0  # reward per point of health gained (negative when hit), on top of score gained
@@ -1,15 +1,22 @@
 import pygame
 import random
 import math
+import zlib
 from dataclasses import dataclass
 from typing import Tuple, List
 
+import numpy as np
+
 import jet_runner.config as cfg
-import os
+from jet_runner.store import EntityStore, StoreField, StoreView
+from jet_runner.sprites import SurfaceCache, to_display_format
+from jet_runner.assets import ASSETS, generate_jet, generate_flame
 
 
 @dataclass
 class Entity:
+    __slots__ = ("x", "y", "w", "h")
+
     x: float
     y: float
     w: float
@@ -22,56 +29,29 @@ class Entity:
         pass
 
     def draw(self, surf: pygame.Surface):
-        pass
+        """Draw onto surf and return the Rect that was touched (None if nothing was drawn)."""
+        return None
 
 
 class Player(Entity):
+    # flame alpha while firing / idle
+    FLAME_INTENSITIES = (1.0, 0.6)
+
     def __init__(self, x, y):
         super().__init__(x, y, 48, 24)
         self.speed = cfg.PLAYER_SPEED
         self.health = cfg.PLAYER_HEALTH
         self.fire_cooldown = 0.0
         self.score = 0
-        # sprite support: try to load assets/jet.png and assets/jet_flame.png; if missing, generate them
-        self.sprite = None
-        self.flame_sprite = None
+        # scaled sprites cached by _prepare_sprites for this (w, h)
+        self._sprites_for = None
+        self._jet_img = None
+        self._flame_imgs = {}
+        # sprites come from the process-wide asset manager: assets/jet.png and assets/jet_flame.png
+        # are loaded once, with in-memory generated stand-ins if they are missing
         try:
-            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            assets_dir = os.path.join(base_dir, 'assets')
-            os.makedirs(assets_dir, exist_ok=True)
-            jet_path = os.path.join(assets_dir, 'jet.png')
-            flame_path = os.path.join(assets_dir, 'jet_flame.png')
-            # attempt load if files exist
-            if os.path.exists(jet_path) and os.path.exists(flame_path):
-                self.sprite = pygame.image.load(jet_path).convert_alpha()
-                self.flame_sprite = pygame.image.load(flame_path).convert_alpha()
-            else:
-                # generate simple jet sprite
-                s = pygame.Surface((64, 64), flags=pygame.SRCALPHA)
-                # body
-                pygame.draw.polygon(s, cfg.COLOR_PLAYER, [(8,50), (32,10), (56,50), (40,44), (24,44)])
-                # cockpit
-                pygame.draw.circle(s, (220, 240, 255), (32,22), 6)
-                # nozzle highlight
-                pygame.draw.polygon(s, (90,90,120), [(24,44),(40,44),(32,54)])
-                # save
-                try:
-                    pygame.image.save(s, jet_path)
-                except Exception:
-                    pass
-                self.sprite = s
-
-                # generate flame sprite
-                f = pygame.Surface((20, 30), flags=pygame.SRCALPHA)
-                # layered flame shapes
-                pygame.draw.polygon(f, (255, 200, 30), [(10,0),(0,18),(20,18)])
-                pygame.draw.polygon(f, (255,120,10), [(10,4),(3,20),(17,20)])
-                pygame.draw.polygon(f, (200,30,10), [(10,10),(6,24),(14,24)])
-                try:
-                    pygame.image.save(f, flame_path)
-                except Exception:
-                    pass
-                self.flame_sprite = f
+            self.sprite = ASSETS.image("jet.png", generate_jet)
+            self.flame_sprite = ASSETS.image("jet_flame.png", generate_flame)
         except Exception:
             # if anything fails, leave sprite None and fall back to polygon drawing
             self.sprite = None
@@ -91,43 +71,68 @@ class Player(Entity):
         if self.fire_cooldown > 0.0:
             self.fire_cooldown -= dt
 
-    def draw(self, surf: pygame.Surface):
-        # If we have a sprite, draw it centered. Otherwise draw the polygon fallback.
-        if self.sprite:
-            # scale sprite to player's w/h while preserving aspect
-            img = self.sprite
-            # target width ~ self.w*1.4, target height ~ self.h*2
-            target_w = int(self.w * 1.4)
-            target_h = int(self.h * 2.0)
-            if img.get_width() != target_w or img.get_height() != target_h:
-                img = pygame.transform.smoothscale(self.sprite, (target_w, target_h))
-            rect = img.get_rect(center=(int(self.x), int(self.y)))
-            # draw engine flame behind the jet
-            if self.flame_sprite:
-                # flame intensity tied to fire cooldown (when firing cooldown small -> showing flame)
-                intensity = 1.0 if self.fire_cooldown > 0.0 else 0.6
-                # scale flame
-                fimg = pygame.transform.smoothscale(self.flame_sprite, (int(target_w*0.3), int(target_h*0.5)))
-                # position flame slightly below center
-                frect = fimg.get_rect(center=(int(self.x), int(self.y + self.h*0.6)))
+    def _prepare_sprites(self):
+        """Scale the jet and build both flame intensity variants for the current w/h."""
+        # target width ~ self.w*1.4, target height ~ self.h*2
+        target_w = int(self.w * 1.4)
+        target_h = int(self.h * 2.0)
+        img = self.sprite
+        if img.get_width() != target_w or img.get_height() != target_h:
+            img = pygame.transform.smoothscale(self.sprite, (target_w, target_h))
+        self._jet_img = img
+        self._flame_imgs = {}
+        if self.flame_sprite:
+            fimg = pygame.transform.smoothscale(self.flame_sprite, (int(target_w*0.3), int(target_h*0.5)))
+            for intensity in self.FLAME_INTENSITIES:
                 # modulate alpha by intensity
                 tmp = fimg.copy()
                 try:
-                    # create per-surface alpha by filling a transparent surface
                     tmp.fill((255,255,255,int(255*intensity)), special_flags=pygame.BLEND_RGBA_MULT)
                 except Exception:
                     pass
-                surf.blit(tmp, frect)
-            surf.blit(img, rect)
+                self._flame_imgs[intensity] = tmp
+        self._sprites_for = (self.w, self.h)
+
+    def blit_items(self):
+        """(surface, position) of the flame and the jet, back to front."""
+        if not self.sprite:
+            # polygon fallback, pre-rendered once
+            if self._jet_img is None:
+                w, h = int(self.w), int(self.h)
+                self._jet_img = pygame.Surface((w + 1, h + 1), flags=pygame.SRCALPHA)
+                pygame.draw.polygon(self._jet_img, cfg.COLOR_PLAYER, [(w/2, 0), (0, h), (w, h)])
+            return [(self._jet_img, (int(self.x - self.w/2), int(self.y - self.h/2)))]
+        # scaled images are rebuilt only when w/h change
+        if self._sprites_for != (self.w, self.h):
+            self._prepare_sprites()
+        img = self._jet_img
+        items = []
+        # draw engine flame behind the jet
+        if self._flame_imgs:
+            # flame intensity tied to fire cooldown (when firing cooldown small -> showing flame)
+            intensity = self.FLAME_INTENSITIES[0] if self.fire_cooldown > 0.0 else self.FLAME_INTENSITIES[1]
+            fimg = self._flame_imgs[intensity]
+            # position flame slightly below center
+            items.append((fimg, (int(self.x) - fimg.get_width()//2, int(self.y + self.h*0.6) - fimg.get_height()//2)))
+        items.append((img, (int(self.x) - img.get_width()//2, int(self.y) - img.get_height()//2)))
+        return items
+
+    def draw(self, surf: pygame.Surface):
+        # If we have a sprite, draw it centered. Otherwise draw the polygon fallback.
+        if self.sprite:
+            rects = [surf.blit(img, pos) for img, pos in self.blit_items()]
+            return rects[0].unionall(rects[1:])
         else:
-            pygame.draw.polygon(surf, cfg.COLOR_PLAYER, [
+            return pygame.draw.polygon(surf, cfg.COLOR_PLAYER, [
                 (self.x, self.y - self.h/2),
                 (self.x - self.w/2, self.y + self.h/2),
                 (self.x + self.w/2, self.y + self.h/2),
             ])
 
 
-class Bullet(Entity):
+class Bullet(StoreView, Entity):
+    __slots__ = StoreView.SLOTS + ("owner",)
+
     def __init__(self, x, y, vy, owner: str = "player"):
         super().__init__(x, y, 6, 12)
         self.vy = vy
@@ -136,14 +141,33 @@ class Bullet(Entity):
     def update(self, dt: float):
         self.y += self.vy * dt
 
+    def blit_item(self):
+        # a pre-filled rectangle sprite; same pixels as pygame.draw.rect over self.rect()
+        w, h = int(self.w), int(self.h)
+        img = _BULLET_SPRITES.get((w, h))
+        if img is None:
+            img = _BULLET_SPRITES[(w, h)] = _solid_sprite(w, h, cfg.COLOR_BULLET)
+        return img, (int(self.x - self.w/2), int(self.y - self.h/2))
+
     def draw(self, surf: pygame.Surface):
-        color = cfg.COLOR_BULLET
-        pygame.draw.rect(surf, color, self.rect())
+        return surf.blit(*self.blit_item())
+
+
+_BULLET_SPRITES = {}
+
 
+def _solid_sprite(w: int, h: int, color) -> pygame.Surface:
+    img = pygame.Surface((w, h))
+    img.fill(color)
+    if pygame.display.get_surface() is not None:
+        img = img.convert()
+    return img
 
-class Scenery(Entity):
-    def __init__(self, x, y, w, h, vy, kind: str = None, palette=None, depth: float = 1.0, alpha: int = 255):
+
+class Scenery(StoreView, Entity):
+    def __init__(self, x, y, w, h, vy, kind: str = None, palette=None, depth: float = 1.0, alpha: int = 255, rng=None):
         super().__init__(x, y, w, h)
+        rng = rng or random
         self.vy = vy
         self.kind = kind
         self.palette = palette
@@ -155,15 +179,15 @@ class Scenery(Entity):
         if self.palette is None:
             if self.kind == "planet":
                 # (fill, ring, highlight)
-                self.palette = ( (random.randint(80,230), random.randint(80,230), random.randint(80,230)),
-                                 (random.randint(20,120), random.randint(20,120), random.randint(20,120)),
+                self.palette = ( (rng.randint(80,230), rng.randint(80,230), rng.randint(80,230)),
+                                 (rng.randint(20,120), rng.randint(20,120), rng.randint(20,120)),
                                  (255,255,255) )
             elif self.kind == "comet":
                 self.palette = ( (240,240,200), (200,200,180), (255,255,220) )
             elif self.kind == "nebula":
                 # nebula palette: two colors and optional highlight
-                self.palette = ( (random.randint(40,160), random.randint(40,160), random.randint(80,200)),
-                                 (random.randint(60,200), random.randint(60,200), random.randint(60,200)),
+                self.palette = ( (rng.randint(40,160), rng.randint(40,160), rng.randint(80,200)),
+                                 (rng.randint(60,200), rng.randint(60,200), rng.randint(60,200)),
                                  (200,200,255) )
             else:
                 # default star colors
@@ -173,74 +197,149 @@ class Scenery(Entity):
         self.y += self.vy * dt
         self.age += dt
 
-    def draw(self, surf: pygame.Surface):
-        # draw various space objects based on kind onto a temporary surface, then blit with alpha
-        rect = self.rect()
-        # prepare a temporary surface slightly larger to accommodate tails/highlights
-        tmp_w = max(4, int(rect.w * 2))
-        tmp_h = max(4, int(rect.h * 2))
-        tmp = pygame.Surface((tmp_w, tmp_h), flags=pygame.SRCALPHA)
-        center_x = tmp_w // 2
-        center_y = tmp_h // 2
-        ox = center_x - int(self.w/2)
-        oy = center_y - int(self.h/2)
-
+    def blit_item(self, opaque: bool = False):
+        # one blit of a cached pre-rendered surface; sizes are quantized to whole pixels.
+        # opaque serves the sprite pre-blended against the background (cheaper, no translucency)
+        frame = 0
         if self.kind == "star":
-            # simple twinkling point: draw a small circle and cross
-            r = max(1, int(min(self.w, self.h)/2))
-            intensity = 180 + int(75 * (0.5 + 0.5 * math.sin(self.age * 6 + self.x)))
-            col = (int(min(255, intensity)),) * 3
-            pygame.draw.circle(tmp, col + (self.alpha,), (center_x, center_y), r)
-            # small sparkle lines
-            pygame.draw.line(tmp, col + (self.alpha,), (center_x-r-1, center_y), (center_x+r+1, center_y), 1)
-            pygame.draw.line(tmp, col + (self.alpha,), (center_x, center_y-r-1), (center_x, center_y+r+1), 1)
-
-        elif self.kind == "planet":
-            fill, ring, highlight = self.palette
-            # draw planet on tmp
-            pygame.draw.circle(tmp, ring + (self.alpha,), (center_x, center_y), int(self.w/2)+3)
-            pygame.draw.circle(tmp, fill + (self.alpha,), (center_x, center_y), int(self.w/2))
-            # simple band (darker)
-            band_h = int(self.h * 0.18)
-            band_rect = pygame.Rect(center_x - int(self.w*0.6), center_y - band_h//2, int(self.w*1.2), band_h)
-            band_col = tuple(max(0, c-30) for c in fill)
-            pygame.draw.ellipse(tmp, band_col + (self.alpha,), band_rect)
-            # highlight
-            pygame.draw.circle(tmp, highlight + (self.alpha,), (int(center_x - self.w*0.25), int(center_y - self.h*0.25)), max(2, int(self.w*0.08)))
-
-        elif self.kind == "comet":
-            head_col, tail_col, _ = self.palette
-            # draw head on tmp
-            pygame.draw.ellipse(tmp, head_col + (self.alpha,), pygame.Rect(ox, oy, int(self.w), int(self.h)))
-            # tail: fading triangles drawn on tmp to the left
-            tail_len = int(self.w * 3)
-            tail_points = [ (ox, center_y), (ox - tail_len, center_y - int(self.h*0.6)), (ox - tail_len, center_y + int(self.h*0.6)) ]
-            pygame.draw.polygon(tmp, tail_col + (max(10, int(self.alpha*0.6)),), tail_points)
-
-        elif self.kind == "nebula":
-            # nebula: draw several translucent ellipses on tmp
-            for i in range(4):
-                rx = center_x - int(self.w/2) + int(random.uniform(0, self.w))
-                ry = center_y - int(self.h/2) + int(random.uniform(0, self.h))
-                rw = max(2, int(self.w * (0.6 + 0.6 * ((i+1)/4))))
-                rh = max(2, int(self.h * (0.6 + 0.6 * ((4-i)/4))))
-                color = c1 if i % 2 == 0 else c2
-                alpha_i = max(10, min(200, int(self.alpha * (0.4 + i*0.2))))
-                pygame.draw.ellipse(tmp, (color[0], color[1], color[2], alpha_i), pygame.Rect(rx - rw//2, ry - rh//2, rw, rh))
+            # twinkle is served from a few cached intensity frames
+            phase = 0.5 + 0.5 * math.sin(self.age * 6 + self.x)
+            frame = int(round(phase * (cfg.STAR_TWINKLE_FRAMES - 1)))
+        key = (self.kind, int(self.w), int(self.h), self.palette, self.alpha, frame)
+        img = OPAQUE_SCENERY_CACHE.get(key, _render_opaque_scenery) if opaque else SCENERY_CACHE.get(key, _render_scenery)
+        return img, (int(self.x - img.get_width() // 2), int(self.y - img.get_height() // 2))
 
-        else:
-            # fallback: rectangle scenic stripe on tmp
-            pygame.draw.rect(tmp, cfg.COLOR_SCENERY + (self.alpha,), pygame.Rect(ox, oy, int(self.w), int(self.h)))
-
-        # finally blit temporary surface to main surface at rect center
-        blit_x = int(self.x - tmp_w // 2)
-        blit_y = int(self.y - tmp_h // 2)
-        surf.blit(tmp, (blit_x, blit_y))
+    def draw(self, surf: pygame.Surface):
+        return surf.blit(*self.blit_item())
+
+
+# shared by every Scenery instance; Scenery.cache.stats() exposes hit/miss counters
+SCENERY_CACHE = SurfaceCache(cfg.SCENERY_CACHE_SIZE)
+Scenery.cache = SCENERY_CACHE
+# the same sprites flattened for low quality tiers
+OPAQUE_SCENERY_CACHE = SurfaceCache(cfg.SCENERY_CACHE_SIZE)
+_OPAQUE_KEY = (255, 0, 255)  # colour key of flattened sprites
+
+
+def _render_opaque_scenery(key) -> pygame.Surface:
+    """The scenery sprite for key blended onto the background colour, colour-keyed where it was transparent."""
+    img = SCENERY_CACHE.get(key, _render_scenery)
+    flat = pygame.Surface(img.get_size())
+    flat.fill(cfg.COLOR_BG)
+    flat.blit(img, (0, 0))
+    rgb = pygame.surfarray.pixels3d(flat)
+    rgb[pygame.surfarray.array_alpha(img) == 0] = _OPAQUE_KEY
+    del rgb
+    flat.set_colorkey(_OPAQUE_KEY, pygame.RLEACCEL)
+    return flat
+
+
+def _render_scenery(key) -> pygame.Surface:
+    """Render a scenery object described by a SCENERY_CACHE key onto a new SRCALPHA surface."""
+    kind, w, h, palette, alpha, frame = key
+    # temporary surface slightly larger to accommodate tails/highlights
+    tmp_w = max(4, w * 2)
+    tmp_h = max(4, h * 2)
+    tmp = pygame.Surface((tmp_w, tmp_h), flags=pygame.SRCALPHA)
+    center_x = tmp_w // 2
+    center_y = tmp_h // 2
+    ox = center_x - w // 2
+    oy = center_y - h // 2
+
+    if kind == "star":
+        # simple twinkling point: draw a small circle and cross
+        r = max(1, int(min(w, h)/2))
+        steps = max(1, cfg.STAR_TWINKLE_FRAMES - 1)
+        intensity = 180 + int(75 * frame / steps)
+        col = (int(min(255, intensity)),) * 3
+        pygame.draw.circle(tmp, col + (alpha,), (center_x, center_y), r)
+        # small sparkle lines
+        pygame.draw.line(tmp, col + (alpha,), (center_x-r-1, center_y), (center_x+r+1, center_y), 1)
+        pygame.draw.line(tmp, col + (alpha,), (center_x, center_y-r-1), (center_x, center_y+r+1), 1)
+
+    elif kind == "planet":
+        fill, ring, highlight = palette
+        pygame.draw.circle(tmp, ring + (alpha,), (center_x, center_y), int(w/2)+3)
+        pygame.draw.circle(tmp, fill + (alpha,), (center_x, center_y), int(w/2))
+        # simple band (darker)
+        band_h = int(h * 0.18)
+        band_rect = pygame.Rect(center_x - int(w*0.6), center_y - band_h//2, int(w*1.2), band_h)
+        band_col = tuple(max(0, c-30) for c in fill)
+        pygame.draw.ellipse(tmp, band_col + (alpha,), band_rect)
+        # highlight
+        pygame.draw.circle(tmp, highlight + (alpha,), (int(center_x - w*0.25), int(center_y - h*0.25)), max(2, int(w*0.08)))
+
+    elif kind == "comet":
+        head_col, tail_col, _ = palette
+        pygame.draw.ellipse(tmp, head_col + (alpha,), pygame.Rect(ox, oy, w, h))
+        # tail: fading triangle to the left
+        tail_len = int(w * 3)
+        tail_points = [(ox, center_y), (ox - tail_len, center_y - int(h*0.6)), (ox - tail_len, center_y + int(h*0.6))]
+        pygame.draw.polygon(tmp, tail_col + (max(10, int(alpha*0.6)),), tail_points)
+
+    elif kind == "nebula":
+        # nebula: a soft noise texture, generated once per cache key with a key-derived seed
+        return _render_nebula(tmp_w, tmp_h, palette, alpha, zlib.crc32(repr(key).encode()))
+
+    else:
+        # fallback: rectangle scenic stripe
+        pygame.draw.rect(tmp, cfg.COLOR_SCENERY + (alpha,), pygame.Rect(ox, oy, w, h))
+
+    return tmp
+
+
+def _value_noise(rng: np.random.Generator, w: int, h: int, octaves: int) -> np.ndarray:
+    """Smooth fractal value noise in [0, 1] of shape (w, h): octaves of smoothstep-interpolated lattices."""
+    out = np.zeros((w, h))
+    amp = 1.0
+    total = 0.0
+    for o in range(octaves):
+        cells = 2 ** (o + 2)
+        grid = rng.random((cells + 1, cells + 1))
+        fx = np.linspace(0, cells, w, endpoint=False)
+        fy = np.linspace(0, cells, h, endpoint=False)
+        x0 = fx.astype(np.int64)
+        y0 = fy.astype(np.int64)
+        tx = fx - x0
+        ty = fy - y0
+        tx = (tx * tx * (3 - 2 * tx))[:, None]
+        ty = (ty * ty * (3 - 2 * ty))[None, :]
+        top = grid[np.ix_(x0, y0)] * (1 - ty) + grid[np.ix_(x0, y0 + 1)] * ty
+        bottom = grid[np.ix_(x0 + 1, y0)] * (1 - ty) + grid[np.ix_(x0 + 1, y0 + 1)] * ty
+        out += amp * (top * (1 - tx) + bottom * tx)
+        total += amp
+        amp *= 0.5
+    return out / total
+
+
+def _render_nebula(w: int, h: int, palette, alpha: int, seed: int) -> pygame.Surface:
+    """A w x h RGBA nebula: noise density blended between the first two palette colours,
+    faded out towards an elliptical edge, built with array operations into surfarray views."""
+    rng = np.random.default_rng(seed)
+    density = _value_noise(rng, w, h, cfg.NEBULA_NOISE_OCTAVES)
+    mix = _value_noise(rng, w, h, cfg.NEBULA_NOISE_OCTAVES)
+    u = (np.arange(w) + 0.5) / w * 2 - 1
+    v = (np.arange(h) + 0.5) / h * 2 - 1
+    falloff = np.clip(1 - (u[:, None] ** 2 + v[None, :] ** 2), 0, 1) ** 1.5
+    a = np.clip(density * 1.6 - 0.3, 0, 1) * falloff * alpha
+    c1 = np.array(palette[0], dtype=np.float64)
+    c2 = np.array(palette[1], dtype=np.float64)
+    rgb = c1 + (c2 - c1) * mix[..., None]
+    surf = pygame.Surface((w, h), flags=pygame.SRCALPHA)
+    pixels = pygame.surfarray.pixels3d(surf)
+    pixels[...] = rgb.astype(np.uint8)
+    del pixels
+    alphas = pygame.surfarray.pixels_alpha(surf)
+    alphas[...] = a.astype(np.uint8)
+    del alphas
+    return surf
 
 
 class Obstacle(Entity):
-    def __init__(self, x, y, size, vy, damage=1):
+    def __init__(self, x, y, size, vy, damage=1, rng=None):
         super().__init__(x, y, size, size)
+        # random stream for appearance and fragments; the global one unless a game provides its own
+        self._rng = rng or random
         self.vy = vy
         # collision damage to player on contact
         self.damage = damage
@@ -249,163 +348,316 @@ class Obstacle(Entity):
         self.hp = self.max_hp
         # pick asteroid palette (body, outline)
         try:
-            self.asteroid_palette = random.choice(cfg.ASTEROID_PALETTES)
+            self.asteroid_palette = self._rng.choice(cfg.ASTEROID_PALETTES)
         except Exception:
             self.asteroid_palette = ((120,120,120),(80,80,80))
         # random seed for consistent-looking craters
-        self.seed = random.random()
+        self.seed = self._rng.random()
+        # pre-rendered asteroid surface, fetched from ASTEROID_CACHE on first draw
+        self._img = None
 
     def update(self, dt: float):
         self.y += self.vy * dt
 
+    def blit_item(self):
+        # the asteroid never changes shape, so its surface is fetched once and only blitted after that
+        if self._img is None:
+            bucket = min(cfg.ASTEROID_SEED_BUCKETS - 1, int(self.seed * cfg.ASTEROID_SEED_BUCKETS))
+            self._img = ASTEROID_CACHE.get((int(self.w), int(self.h), self.asteroid_palette, bucket), _render_asteroid)
+        return self._img, (int(self.x - self.w/2) - ASTEROID_MARGIN, int(self.y - self.h/2) - ASTEROID_MARGIN)
+
     def draw(self, surf: pygame.Surface):
-        # Draw an asteroid-like rock with some craters and an outline.
-        rect = self.rect()
-        body_col, outline_col = self.asteroid_palette
-        # outline
-        pygame.draw.ellipse(surf, outline_col, rect.inflate(4,4))
-        # body
-        pygame.draw.ellipse(surf, body_col, rect)
-
-        # draw 2-4 craters as darker ellipses
-        crater_count = 2 + int(self.seed * 3)
-        for i in range(crater_count):
-            cx = rect.x + int((0.15 + ((self.seed + i*0.23) % 0.7)) * rect.w)
-            cy = rect.y + int((0.2 + ((self.seed * 1.3 + i*0.17) % 0.6)) * rect.h)
-            cw = int(rect.w * (0.15 + ((self.seed + i*0.17) % 0.25)))
-            ch = int(rect.h * (0.12 + ((self.seed + i*0.11) % 0.2)))
-            crater_rect = pygame.Rect(cx, cy, cw, ch)
-            pygame.draw.ellipse(surf, tuple(max(0,c-30) for c in body_col), crater_rect)
-            pygame.draw.ellipse(surf, tuple(max(0,c-10) for c in outline_col), crater_rect.inflate(2,2), 1)
-
-    def explode(self):
-        """Return a list of Debris fragments spawned when this obstacle is destroyed."""
-        pieces = []
+        return surf.blit(*self.blit_item())
+
+    def _fragments(self):
+        """Yield (x, y, w, h, vx, vy, lifetime) for each fragment of this obstacle's explosion."""
+        rng = self._rng
         frag_count = 3 + int(self.max_hp)
         for i in range(frag_count):
             # small random sizes
-            fw = max(4, int(self.w * random.uniform(0.12, 0.28)))
-            fh = max(3, int(self.h * random.uniform(0.08, 0.22)))
-            fx = self.x + random.uniform(-self.w*0.3, self.w*0.3)
-            fy = self.y + random.uniform(-self.h*0.1, self.h*0.3)
+            fw = max(4, int(self.w * rng.uniform(0.12, 0.28)))
+            fh = max(3, int(self.h * rng.uniform(0.08, 0.22)))
+            fx = self.x + rng.uniform(-self.w*0.3, self.w*0.3)
+            fy = self.y + rng.uniform(-self.h*0.1, self.h*0.3)
             # velocity shards scatter outward and downward
-            vx = random.uniform(-80, 80)
-            vy = random.uniform(self.vy*0.3, self.vy*1.2)
-            life = 0.8 + random.random()*1.2
-            pieces.append(Debris(fx, fy, fw, fh, vx, vy, life, color=self.asteroid_palette[0]))
-        return pieces
-
-
-class Debris(Entity):
-    def __init__(self, x, y, w, h, vx, vy, lifetime=1.0, color=(120,120,120)):
-        super().__init__(x, y, w, h)
-        self.vx = vx
-        self.vy = vy
-        self.lifetime = lifetime
-        self.color = color
-
-    def update(self, dt: float):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.lifetime -= dt
-
-    def draw(self, surf: pygame.Surface):
-        # small rotated rectangle/ellipse to represent fragment
-        r = self.rect()
-        pygame.draw.ellipse(surf, self.color, r)
-
-
-class Enemy(Entity):
-    def __init__(self, x, y, w, h, vy, pattern: str = "straight", can_fire: bool = False, hp: int = 1):
+            vx = rng.uniform(-80, 80)
+            vy = rng.uniform(self.vy*0.3, self.vy*1.2)
+            life = 0.8 + rng.random()*1.2
+            yield fx, fy, fw, fh, vx, vy, life
+
+    def explode_into(self, emitter):
+        """Emit this obstacle's explosion fragments into a ParticleEmitter in one batch."""
+        frags = list(self._fragments())
+        if frags:
+            emitter.emit(*zip(*frags), color=self.asteroid_palette[0])
+
+
+def _draw_asteroid(surf: pygame.Surface, rect: pygame.Rect, palette, seed: float):
+    """Draw an asteroid-like rock with some craters and an outline into rect."""
+    body_col, outline_col = palette
+    # outline
+    pygame.draw.ellipse(surf, outline_col, rect.inflate(4,4))
+    # body
+    pygame.draw.ellipse(surf, body_col, rect)
+
+    # draw 2-4 craters as darker ellipses
+    crater_count = 2 + int(seed * 3)
+    for i in range(crater_count):
+        cx = rect.x + int((0.15 + ((seed + i*0.23) % 0.7)) * rect.w)
+        cy = rect.y + int((0.2 + ((seed * 1.3 + i*0.17) % 0.6)) * rect.h)
+        cw = int(rect.w * (0.15 + ((seed + i*0.17) % 0.25)))
+        ch = int(rect.h * (0.12 + ((seed + i*0.11) % 0.2)))
+        crater_rect = pygame.Rect(cx, cy, cw, ch)
+        pygame.draw.ellipse(surf, tuple(max(0,c-30) for c in body_col), crater_rect)
+        pygame.draw.ellipse(surf, tuple(max(0,c-10) for c in outline_col), crater_rect.inflate(2,2), 1)
+
+
+# room around the body rect for the outline; craters can also spill past the right/bottom edge
+ASTEROID_MARGIN = 3
+ASTEROID_CACHE = SurfaceCache(cfg.ASTEROID_CACHE_SIZE)
+
+
+def _render_asteroid(key) -> pygame.Surface:
+    """Render an asteroid described by an ASTEROID_CACHE key; the body rect sits at ASTEROID_MARGIN."""
+    w, h, palette, bucket = key
+    seed = bucket / cfg.ASTEROID_SEED_BUCKETS
+    tmp = pygame.Surface((int(w * 1.3) + 2 * ASTEROID_MARGIN + 2, int(h * 1.15) + 2 * ASTEROID_MARGIN + 2),
+                         flags=pygame.SRCALPHA)
+    _draw_asteroid(tmp, pygame.Rect(ASTEROID_MARGIN, ASTEROID_MARGIN, w, h), palette, seed)
+    return tmp
+
+
+class Enemy(StoreView, Entity):
+    # enemies also keep their fire cooldown in the store, for batched updates in EnemyStore
+    FIELDS = StoreView.FIELDS + ("fire_cd",)
+    DEFAULTS = dict(StoreView.DEFAULTS, fire_cd=0.0)
+    fire_cd = StoreField()
+
+    def __init__(self, x, y, w, h, vy, pattern: str = "straight", can_fire: bool = False, hp: int = 1, rng=None):
         super().__init__(x, y, w, h)
+        self._rng = rng or random
         self.vy = vy
         self.pattern = pattern
         self.can_fire = can_fire
         self.hp = hp
         self.age = 0.0
-        self.fire_cd = random.uniform(0.5, 2.0)
+        self.fire_cd = self._rng.uniform(0.5, 2.0)
         # pick a random color palette for this enemy (body, eye, pupil, mouth, outline)
         try:
-            self.palette = random.choice(cfg.ENEMY_PALETTES)
+            self.palette = self._rng.choice(cfg.ENEMY_PALETTES)
         except Exception:
             # fallback to legacy colors
             self.palette = (cfg.COLOR_ENEMY_BODY, cfg.COLOR_ENEMY_EYE, cfg.COLOR_ENEMY_PUPIL, cfg.COLOR_ENEMY_MOUTH, cfg.COLOR_ENEMY_OUTLINE)
 
     def update(self, dt: float):
         self.age += dt
-        # patterns: straight, sine, zigzag
+        # patterns: straight, sine, zigzag; vx keeps the current horizontal speed
         if self.pattern == "straight":
+            self.vx = 0.0
             self.y += self.vy * dt
         elif self.pattern == "sine":
+            self.vx = math.sin(self.age * 3.0) * 60.0
             self.y += self.vy * dt
-            self.x += math.sin(self.age * 3.0) * 60.0 * dt
+            self.x += self.vx * dt
         elif self.pattern == "zigzag":
+            self.vx = (1 if int(self.age * 2) % 2 == 0 else -1) * 80.0
             self.y += self.vy * dt
-            self.x += (1 if int(self.age * 2) % 2 == 0 else -1) * 80.0 * dt
+            self.x += self.vx * dt
 
         if self.can_fire:
             self.fire_cd -= dt
 
-    def try_fire(self):
+    def try_fire(self, pool=None):
         if not self.can_fire:
             return None
         if self.fire_cd <= 0.0:
-            self.fire_cd = random.uniform(0.6, 2.5)
-            return Bullet(self.x, self.y + self.h/2 + 6, cfg.ENEMY_BULLET_SPEED, owner="enemy")
+            self.fire_cd = self._rng.uniform(0.6, 2.5)
+            make = Bullet if pool is None else pool.acquire
+            return make(self.x, self.y + self.h/2 + 6, cfg.ENEMY_BULLET_SPEED, owner="enemy")
         return None
 
+    def blit_item(self, animate: bool = True):
+        # the pre-rendered atlas frame for this palette, quantized size and tentacle phase
+        # (always the first phase when not animated)
+        img, (ax, ay) = ENEMY_ATLAS.frame(self.palette, self.w, self.h, self.age if animate else 0.0)
+        return img, (int(self.x) - ax, int(self.y) - ay)
+
     def draw(self, surf: pygame.Surface):
-        # Draw a simple 'space monster' instead of a plain rectangle.
-        # Body
-        rect = self.rect()
-        body_w = rect.w
-        body_h = rect.h
-        body_rect = pygame.Rect(rect.x, rect.y, body_w, body_h)
-        # Outline
-        outline_col = self.palette[4]
-        body_col = self.palette[0]
-        eye_col = self.palette[1]
-        pupil_col = self.palette[2]
-        mouth_col = self.palette[3]
-        pygame.draw.ellipse(surf, outline_col, body_rect.inflate(4, 4))
-        # Body fill
-        pygame.draw.ellipse(surf, body_col, body_rect)
-
-        # Eyes (1 or 2 depending on width)
-        eye_count = 1 if body_w < 34 else 2
-        for i in range(eye_count):
-            ex = self.x - body_w*0.2 + (i * (body_w*0.4) if eye_count == 2 else 0)
-            ey = self.y - body_h*0.18
-            eye_r = max(3, int(min(body_w, body_h) * 0.12))
-            pygame.draw.circle(surf, eye_col, (int(ex), int(ey)), eye_r)
-            pygame.draw.circle(surf, pupil_col, (int(ex), int(ey)), max(1, eye_r//2))
-
-        # Mouth
-        mouth_w = int(body_w * 0.5)
-        mouth_h = int(body_h * 0.18)
-        mouth_rect = pygame.Rect(int(self.x - mouth_w/2), int(self.y + body_h*0.12), mouth_w, mouth_h)
-        pygame.draw.ellipse(surf, mouth_col, mouth_rect)
-
-        # Simple teeth lines
-        tx = mouth_rect.x
-        for i in range(4):
-            sx = tx + int((i+1) * mouth_rect.w / 5)
-            pygame.draw.line(surf, outline_col, (sx, mouth_rect.y), (sx, mouth_rect.y + mouth_rect.h//2), 1)
-
-        # Tentacles: draw 3 curved lines below the body
-        for i in range(3):
-            start_x = int(self.x - body_w*0.35 + i*(body_w*0.35))
-            start_y = int(self.y + body_h/2)
-            # draw simple segmented tentacle
-            points = []
-            segs = 5
-            for s in range(segs):
-                px = start_x + int(math.sin(self.age*2 + i + s*0.6) * (6 + s*2))
-                py = start_y + s * int(body_h*0.18)
-                points.append((px, py))
-            if len(points) > 1:
-                pygame.draw.lines(surf, outline_col, False, points, 2)
+        return surf.blit(*self.blit_item())
 
     def hit(self, dmg: int = 1):
         self.hp -= dmg
         return self.hp <= 0
+
+
+# movement pattern codes kept in EnemyStore's "pattern" column; unknown patterns don't move
+ENEMY_PATTERNS = ("straight", "sine", "zigzag")
+_PATTERN_CODES = {name: i for i, name in enumerate(ENEMY_PATTERNS)}
+_STRAIGHT, _SINE, _ZIGZAG = range(len(ENEMY_PATTERNS))
+
+
+class EnemyStore(EntityStore):
+    """EntityStore for enemies whose step() is the batched equivalent of Enemy.update.
+
+    Enemies are grouped by movement pattern through a store-only "pattern" column (and an
+    "armed" column for can_fire), so each group advances with a few array operations.
+    step() returns the enemies whose fire cooldown has run out, in store order.
+    """
+    FIELDS = Enemy.FIELDS
+    DEFAULTS = dict(Enemy.DEFAULTS, pattern=-1.0, armed=0.0)
+
+    def append(self, item):
+        super().append(item)
+        n = item._slot
+        self.cols["pattern"][n] = _PATTERN_CODES.get(item.pattern, -1)
+        self.cols["armed"][n] = 1.0 if item.can_fire else 0.0
+
+    def step(self, dt: float) -> List["Enemy"]:
+        n = len(self.items)
+        if not n:
+            return []
+        c = self.cols
+        age = c["age"][:n]
+        age += dt
+        pattern = c["pattern"][:n]
+        vx = c["vx"][:n]
+        vx.fill(0.0)
+        # groups that are absent cost one any() each; a typical wave holds only a few enemies
+        sine = pattern == _SINE
+        if sine.any():
+            vx[sine] = np.sin(age[sine] * 3.0) * 60.0
+        zigzag = pattern == _ZIGZAG
+        if zigzag.any():
+            vx[zigzag] = np.where(np.floor(age[zigzag] * 2) % 2 == 0, 80.0, -80.0)
+        c["x"][:n] += vx * dt
+        moving = pattern >= 0
+        if moving.all():
+            c["y"][:n] += c["vy"][:n] * dt
+        else:
+            c["y"][:n] += np.where(moving, c["vy"][:n] * dt, 0.0)
+        armed = c["armed"][:n] > 0
+        cd = c["fire_cd"][:n]
+        np.subtract(cd, dt, out=cd, where=armed)
+        ready = np.flatnonzero(armed & (cd <= 0.0))
+        if not ready.size:
+            return []
+        items = self.items
+        return [items[i] for i in ready.tolist()]
+
+
+def _draw_enemy(surf: pygame.Surface, x, y, w, h, palette, age):
+    """Draw a simple 'space monster' centred on (x, y) with primitives."""
+    # Body
+    rect = pygame.Rect(int(x - w/2), int(y - h/2), int(w), int(h))
+    body_w = rect.w
+    body_h = rect.h
+    body_rect = pygame.Rect(rect.x, rect.y, body_w, body_h)
+    # Outline
+    outline_col = palette[4]
+    body_col = palette[0]
+    eye_col = palette[1]
+    pupil_col = palette[2]
+    mouth_col = palette[3]
+    pygame.draw.ellipse(surf, outline_col, body_rect.inflate(4, 4))
+    # Body fill
+    pygame.draw.ellipse(surf, body_col, body_rect)
+
+    # Eyes (1 or 2 depending on width)
+    eye_count = 1 if body_w < 34 else 2
+    for i in range(eye_count):
+        ex = x - body_w*0.2 + (i * (body_w*0.4) if eye_count == 2 else 0)
+        ey = y - body_h*0.18
+        eye_r = max(3, int(min(body_w, body_h) * 0.12))
+        pygame.draw.circle(surf, eye_col, (int(ex), int(ey)), eye_r)
+        pygame.draw.circle(surf, pupil_col, (int(ex), int(ey)), max(1, eye_r//2))
+
+    # Mouth
+    mouth_w = int(body_w * 0.5)
+    mouth_h = int(body_h * 0.18)
+    mouth_rect = pygame.Rect(int(x - mouth_w/2), int(y + body_h*0.12), mouth_w, mouth_h)
+    pygame.draw.ellipse(surf, mouth_col, mouth_rect)
+
+    # Simple teeth lines
+    tx = mouth_rect.x
+    for i in range(4):
+        sx = tx + int((i+1) * mouth_rect.w / 5)
+        pygame.draw.line(surf, outline_col, (sx, mouth_rect.y), (sx, mouth_rect.y + mouth_rect.h//2), 1)
+
+    # Tentacles: draw 3 curved lines below the body
+    for i in range(3):
+        start_x = int(x - body_w*0.35 + i*(body_w*0.35))
+        start_y = int(y + body_h/2)
+        # draw simple segmented tentacle
+        points = []
+        segs = 5
+        for s in range(segs):
+            px = start_x + int(math.sin(age*2 + i + s*0.6) * (6 + s*2))
+            py = start_y + s * int(body_h*0.18)
+            points.append((px, py))
+        if len(points) > 1:
+            pygame.draw.lines(surf, outline_col, False, points, 2)
+
+
+def _enemy_extent(w, h):
+    """Half-width, height above centre and height below centre covered by _draw_enemy."""
+    # tentacles start at +-0.35w and swing up to 14px sideways; outline adds 2px around the body
+    half_w = max(w/2 + 2, w*0.35 + 16)
+    above = h/2 + 3
+    below = h/2 + 4 * int(h*0.18) + 3
+    return int(math.ceil(half_w)), int(math.ceil(above)), int(math.ceil(below))
+
+
+def _render_enemy_frame(key, age) -> Tuple[pygame.Surface, Tuple[int, int]]:
+    """Render one enemy animation frame; returns the surface and the anchor of the enemy centre."""
+    palette, w, h = key
+    half_w, above, below = _enemy_extent(w, h)
+    tmp = pygame.Surface((half_w*2, above + below), flags=pygame.SRCALPHA)
+    _draw_enemy(tmp, half_w, above, w, h, palette, age)
+    return tmp, (half_w, above)
+
+
+class EnemyAtlas:
+    """Pre-rendered enemy frames per palette and quantized size, one per tentacle phase."""
+
+    # tentacles move with sin(age*2 + ...), so the animation repeats every pi seconds
+    PERIOD = math.pi
+
+    def __init__(self, size_step: int = cfg.ENEMY_ATLAS_SIZE_STEP, phases: int = cfg.ENEMY_ATLAS_PHASES):
+        self.size_step = size_step
+        self.phases = phases
+        self.frames = {}
+
+    def quantize(self, v: float) -> int:
+        return max(self.size_step, int(round(v / self.size_step)) * self.size_step)
+
+    def _build(self, key):
+        frames = []
+        for i in range(self.phases):
+            img, anchor = _render_enemy_frame(key, i * self.PERIOD / self.phases)
+            frames.append((to_display_format(img), anchor))
+        self.frames[key] = frames
+        return frames
+
+    def generate(self, palettes=None, widths=(24, 48), heights=(18, 36)):
+        """Pre-render every palette at all quantized sizes within the given ranges."""
+        palettes = cfg.ENEMY_PALETTES if palettes is None else palettes
+        step = self.size_step
+        ws = range(self.quantize(widths[0]), self.quantize(widths[1]) + 1, step)
+        hs = range(self.quantize(heights[0]), self.quantize(heights[1]) + 1, step)
+        for palette in palettes:
+            for w in ws:
+                for h in hs:
+                    key = (palette, w, h)
+                    if key not in self.frames:
+                        self._build(key)
+        return self
+
+    def frame(self, palette, w, h, age):
+        key = (palette, self.quantize(w), self.quantize(h))
+        frames = self.frames.get(key)
+        if frames is None:
+            frames = self._build(key)
+        return frames[int(age / self.PERIOD * self.phases) % self.phases]
+
+
+ENEMY_ATLAS = EnemyAtlas()
@@ -0,0 +1,258 @@
+"""Reset/step environment API for training agents against Jet Runner.
+
+JetRunnerEnv drives one headless Game tick by tick, gym-style:
+
+    env = JetRunnerEnv(obs="features", seed=0)
+    obs, info = env.reset()
+    obs, reward, terminated, truncated, info = env.step(action)
+
+Actions index ACTIONS, the six (dir_x, fire) combinations; a (dir_x, fire) tuple works too.
+Observations are either a compact float32 feature array (see observation_spec) or a
+downsampled RGB frame. Reward is the score gained plus ENV_HEALTH_REWARD per health point
+gained (so being hit is negative).
+
+VectorEnv steps N games spread over worker processes. Actions, observations, rewards and
+done flags live in shared memory; only short commands and small info dicts cross the pipes.
+"""
+import heapq
+import os
+import random
+from multiprocessing.shared_memory import SharedMemory
+
+# imported before pygame, which it keeps quiet in every worker
+from jet_runner.workers import context as workers_context
+
+import numpy as np
+import pygame
+
+import jet_runner.config as cfg
+
+ACTIONS = ((0.0, False), (-1.0, False), (1.0, False), (0.0, True), (-1.0, True), (1.0, True))
+OBSERVATIONS = ("features", "frame")
+# feature rows: the player, then max_entities nearest enemies, obstacles and enemy bullets
+FEATURE_GROUPS = ("enemies", "obstacles", "enemy_bullets")
+FEATURE_COLUMNS = 5  # player: present, x, y, health, fire cooldown; others: present, x, y, vx, vy
+
+
+def observation_spec(obs: str = "features", max_entities: int = cfg.ENV_MAX_ENTITIES,
+                     frame_size=cfg.ENV_FRAME_SIZE):
+    """(shape, dtype) of one observation."""
+    if obs == "features":
+        return (1 + len(FEATURE_GROUPS) * max_entities, FEATURE_COLUMNS), np.float32
+    if obs == "frame":
+        w, h = frame_size
+        return (h, w, 3), np.uint8
+    raise ValueError(f"unknown observation type {obs!r}; choose from {', '.join(OBSERVATIONS)}")
+
+
+class JetRunnerEnv:
+    """One headless game behind a reset/step interface. Extra keyword arguments go to Game.
+
+    reset() and step() write the observation into out when given (e.g. a shared buffer row).
+    """
+
+    def __init__(self, obs: str = "features", seed: int = None, frame_skip: int = 1, max_steps: int = None,
+                 max_entities: int = cfg.ENV_MAX_ENTITIES, frame_size=cfg.ENV_FRAME_SIZE, **game_kwargs):
+        self.obs_type = obs
+        self.observation_shape, self.observation_dtype = observation_spec(obs, max_entities, frame_size)
+        self.frame_skip = frame_skip
+        self.max_steps = max_steps
+        self.max_entities = max_entities
+        self.frame_size = tuple(frame_size)
+        self.game_kwargs = game_kwargs
+        self._seeds = random.Random(seed)  # seeds of successive episodes
+        self._action = ACTIONS[0]
+        self._small = None
+        self.game = None
+        self.steps = 0
+
+    def _policy(self, game):
+        return self._action
+
+    def reset(self, seed: int = None, out: np.ndarray = None):
+        from jet_runner.game import Game
+
+        if seed is None:
+            seed = self._seeds.getrandbits(63)
+        self.game = Game(headless=True, seed=seed, input_policy=self._policy, verbose=False, **self.game_kwargs)
+        self._action = ACTIONS[0]
+        self.steps = 0
+        return self.observe(out), self._info()
+
+    def step(self, action, out: np.ndarray = None):
+        g = self.game
+        p = g.player
+        if isinstance(action, (int, np.integer)):
+            self._action = ACTIONS[action]
+        else:
+            self._action = (float(action[0]), bool(action[1]))
+        score, health = p.score, p.health
+        dt = 1.0 / cfg.FPS
+        for _ in range(self.frame_skip):
+            g.tick(dt)
+            if not g.running:
+                break
+        self.steps += 1
+        reward = (p.score - score) + cfg.ENV_HEALTH_REWARD * (p.health - health)
+        terminated = p.health <= 0
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        return self.observe(out), float(reward), terminated, truncated, self._info()
+
+    def _info(self) -> dict:
+        g = self.game
+        return {"score": g.player.score, "health": g.player.health, "kills": g.kills, "ticks": g.ticks}
+
+    def observe(self, out: np.ndarray = None) -> np.ndarray:
+        """The current observation, written into out when given."""
+        if out is None:
+            out = np.empty(self.observation_shape, self.observation_dtype)
+        if self.obs_type == "features":
+            self._features(out)
+        else:
+            self._frame(out)
+        return out
+
+    def _features(self, out: np.ndarray):
+        g = self.game
+        p = g.player
+        k = self.max_entities
+        out[:] = 0.0
+        out[0] = (1.0, p.x / cfg.WIDTH, p.y / cfg.HEIGHT, p.health / cfg.PLAYER_HEALTH,
+                  p.fire_cooldown / cfg.PLAYER_FIRE_COOLDOWN)
+        groups = (g.enemies, g.obstacles, [b for b in g.bullets if b.owner == "enemy"])
+        px, py = p.x, p.y
+        v = cfg.BULLET_SPEED
+        for gi, group in enumerate(groups):
+            nearest = heapq.nsmallest(k, group, key=lambda e: (e.x - px) ** 2 + (e.y - py) ** 2)
+            row = 1 + gi * k
+            for j, e in enumerate(nearest):
+                out[row + j] = (1.0, e.x / cfg.WIDTH, e.y / cfg.HEIGHT, getattr(e, "vx", 0.0) / v, e.vy / v)
+
+    def _frame(self, out: np.ndarray):
+        g = self.game
+        g.draw()
+        if self._small is None:
+            self._small = pygame.Surface(self.frame_size, 0, g.screen)
+        pygame.transform.scale(g.screen, self.frame_size, self._small)
+        view = pygame.surfarray.pixels3d(self._small)
+        np.copyto(out, view.transpose(1, 0, 2))
+        del view
+
+
+def _shared(shape, dtype, name: str = None):
+    """A numpy array over a new (name=None) or existing shared memory block."""
+    if name is None:
+        nbytes = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        shm = SharedMemory(create=True, size=nbytes)
+    else:
+        shm = SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _worker(conn, lo: int, hi: int, n: int, seed: int, env_kwargs: dict, names: dict):
+    envs = [JetRunnerEnv(seed=None if seed is None else seed + i, **env_kwargs) for i in range(lo, hi)]
+    shape, dtype = envs[0].observation_shape, envs[0].observation_dtype
+    blocks = [_shared((n,) + shape, dtype, names["obs"]), _shared((n,), np.int64, names["actions"]),
+              _shared((n,), np.float64, names["rewards"]), _shared((2, n), np.bool_, names["dones"])]
+    (_, obs), (_, actions), (_, rewards), (_, dones) = blocks
+    try:
+        while True:
+            cmd = conn.recv()
+            infos = []
+            if cmd == "reset":
+                for i, env in enumerate(envs, lo):
+                    infos.append(env.reset(out=obs[i])[1])
+            elif cmd == "step":
+                for i, env in enumerate(envs, lo):
+                    _, reward, terminated, truncated, info = env.step(int(actions[i]), out=obs[i])
+                    rewards[i] = reward
+                    dones[0, i] = terminated
+                    dones[1, i] = truncated
+                    if terminated or truncated:
+                        # auto-reset: the slot now holds the next episode's first observation
+                        info["episode"] = {"score": info["score"], "steps": env.steps}
+                        env.reset(out=obs[i])
+                    infos.append(info)
+            else:
+                break
+            conn.send(infos)
+    finally:
+        del obs, actions, rewards, dones
+        for shm, _ in blocks:
+            shm.close()
+        conn.close()
+
+
+class VectorEnv:
+    """num_envs JetRunnerEnvs stepped in parallel by worker processes.
+
+    reset() and step() return views of the shared buffers, which the next call overwrites;
+    copy them to keep them. Episodes that end are reset in place, with the finished episode's
+    score and length reported under info["episode"].
+    """
+
+    def __init__(self, num_envs: int, obs: str = "features", seed: int = 0, workers: int = None, **env_kwargs):
+        self.num_envs = num_envs
+        env_kwargs["obs"] = obs
+        self.observation_shape, self.observation_dtype = observation_spec(
+            obs, env_kwargs.get("max_entities", cfg.ENV_MAX_ENTITIES), env_kwargs.get("frame_size", cfg.ENV_FRAME_SIZE))
+        n = num_envs
+        self._blocks = {}
+        self._blocks["obs"], self.obs = _shared((n,) + self.observation_shape, self.observation_dtype)
+        self._blocks["actions"], self.actions = _shared((n,), np.int64)
+        self._blocks["rewards"], self.rewards = _shared((n,), np.float64)
+        self._blocks["dones"], self.dones = _shared((2, n), np.bool_)
+        names = {k: shm.name for k, shm in self._blocks.items()}
+
+        workers = max(1, min(n, workers or os.cpu_count() or 1))
+        bounds = np.linspace(0, n, workers + 1).astype(int)
+        ctx = workers_context()
+        self._conns = []
+        self._procs = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_worker, args=(child, int(lo), int(hi), n, seed, env_kwargs, names), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self.closed = False
+
+    def _call(self, cmd: str) -> list:
+        for c in self._conns:
+            c.send(cmd)
+        infos = []
+        for c in self._conns:
+            infos.extend(c.recv())
+        return infos
+
+    def reset(self):
+        infos = self._call("reset")
+        return self.obs, infos
+
+    def step(self, actions):
+        self.actions[:] = actions
+        infos = self._call("step")
+        return self.obs, self.rewards, self.dones[0], self.dones[1], infos
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        for c in self._conns:
+            try:
+                c.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for p in self._procs:
+            p.join(timeout=5)
+        del self.obs, self.actions, self.rewards, self.dones
+        for shm in self._blocks.values():
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
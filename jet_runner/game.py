@@ -1,57 +1,285 @@
 import pygame
-import sys
+import math
 import random
+import time
+import hashlib
+import struct
 from typing import List
 
 import jet_runner.config as cfg
-from jet_runner.entities import Player, Bullet, Enemy, Obstacle, Scenery
+from jet_runner.entities import Player, Bullet, EnemyStore, Obstacle, ENEMY_ATLAS
 from jet_runner import spawner
+from jet_runner.collision import SpatialHash
+from jet_runner.store import EntityStore
+from jet_runner.pool import Pool
+from jet_runner.particles import ParticleEmitter
+from jet_runner.background import Starfield
+from jet_runner.render import DirtyRectRenderer, RenderQueue
+from jet_runner.hud import Hud
+from jet_runner import profiler as prof
+from jet_runner.quality import TIERS, QualityGovernor, QualityTier
+from jet_runner.replay import NO_CAP, Recorder
+from jet_runner.stress import CAP_TYPES, StressRamp
+
+
+def _first_hit(rect: pygame.Rect, rects: List[pygame.Rect], grid) -> int:
+    """Index of the first of rects colliding with rect, or -1; grid (a built SpatialHash or None) narrows the scan."""
+    if grid is None:
+        return rect.collidelist(rects)
+    for i in grid.query(rect):
+        if rect.colliderect(rects[i]):
+            return i
+    return -1
+
+
+def _all_hits(rect: pygame.Rect, rects: List[pygame.Rect], grid) -> List[int]:
+    """Indices of every one of rects colliding with rect, in ascending order."""
+    if grid is None:
+        return rect.collidelistall(rects)
+    return [i for i in grid.query(rect) if rect.colliderect(rects[i])]
 
 
 class Game:
-    def __init__(self, headless=False, enemy_bullets: bool = True, allow_nebulae: bool = False, max_scenery_alpha: int = 255):
+    def __init__(self, headless=False, enemy_bullets: bool = True, allow_nebulae: bool = False, max_scenery_alpha: int = 255,
+                 dirty_rects: bool = False, hud_stats: bool = False,
+                 profile: bool = False, input_policy=None, verbose: bool = True, seed: int = None,
+                 record: bool = False, spawn_multiplier: float = 1.0, caps: dict = None, stress_ramp: bool = False,
+                 offscreen: bool = False, capture=None, sort_blits: bool = False, adaptive_quality: bool = False):
+        start = time.perf_counter()
         self.headless = headless
+        # every random decision comes from per-game streams derived from one seed; without an explicit
+        # seed it is drawn from the global generator, so random.seed() still makes a game reproducible
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        # recordings store the seed as an unsigned 64-bit field
+        if not 0 <= self.seed < 2 ** 64:
+            raise ValueError(f"seed must be in [0, 2**64), got {self.seed}")
+        # the ramp raises the spawn multiplier on wall-clock frame times, which a replay cannot reproduce
+        if record and stress_ramp:
+            raise ValueError("stress_ramp cannot be combined with record")
+        # tier changes likewise follow wall-clock frame times
+        if record and adaptive_quality:
+            raise ValueError("adaptive_quality cannot be combined with record")
+        root = random.Random(self.seed)
+        self.rng_enemies = random.Random(root.getrandbits(64))
+        self.rng_obstacles = random.Random(root.getrandbits(64))
+        self.rng_scenery = random.Random(root.getrandbits(64))
+        rng_background = random.Random(root.getrandbits(64))
         self.enemy_bullets = enemy_bullets
         self.allow_nebulae = allow_nebulae
         self.max_scenery_alpha = max(0, min(255, int(max_scenery_alpha)))
-        pygame.init()
+        # only the display is needed (events, surfaces); fonts initialise on first HUD use and audio never
+        pygame.display.init()
         if headless:
-            # use a hidden display mode
-            pygame.display.init()
-            pygame.display.set_mode((1,1), flags=pygame.HIDDEN)
+            # use a hidden display mode, shared by every headless game in the process
+            if pygame.display.get_surface() is None:
+                pygame.display.set_mode((1,1), flags=pygame.HIDDEN)
+            # full-size offscreen target, so headless runs can still render (and capture) frames
+            self.screen = pygame.Surface((cfg.WIDTH, cfg.HEIGHT)).convert()
         else:
             self.screen = pygame.display.set_mode((cfg.WIDTH, cfg.HEIGHT))
             pygame.display.set_caption("Jet Runner")
+            # render enemy animation frames up front so first sightings don't hitch
+            ENEMY_ATLAS.generate()
+        # optional partial-update presentation; None means fill + flip every frame
+        self.dirty_rects = dirty_rects
+        self.dirty = DirtyRectRenderer(self.screen) if dirty_rects and not headless else None
+        self.render_queue = RenderQueue(sort_by_surface=sort_blits)
 
         self.clock = pygame.time.Clock()
         self.player = Player(cfg.WIDTH/2, cfg.HEIGHT - 60)
-        self.bullets: List[Bullet] = []
-        self.enemies: List[Enemy] = []
+        # bullets and scenery live in array-backed stores; the objects are views onto them.
+        # Bullets are recycled: the store releases what it drops back to this pool.
+        self.bullet_pool = Pool(Bullet)
+        self._bullets = EntityStore(-50, cfg.HEIGHT + 50, pool=self.bullet_pool)
+        # enemies move in batches grouped by pattern (EnemyStore.step)
+        self._enemies = EnemyStore(-200, cfg.HEIGHT + 200)
         self.obstacles: List[Obstacle] = []
-        self.debris: List = []  # dynamic fragments from destroyed asteroids
-        self.scenery: List[Scenery] = []
+        # fragments from destroyed asteroids: pure-array particles, no per-fragment objects
+        self._debris = ParticleEmitter(-200, cfg.HEIGHT + 200)
+        self._scenery = EntityStore(-200, cfg.HEIGHT + 200)
+        # background stars scroll as pre-rendered layers; dirty-rect mode keeps them as scenery
+        # entities instead, since a scrolling full-screen layer would dirty every pixel. That
+        # changes the scenery spawn schedule, so it follows the flag (recorded in replays) even
+        # for headless games, which never present with dirty rects
+        self.starfield = None if dirty_rects else \
+            Starfield(max_alpha=self.max_scenery_alpha, rng=rng_background)
 
         self.spawn_t = 0.0
         self.spawn_enemy_t = 0.0
         self.spawn_obstacle_t = 0.0
         self.spawn_scenery_t = 0.0
+        # stress mode: each spawn interval produces spawn_multiplier objects (fractions carry over),
+        # never growing a type past its cap; the ramp raises the multiplier until frames run late
+        if not (math.isfinite(spawn_multiplier) and spawn_multiplier >= 0):
+            raise ValueError(f"spawn_multiplier must be finite and >= 0, got {spawn_multiplier!r}")
+        self.spawn_multiplier = spawn_multiplier
+        unknown = set(caps or ()) - set(CAP_TYPES)
+        if unknown:
+            raise ValueError(f"unknown entity cap(s) {', '.join(sorted(unknown))}; choose from {', '.join(CAP_TYPES)}")
+        for kind, cap in (caps or {}).items():
+            # recordings store caps as unsigned 32-bit fields, NO_CAP meaning uncapped
+            if not isinstance(cap, int) or isinstance(cap, bool) or not 0 <= cap < NO_CAP:
+                raise ValueError(f"cap for {kind} must be an int in [0, {NO_CAP}), got {cap!r}")
+        self.caps = dict(caps or {})
+        self._spawn_carry = dict.fromkeys(CAP_TYPES, 0.0)
+        self.stress = StressRamp() if stress_ramp else None
+        # headless games only draw when asked to render offscreen or to capture frames;
+        # capture is a jet_runner.capture.FrameWriter fed every drawn frame
+        self.capture = capture
+        self.render = not headless or offscreen or capture is not None
+        # adaptive quality: the governor lowers the tier when frames run over budget and raises it
+        # again once there is headroom; without it the game stays at the best tier
+        self.governor = QualityGovernor() if adaptive_quality else None
+        self.quality = TIERS[0]
+
+        # broadphase grids, rebuilt every collision pass that has enough targets to need them
+        self._enemy_grid = SpatialHash()
+        self._obstacle_grid = SpatialHash()
+
+        self.hud = Hud()
+        self.hud.add_line("status", lambda: (self.player.health, self.player.score), "Health: {}  Score: {}")
+        if hud_stats:
+            self.hud.add_line("stats", lambda: (int(self.clock.get_fps()), len(self.enemies), len(self.obstacles),
+                                                len(self.bullets), len(self.debris), len(self.scenery)),
+                              "FPS: {}  E: {}  O: {}  B: {}  D: {}  S: {}")
+        if self.governor is not None:
+            self.hud.add_line("quality", lambda: (self.quality.name,), "Quality: {}")
+
+        # per-phase frame profiler; None keeps the hot path to a single check per phase
+        self.profiler = prof.FrameProfiler() if profile else None
+        self.show_profiler = False  # F3 toggles the on-screen overlay
+        self.profiler_hud = Hud(font_size=18, color=(180, 255, 180), pos=(8, 60))
+        if self.profiler is not None:
+            recent = self.profiler.recent
+            for i, name in enumerate(prof.PHASES):
+                self.profiler_hud.add_line(name, lambda i=i: (round(recent[i] * 1000.0, 1),), name + ": {} ms")
+            counts = self.render_queue.counts
+            self.profiler_hud.add_line("blits", lambda: tuple(counts.values()),
+                                       "blits: " + " ".join(f"{name[:2]} {{}}" for name in counts))
+
+        # input_policy(game) -> (dir_x, fire) replaces the keyboard, e.g. for batch or scripted runs
+        self.input_policy = input_policy
+        self.verbose = verbose
+        # per-tick input capture for replays (see jet_runner.replay)
+        self.recorder = Recorder() if record else None
 
         self.running = True
+        # simulation progress of the current/last run()
+        self.ticks = 0
+        self.elapsed = 0.0
+        self.kills = 0  # enemies destroyed by player bullets
+        self.startup_time = time.perf_counter() - start  # seconds spent in __init__
+
+    @property
+    def bullets(self) -> EntityStore:
+        return self._bullets
+
+    @bullets.setter
+    def bullets(self, items):
+        self._refill(self._bullets, items)
+
+    @property
+    def enemies(self) -> EnemyStore:
+        return self._enemies
+
+    @enemies.setter
+    def enemies(self, items):
+        self._refill(self._enemies, items)
 
-    def run(self, max_seconds: float = None):
-        """Main loop. If max_seconds is set, run for at most that many seconds (useful for headless tests)."""
-        elapsed = 0.0
+    @property
+    def debris(self) -> ParticleEmitter:
+        return self._debris
+
+    @debris.setter
+    def debris(self, items):
+        self._refill(self._debris, items)
+
+    @property
+    def scenery(self) -> EntityStore:
+        return self._scenery
+
+    @scenery.setter
+    def scenery(self, items):
+        self._refill(self._scenery, items)
+
+    @staticmethod
+    def _refill(store, items):
+        # keep plain-list assignment working for callers that build entity lists themselves
+        if items is store:
+            return
+        items = list(items)
+        store.clear()
+        store.extend(items)
+
+    def run(self, max_seconds: float = None, max_ticks: int = None, fast_forward: bool = False,
+            threaded: bool = False):
+        """Main loop. If max_seconds is set, run for at most that many seconds (useful for headless tests).
+
+        With fast_forward the frame limiter is skipped and every tick advances the simulation by a
+        fixed 1/FPS step, so max_seconds counts simulated rather than wall-clock time. max_ticks
+        stops the loop after that many simulation ticks regardless of mode. With threaded the
+        simulation runs fixed 1/FPS ticks in real time on its own thread and this thread renders
+        interpolated snapshots (see jet_runner.simulation).
+        """
+        if threaded:
+            if fast_forward:
+                raise ValueError("fast_forward and threaded cannot be combined")
+            from jet_runner.simulation import run_threaded
+            run_threaded(self, max_seconds=max_seconds, max_ticks=max_ticks)
+            return
+        fixed_dt = 1.0 / cfg.FPS
+        self.ticks = 0
+        self.elapsed = 0.0
+        wall_start = time.perf_counter()
+        profiler = self.profiler
+        if self.recorder is not None:
+            self.recorder.fixed_step = fast_forward
+        stress = self.stress
+        if self.capture is not None:
+            # without a frame deadline, waiting for the writer costs nothing but wall time
+            self.capture.realtime = not fast_forward
         while self.running:
-            dt = self.clock.tick(cfg.FPS) / 1000.0
-            elapsed += dt
+            if fast_forward:
+                dt = fixed_dt
+            else:
+                dt = self.clock.tick(cfg.FPS) / 1000.0
+            # the frame starts after the limiter's sleep, so no phase is charged for it
+            work_start = time.perf_counter()
+            if profiler is not None:
+                profiler.begin_frame()
             self.handle_events()
-            self.update(dt)
-            if not self.headless:
+            if profiler is not None:
+                profiler.mark(prof.EVENTS)
+            self.tick(dt, fixed=fast_forward)
+            if self.render:
                 self.draw()
-            if max_seconds is not None and elapsed >= max_seconds:
-                print(f"Stopping after {elapsed:.2f}s (max_seconds={max_seconds}) - score={self.player.score} health={self.player.health}")
+                if self.capture is not None:
+                    self.capture.submit(self.screen)
+                if profiler is not None:
+                    profiler.mark(prof.DRAW)
+            if profiler is not None:
+                profiler.end_frame((len(self.bullets), len(self.enemies), len(self.obstacles),
+                                    len(self.debris), len(self.scenery)))
+            frame_time = time.perf_counter() - work_start
+            if stress is not None and stress.observe(self, frame_time):
+                self.running = False
+            if self.governor is not None and self.governor.observe(frame_time):
+                self._set_quality(self.governor.tier)
+            if (max_seconds is not None and self.elapsed >= max_seconds - 1e-9) or \
+                    (max_ticks is not None and self.ticks >= max_ticks):
+                self._report_stop(max_seconds, max_ticks, time.perf_counter() - wall_start)
                 self.running = False
 
+    def _report_stop(self, max_seconds, max_ticks, wall: float):
+        if self.verbose:
+            # name the limit that ended the run; the seconds limit counts simulated time
+            if max_ticks is not None and self.ticks >= max_ticks:
+                limit = f"max_ticks={max_ticks}"
+            else:
+                limit = f"max_seconds={max_seconds}"
+            print(f"Stopping at {limit} - ticks={self.ticks} sim={self.elapsed:.2f}s wall={wall:.2f}s "
+                  f"- score={self.player.score} health={self.player.health}")
+
     def handle_events(self):
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
@@ -59,19 +287,51 @@ class Game:
             elif ev.type == pygame.KEYDOWN:
                 if ev.key == pygame.K_ESCAPE:
                     self.running = False
+                elif ev.key == pygame.K_F3 and self.profiler is not None:
+                    self.show_profiler = not self.show_profiler
 
-    def update(self, dt: float):
+    def read_input(self):
+        """Return (dir_x, fire) for this tick from the input policy, or the keyboard."""
+        if self.input_policy is not None:
+            return self.input_policy(self)
+        return self.read_keyboard()
+
+    @staticmethod
+    def read_keyboard():
+        """(dir_x, fire) from the keys currently held; main thread only."""
         keys = pygame.key.get_pressed()
         dir_x = 0.0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             dir_x -= 1.0
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
             dir_x += 1.0
+        return dir_x, bool(keys[pygame.K_SPACE])
+
+    def tick(self, dt: float, fixed: bool = True):
+        """Advance the simulation by one tick of dt seconds and count it.
+
+        With fixed every tick is dt long and elapsed is derived from the tick count, so long
+        runs don't accumulate float drift; otherwise dt (a measured frame time) is added.
+        """
+        self.ticks += 1
+        if fixed:
+            self.elapsed = self.ticks * dt
+        else:
+            self.elapsed += dt
+        self.update(dt)
+
+    def update(self, dt: float):
+        profiler = self.profiler
+        dir_x, fire = self.read_input()
+        if self.recorder is not None:
+            self.recorder.record(dir_x, fire, dt)
         self.player.move(dir_x, dt)
 
-        if keys[pygame.K_SPACE] and self.player.can_fire():
+        if fire and self.player.can_fire():
             self.player.fire()
-            self.bullets.append(Bullet(self.player.x, self.player.y - self.player.h/2 - 6, -cfg.BULLET_SPEED, owner="player"))
+            self.bullets.append(self.bullet_pool.acquire(self.player.x, self.player.y - self.player.h/2 - 6, -cfg.BULLET_SPEED, owner="player"))
+        if profiler is not None:
+            profiler.mark(prof.INPUT)
 
         # spawning
         self.spawn_enemy_t += dt
@@ -80,141 +340,229 @@ class Game:
 
         if self.spawn_enemy_t >= cfg.SPAWN_ENEMY_INTERVAL:
             self.spawn_enemy_t = 0.0
-            self.enemies.append(spawner.spawn_enemy())
+            for _ in range(self._spawn_quota("enemies", self.enemies)):
+                self.enemies.append(spawner.spawn_enemy(rng=self.rng_enemies))
 
         if self.spawn_obstacle_t >= cfg.SPAWN_OBSTACLE_INTERVAL:
             self.spawn_obstacle_t = 0.0
-            self.obstacles.append(spawner.spawn_obstacle())
+            for _ in range(self._spawn_quota("obstacles", self.obstacles)):
+                self.obstacles.append(spawner.spawn_obstacle(rng=self.rng_obstacles))
 
-        if self.spawn_scenery_t >= cfg.SPAWN_SCENERY_INTERVAL:
+        stars = self.starfield is None
+        quality = self.quality
+        interval = cfg.SPAWN_SCENERY_INTERVAL if stars else cfg.SPAWN_BODY_INTERVAL
+        if self.spawn_scenery_t >= interval / quality.scenery_density:
             self.spawn_scenery_t = 0.0
-            self.scenery.append(spawner.spawn_scenery(allow_nebulae=self.allow_nebulae, max_alpha=self.max_scenery_alpha))
+            for _ in range(self._spawn_quota("scenery", self.scenery)):
+                self.scenery.append(spawner.spawn_scenery(allow_nebulae=self.allow_nebulae and quality.nebulae,
+                                                          max_alpha=self.max_scenery_alpha, rng=self.rng_scenery,
+                                                          include_stars=stars))
+        if profiler is not None:
+            profiler.mark(prof.SPAWN)
 
         # update entities
         self.player.update(dt)
-        for e in self.bullets:
-            e.update(dt)
-        for en in self.enemies:
-            en.update(dt)
-            # Only allow enemy bullets if enabled globally
-            if self.enemy_bullets:
-                b = en.try_fire()
-                if b:
-                    self.bullets.append(b)
+        self.bullets.step(dt)
+        # enemies advance in one batched pass and hand back those whose cooldown ran out
+        ready = self.enemies.step(dt)
+        # Only allow enemy bullets if enabled globally
+        if self.enemy_bullets and ready:
+            pool = self.bullet_pool
+            self.bullets.extend([en.try_fire(pool) for en in ready])
         for ob in self.obstacles:
             ob.update(dt)
-        # update debris fragments
-        for d in list(self.debris):
-            d.update(dt)
-        for s in self.scenery:
-            s.update(dt)
+        # debris particles and scenery integrate in one vectorized pass each
+        self.debris.step(dt)
+        self.scenery.step(dt)
+        if self.starfield is not None:
+            self.starfield.update(dt)
+
+        if profiler is not None:
+            profiler.mark(prof.ENTITIES)
 
         # collisions
         self.handle_collisions()
+        if profiler is not None:
+            profiler.mark(prof.COLLISIONS)
 
         # cleanup off-screen
-        self.bullets = [b for b in self.bullets if -50 < b.y < cfg.HEIGHT + 50]
-        self.enemies = [e for e in self.enemies if -200 < e.y < cfg.HEIGHT + 200]
+        self.bullets.cull()
+        self.enemies.cull()
         self.obstacles = [o for o in self.obstacles if -200 < o.y < cfg.HEIGHT + 200]
-        self.scenery = [s for s in self.scenery if -200 < s.y < cfg.HEIGHT + 200]
+        self.scenery.cull()
         # keep debris while lifetime remains and on-screen
-        self.debris = [d for d in self.debris if d.lifetime > 0 and -200 < d.y < cfg.HEIGHT + 200]
+        self.debris.cull()
+        if profiler is not None:
+            profiler.mark(prof.CULL)
 
-        # end condition
-        if self.player.health <= 0:
-            print(f"Game Over. Score: {self.player.score}")
+        # end condition; a stress ramp keeps going so the player's fate doesn't cut the probe short
+        if self.player.health <= 0 and self.stress is None:
+            if self.verbose:
+                print(f"Game Over. Score: {self.player.score}")
             self.running = False
 
+    def _set_quality(self, tier: QualityTier):
+        if self.verbose:
+            gov = self.governor
+            print(f"Quality: {self.quality.name} -> {tier.name} at tick {self.ticks} "
+                  f"(average frame {gov.average * 1000.0:.2f} ms, budget {gov.budget * 1000.0:.2f} ms)")
+        self.quality = tier
+
+    def _spawn_quota(self, kind: str, group) -> int:
+        """How many objects of kind to spawn this interval under the multiplier and the kind's cap."""
+        carry = self._spawn_carry[kind] + self.spawn_multiplier
+        n = int(carry)
+        self._spawn_carry[kind] = carry - n
+        cap = self.caps.get(kind)
+        if cap is not None:
+            n = max(0, min(n, cap - len(group)))
+        return n
+
+    def entity_counts(self) -> dict:
+        return {"bullets": len(self.bullets), "enemies": len(self.enemies), "obstacles": len(self.obstacles),
+                "debris": len(self.debris), "scenery": len(self.scenery)}
+
     def handle_collisions(self):
-        # bullets vs enemies
-        for b in list(self.bullets):
+        """Resolve bullet/enemy/obstacle/player collisions using a uniform-grid broadphase.
+
+        Produces the same hits, score and health changes as a brute-force scan over every pair
+        (benchmarks.bench_collisions.naive_collisions): candidates are tested in list order and
+        removals are applied in one batch at the end. With fewer than BROADPHASE_MIN_TARGETS
+        enemies and obstacles the grids cost more than they save, so every target is tested.
+        """
+        player = self.player
+        player_rect = player.rect()
+        enemies = self.enemies
+        obstacles = self.obstacles
+        enemy_rects = [e.rect() for e in enemies]
+        obstacle_rects = [o.rect() for o in obstacles]
+        if len(enemy_rects) + len(obstacle_rects) < cfg.BROADPHASE_MIN_TARGETS:
+            enemy_grid = obstacle_grid = None
+        else:
+            enemy_grid = self._enemy_grid.build(enemy_rects)
+            obstacle_grid = self._obstacle_grid.build(obstacle_rects)
+        # destroyed targets get an empty rect, which collides with nothing
+        dead_rect = pygame.Rect(0, 0, 0, 0)
+        dead_bullets = set()
+        dead_enemies = []
+        dead_obstacles = []
+
+        for bi, b in enumerate(self.bullets):
+            r = b.rect()
             if b.owner == "player":
-                for e in list(self.enemies):
-                    if b.rect().colliderect(e.rect()):
-                        self.bullets.remove(b)
-                        killed = e.hit(1)
-                        if killed:
-                            try:
-                                self.enemies.remove(e)
-                            except ValueError:
-                                pass
-                            self.player.score += 10
-                        break
-                else:
-                    # bullets vs obstacles (player bullets can damage asteroids)
-                    for ob in list(self.obstacles):
-                        if b.rect().colliderect(ob.rect()):
-                            try:
-                                self.bullets.remove(b)
-                            except ValueError:
-                                pass
-                            ob.hp -= 1
-                            # small score for damaging
-                            self.player.score += 2
-                            if ob.hp <= 0:
-                                # spawn debris
-                                try:
-                                    pieces = ob.explode()
-                                except Exception:
-                                    pieces = []
-                                self.debris.extend(pieces)
-                                try:
-                                    self.obstacles.remove(ob)
-                                except ValueError:
-                                    pass
-                                self.player.score += 5
-                            break
+                # bullets vs enemies
+                i = _first_hit(r, enemy_rects, enemy_grid)
+                if i >= 0:
+                    dead_bullets.add(bi)
+                    if enemies[i].hit(1):
+                        enemy_rects[i] = dead_rect
+                        dead_enemies.append(i)
+                        player.score += 10
+                        self.kills += 1
+                    continue
+                # bullets vs obstacles (player bullets can damage asteroids)
+                i = _first_hit(r, obstacle_rects, obstacle_grid)
+                if i >= 0:
+                    dead_bullets.add(bi)
+                    ob = obstacles[i]
+                    ob.hp -= 1
+                    # small score for damaging
+                    player.score += 2
+                    if ob.hp <= 0:
+                        self._explode(ob)
+                        obstacle_rects[i] = dead_rect
+                        dead_obstacles.append(i)
+                        player.score += 5
             else:
                 # enemy bullet vs player
-                if b.rect().colliderect(self.player.rect()):
-                    try:
-                        self.bullets.remove(b)
-                    except ValueError:
-                        pass
-                    self.player.health -= 1
-
-        # player vs obstacles
-        for ob in list(self.obstacles):
-            if ob.rect().colliderect(self.player.rect()):
-                # on collision, obstacle is destroyed and spawns debris
-                try:
-                    pieces = ob.explode()
-                except Exception:
-                    pieces = []
-                self.debris.extend(pieces)
-                try:
-                    self.obstacles.remove(ob)
-                except ValueError:
-                    pass
-                self.player.health -= ob.damage
+                if r.colliderect(player_rect):
+                    dead_bullets.add(bi)
+                    player.health -= 1
+
+        # player vs obstacles: obstacle is destroyed and spawns debris
+        for i in _all_hits(player_rect, obstacle_rects, obstacle_grid):
+            ob = obstacles[i]
+            self._explode(ob)
+            dead_obstacles.append(i)
+            player.health -= ob.damage
 
         # player vs enemies
-        for en in list(self.enemies):
-            if en.rect().colliderect(self.player.rect()):
-                try:
-                    self.enemies.remove(en)
-                except ValueError:
-                    pass
-                self.player.health -= 1
+        for i in _all_hits(player_rect, enemy_rects, enemy_grid):
+            dead_enemies.append(i)
+            player.health -= 1
 
-    def draw(self):
-        self.screen.fill(cfg.COLOR_BG)
-        for s in self.scenery:
-            s.draw(self.screen)
-        for ob in self.obstacles:
-            ob.draw(self.screen)
-        # draw debris fragments
-        for d in self.debris:
-            d.draw(self.screen)
+        # batched removals
+        if dead_bullets:
+            self.bullets.discard(dead_bullets)
+        if dead_enemies:
+            self.enemies.discard(dead_enemies)
+        if dead_obstacles:
+            dead = set(dead_obstacles)
+            self.obstacles = [o for i, o in enumerate(obstacles) if i not in dead]
+
+    def _explode(self, ob: Obstacle):
+        try:
+            ob.explode_into(self.debris)
+        except Exception:
+            pass
+
+    def state_digest(self) -> bytes:
+        """SHA-256 over the gameplay state: player, counters and every entity's position and hp."""
+        h = hashlib.sha256()
+        p = self.player
+        h.update(struct.pack("<dqqqd", p.x, p.health, p.score, self.kills, p.fire_cooldown))
+        for group in (self.bullets, self.enemies, self.obstacles, self.debris, self.scenery):
+            h.update(struct.pack("<I", len(group)))
+            for e in group:
+                h.update(struct.pack("<dd", e.x, e.y))
         for e in self.enemies:
-            e.draw(self.screen)
-        for b in self.bullets:
-            b.draw(self.screen)
-        self.player.draw(self.screen)
+            h.update(struct.pack("<qd", e.hp, e.fire_cd))
+        for o in self.obstacles:
+            h.update(struct.pack("<q", o.hp))
+        return h.digest()
+
+    def pool_stats(self) -> dict:
+        return {"bullets": self.bullet_pool.stats()}
+
+    def sprite_layers(self, keys: bool = False):
+        """[(layer, blit items, item keys)] for the render queue, back to front.
+
+        With keys, every item comes with a key naming the same object in other frames (for
+        interpolating between snapshots); debris particles have none, so theirs is None.
+        """
+        ids = (lambda group: [id(e) for e in group]) if keys else (lambda group: None)
+        layers = []
+        if self.starfield is not None:
+            items = self.starfield.blit_items()
+            layers.append(("background", items, list(range(len(items))) if keys else None))
+        opaque = not self.quality.translucency
+        animate = self.quality.enemy_animation
+        layers.append(("scenery", [s.blit_item(opaque) for s in self.scenery], ids(self.scenery)))
+        layers.append(("obstacles", [ob.blit_item() for ob in self.obstacles], ids(self.obstacles)))
+        layers.append(("debris", self.debris.blit_items(), None))
+        layers.append(("enemies", [e.blit_item(animate) for e in self.enemies], ids(self.enemies)))
+        layers.append(("bullets", [b.blit_item() for b in self.bullets], ids(self.bullets)))
+        return layers
+
+    def draw(self):
+        screen = self.screen
+        if self.dirty is not None:
+            self.dirty.begin()
+        else:
+            screen.fill(cfg.COLOR_BG)
+        # sprites are queued per layer and blitted with one Surface.blits call per layer;
+        # touched rects are only collected for dirty-rect presentation
+        q = self.render_queue
+        for layer, items, _ in self.sprite_layers():
+            q.extend(layer, items)
+        rects = q.present(screen, rects=self.dirty is not None)
+        rects.append(self.player.draw(screen))
 
-        # HUD
-        font = pygame.font.SysFont(None, 22)
-        txt = font.render(f"Health: {self.player.health}  Score: {self.player.score}", True, (240,240,240))
-        self.screen.blit(txt, (8,8))
+        rects.extend(self.hud.draw(screen))
+        if self.show_profiler:
+            rects.extend(self.profiler_hud.draw(screen))
 
-        pygame.display.flip()
+        if self.dirty is not None:
+            self.dirty.present(rects)
+        elif not self.headless:
+            pygame.display.flip()
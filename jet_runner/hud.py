@@ -0,0 +1,63 @@
+# Heads-up display for Jet Runner
+from typing import Callable, Dict, List, Tuple
+
+import pygame
+
+_fonts: Dict[Tuple[str, int], pygame.font.Font] = {}
+
+
+def get_font(size: int = 22, name: str = None) -> pygame.font.Font:
+    """Return a shared font, loading it on first use."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+
+class HudLine:
+    def __init__(self, name: str, values: Callable[[], tuple], fmt: str):
+        self.name = name
+        self.values = values
+        self.fmt = fmt
+        self.last = None
+        self.surface = None
+
+
+class Hud:
+    """Lines of text drawn top-left; each line re-renders only when its values change.
+
+    Lines are added with add_line(name, values, fmt): values() returns a tuple that is
+    compared with the previous frame's and formatted with fmt only when it differs.
+    """
+
+    def __init__(self, font_size: int = 22, color=(240, 240, 240), pos=(8, 8), spacing: int = 2):
+        self.font_size = font_size
+        self.color = color
+        self.pos = pos
+        self.spacing = spacing
+        self.lines: List[HudLine] = []
+        self.renders = 0
+
+    def add_line(self, name: str, values: Callable[[], tuple], fmt: str):
+        self.remove_line(name)
+        self.lines.append(HudLine(name, values, fmt))
+
+    def remove_line(self, name: str):
+        self.lines = [ln for ln in self.lines if ln.name != name]
+
+    def draw(self, surf: pygame.Surface) -> List[pygame.Rect]:
+        rects = []
+        x, y = self.pos
+        for ln in self.lines:
+            values = ln.values()
+            if values != ln.last or ln.surface is None:
+                ln.surface = get_font(self.font_size).render(ln.fmt.format(*values), True, self.color)
+                ln.last = values
+                self.renders += 1
+            rects.append(surf.blit(ln.surface, (x, y)))
+            y += ln.surface.get_height() + self.spacing
+        return rects
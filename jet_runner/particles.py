@@ -0,0 +1,154 @@
+# Array-backed particle system for Jet Runner explosion fragments
+import math
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+import numpy as np
+import pygame
+
+import jet_runner.config as cfg
+
+
+class Particle(NamedTuple):
+    """Read-only snapshot of one live particle, as yielded by iterating an emitter."""
+    x: float
+    y: float
+    w: int
+    h: int
+    vx: float
+    vy: float
+    lifetime: float
+    color: Tuple[int, int, int]
+
+
+_FLOAT_COLS = ("x", "y", "vx", "vy", "lifetime")
+_INT_COLS = ("w", "h", "sprite")
+
+
+def _render_fragment(w: int, h: int, color) -> pygame.Surface:
+    """A w x h filled ellipse fragment in color."""
+    s = pygame.Surface((w, h), flags=pygame.SRCALPHA)
+    pygame.draw.ellipse(s, color, (0, 0, w, h))
+    if pygame.display.get_surface() is not None:
+        s = s.convert_alpha()
+    return s
+
+
+class ParticleEmitter:
+    """Particles kept entirely in NumPy columns: no per-particle objects.
+
+    emit() adds a batch of particles, step() integrates them, cull() drops the ones that left
+    the [y_min, y_max] band or ran out of lifetime (preserving order), and draw() submits every
+    particle in one Surface.blits call. Each particle references a pre-rendered fragment sprite
+    per (w, h, color), rendered on first use and kept for the emitter's lifetime.
+    """
+
+    def __init__(self, y_min: float = -math.inf, y_max: float = math.inf, capacity: int = cfg.PARTICLE_CAPACITY):
+        self.y_min = y_min
+        self.y_max = y_max
+        self.n = 0
+        self.cols = {f: np.zeros(capacity) for f in _FLOAT_COLS}
+        self.cols.update({f: np.zeros(capacity, dtype=np.int32) for f in _INT_COLS})
+        self.sprites: List[pygame.Surface] = []
+        self._sprite_keys: List[Tuple[int, int, tuple]] = []
+        self._sprite_ids: Dict[Tuple[int, int, tuple], int] = {}
+        self.high_water = 0
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        n = self.n
+        c = self.cols
+        keys = self._sprite_keys
+        for x, y, w, h, vx, vy, life, sid in zip(*(c[f][:n].tolist() for f in
+                                                    ("x", "y", "w", "h", "vx", "vy", "lifetime", "sprite"))):
+            yield Particle(x, y, w, h, vx, vy, life, keys[sid][2])
+
+    @property
+    def capacity(self) -> int:
+        return len(self.cols["x"])
+
+    def _grow(self, need: int):
+        cap = self.capacity
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2)
+        for f, a in self.cols.items():
+            b = np.zeros(new_cap, dtype=a.dtype)
+            b[:cap] = a
+            self.cols[f] = b
+
+    def _sprite(self, w: int, h: int, color) -> int:
+        key = (w, h, tuple(color))
+        sid = self._sprite_ids.get(key)
+        if sid is None:
+            sid = self._sprite_ids[key] = len(self.sprites)
+            self.sprites.append(_render_fragment(w, h, key[2]))
+            self._sprite_keys.append(key)
+        return sid
+
+    def emit(self, x, y, w, h, vx, vy, lifetime, color=(120, 120, 120)):
+        """Add particles; every argument but color may be a scalar or a sequence of equal length."""
+        x, y, w, h, vx, vy, lifetime = np.broadcast_arrays(*(np.atleast_1d(a) for a in (x, y, w, h, vx, vy, lifetime)))
+        k = len(x)
+        if not k:
+            return
+        w = w.astype(np.int32)
+        h = h.astype(np.int32)
+        sids = [self._sprite(int(pw), int(ph), color) for pw, ph in zip(w.tolist(), h.tolist())]
+        n = self.n
+        self._grow(n + k)
+        c = self.cols
+        for f, a in (("x", x), ("y", y), ("w", w), ("h", h), ("vx", vx), ("vy", vy), ("lifetime", lifetime)):
+            c[f][n:n + k] = a
+        c["sprite"][n:n + k] = sids
+        self.n = n + k
+        self.high_water = max(self.high_water, self.n)
+
+    def extend(self, items: Iterable):
+        """Add particles from objects with x, y, w, h, vx, vy, lifetime and color (e.g. Particle snapshots)."""
+        for d in items:
+            self.emit(d.x, d.y, d.w, d.h, d.vx, d.vy, d.lifetime, d.color)
+
+    def clear(self):
+        self.n = 0
+
+    def step(self, dt: float):
+        n = self.n
+        if not n:
+            return
+        c = self.cols
+        c["x"][:n] += c["vx"][:n] * dt
+        c["y"][:n] += c["vy"][:n] * dt
+        c["lifetime"][:n] -= dt
+
+    def cull(self):
+        n = self.n
+        if not n:
+            return
+        y = self.cols["y"][:n]
+        keep = (y > self.y_min) & (y < self.y_max) & (self.cols["lifetime"][:n] > 0)
+        if keep.all():
+            return
+        idx = np.flatnonzero(keep)
+        k = len(idx)
+        for a in self.cols.values():
+            a[:k] = a[idx]
+        self.n = k
+
+    def blit_items(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """(sprite, position) for every live particle, ready for Surface.blits or a RenderQueue."""
+        n = self.n
+        if not n:
+            return []
+        c = self.cols
+        # same placement as Entity.rect(): truncate the top-left corner towards zero
+        left = np.trunc(c["x"][:n] - c["w"][:n] / 2).astype(np.int64).tolist()
+        top = np.trunc(c["y"][:n] - c["h"][:n] / 2).astype(np.int64).tolist()
+        sprites = self.sprites
+        return list(zip([sprites[i] for i in c["sprite"][:n].tolist()], zip(left, top)))
+
+    def draw(self, surf: pygame.Surface) -> List[pygame.Rect]:
+        """Blit every particle in one call; returns the touched rects."""
+        items = self.blit_items()
+        return surf.blits(items) if items else []
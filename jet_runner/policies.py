@@ -0,0 +1,60 @@
+# Scripted input policies for unattended Jet Runner games
+import random
+
+import jet_runner.config as cfg
+
+
+class IdlePolicy:
+    """Never moves or fires."""
+
+    def __call__(self, game):
+        return 0.0, False
+
+
+class SweepPolicy:
+    """Sweeps left and right across the screen while firing continuously."""
+
+    def __init__(self):
+        self.dir_x = 1.0
+
+    def __call__(self, game):
+        p = game.player
+        if p.x >= cfg.WIDTH - p.w:
+            self.dir_x = -1.0
+        elif p.x <= p.w:
+            self.dir_x = 1.0
+        return self.dir_x, True
+
+
+class RandomPolicy:
+    """Holds a random direction for a random number of ticks and fires with probability fire_chance."""
+
+    def __init__(self, seed=None, fire_chance: float = 0.5, min_hold: int = 5, max_hold: int = 40):
+        self.rng = random.Random(seed)
+        self.fire_chance = fire_chance
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self.dir_x = 0.0
+        self.hold = 0
+
+    def __call__(self, game):
+        rng = self.rng
+        if self.hold <= 0:
+            self.dir_x = rng.choice((-1.0, 0.0, 1.0))
+            self.hold = rng.randint(self.min_hold, self.max_hold)
+        self.hold -= 1
+        return self.dir_x, rng.random() < self.fire_chance
+
+
+POLICIES = {
+    "idle": lambda seed: IdlePolicy(),
+    "sweep": lambda seed: SweepPolicy(),
+    "random": lambda seed: RandomPolicy(seed),
+}
+
+
+def make_policy(name: str, seed=None):
+    try:
+        return POLICIES[name](seed)
+    except KeyError:
+        raise ValueError(f"unknown input policy {name!r}; choose from {', '.join(POLICIES)}") from None
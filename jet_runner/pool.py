@@ -0,0 +1,57 @@
+# Object pooling for short-lived Jet Runner entities
+from typing import List, Set
+
+
+class Pool:
+    """Free list of reusable entity objects.
+
+    acquire(*args) re-initialises a released object with the constructor arguments, or builds
+    a new one when the free list is empty; release(obj) hands an object back for reuse.
+    Objects the pool did not hand out (built directly by their class) are ignored by
+    release(), so they never skew the live count or enter the free list.
+    """
+
+    def __init__(self, cls, max_free: int = 4096):
+        self.cls = cls
+        self.max_free = max_free
+        self.free: List = []
+        self.created = 0
+        self.reused = 0
+        self._live: Set[int] = set()  # ids of acquired, not yet released objects
+        self.high_water = 0
+
+    def acquire(self, *args, **kwargs):
+        if self.free:
+            obj = self.free.pop()
+            obj.__init__(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self._live.add(id(obj))
+        if len(self._live) > self.high_water:
+            self.high_water = len(self._live)
+        return obj
+
+    @property
+    def live(self) -> int:
+        return len(self._live)
+
+    def release(self, obj):
+        try:
+            self._live.remove(id(obj))
+        except KeyError:
+            return
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def stats(self) -> dict:
+        acquired = self.created + self.reused
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "live": self.live,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "reuse_rate": self.reused / acquired if acquired else 0.0,
+        }
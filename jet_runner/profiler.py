@@ -0,0 +1,112 @@
+# Per-phase frame profiling for Jet Runner
+import csv
+import json
+import threading
+import time
+from typing import Dict
+
+import numpy as np
+
+import jet_runner.config as cfg
+
+PHASES = ("events", "input", "spawn", "entities", "collisions", "cull", "draw")
+COUNTS = ("bullets", "enemies", "obstacles", "debris", "scenery")
+PERCENTILES = (50, 95, 99)
+
+# phase indices for Game's hot path
+EVENTS, INPUT, SPAWN, ENTITIES, COLLISIONS, CULL, DRAW = range(len(PHASES))
+
+
+class FrameProfiler:
+    """Records per-phase timings and entity counts of the last `size` frames in a ring buffer.
+
+    Game calls mark(phase) after each phase of a frame, which charges the time since the
+    previous mark to that phase, and end_frame() once the frame is complete. Work done on
+    another thread (the threaded renderer's draw) is added with charge() and lands in the
+    frame that ends next.
+    """
+
+    def __init__(self, size: int = cfg.PROFILE_FRAMES):
+        self.size = size
+        self.times = np.zeros((size, len(PHASES)))
+        self.counts = np.zeros((size, len(COUNTS)), dtype=np.int64)
+        self.frames = 0
+        self.recent = np.zeros(len(PHASES))  # smoothed per-phase seconds, for the overlay
+        self._row = np.zeros(len(PHASES))
+        self._t = time.perf_counter()
+        self._pending = np.zeros(len(PHASES))
+        self._charged = False
+        self._lock = threading.Lock()
+
+    def begin_frame(self):
+        self._row[:] = 0.0
+        self._t = time.perf_counter()
+
+    def mark(self, phase: int):
+        now = time.perf_counter()
+        self._row[phase] += now - self._t
+        self._t = now
+
+    def charge(self, phase: int, seconds: float):
+        """Add seconds of phase measured on another thread; safe to call while frames are recorded."""
+        with self._lock:
+            self._pending[phase] += seconds
+            self._charged = True
+
+    def end_frame(self, counts=()):
+        if self._charged:
+            with self._lock:
+                self._row += self._pending
+                self._pending[:] = 0.0
+                self._charged = False
+        i = self.frames % self.size
+        self.times[i] = self._row
+        self.counts[i, :len(counts)] = counts
+        self.recent += (self._row - self.recent) * 0.1
+        self.frames += 1
+
+    def _valid(self):
+        n = min(self.frames, self.size)
+        return self.times[:n], self.counts[:n]
+
+    def summary(self) -> Dict:
+        """Percentiles, mean and max per phase (milliseconds) and per entity count."""
+        times, counts = self._valid()
+        out = {"frames": self.frames, "window": len(times), "phases": {}, "counts": {}}
+        if not len(times):
+            return out
+        columns = {name: times[:, i] * 1000.0 for i, name in enumerate(PHASES)}
+        columns["frame"] = times.sum(axis=1) * 1000.0
+        for name, col in columns.items():
+            out["phases"][name] = _stats(col)
+        for i, name in enumerate(COUNTS):
+            out["counts"][name] = _stats(counts[:, i])
+        return out
+
+    def export(self, path: str):
+        """Write summary() to path as JSON, or CSV for a .csv extension."""
+        summary = self.summary()
+        if path.lower().endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                w = csv.writer(f)
+                w.writerow(["kind", "name"] + [f"p{p}" for p in PERCENTILES] + ["mean", "max"])
+                for kind, label in (("phases", "phase_ms"), ("counts", "count")):
+                    for name, st in summary[kind].items():
+                        w.writerow([label, name] + [f"{st[k]:.4f}" for k in st])
+        else:
+            with open(path, "w") as f:
+                json.dump(summary, f, indent=2)
+
+    def format_table(self) -> str:
+        phases = self.summary()["phases"]
+        lines = [f"{'phase':<11}" + "".join(f"{'p%d ms' % p:>9}" for p in PERCENTILES)]
+        for name, st in phases.items():
+            lines.append(f"{name:<11}" + "".join(f"{st['p%d' % p]:>9.3f}" for p in PERCENTILES))
+        return "\n".join(lines)
+
+
+def _stats(col) -> Dict[str, float]:
+    st = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(col, PERCENTILES))}
+    st["mean"] = float(np.mean(col))
+    st["max"] = float(np.max(col))
+    return st
@@ -0,0 +1,86 @@
+# Adaptive quality: trade visual detail for frame time when Jet Runner falls behind
+from collections import deque
+from typing import List, NamedTuple, Tuple
+
+import jet_runner.config as cfg
+
+
+class QualityTier(NamedTuple):
+    name: str
+    scenery_density: float  # share of the normal scenery spawn rate
+    nebulae: bool  # nebulae may spawn (when the game allows them at all)
+    translucency: bool  # False draws scenery as pre-blended opaque sprites
+    enemy_animation: bool  # False draws every enemy at one tentacle phase
+
+
+# best first
+TIERS: Tuple[QualityTier, ...] = tuple(QualityTier(*t) for t in cfg.QUALITY_TIERS)
+
+
+class QualityGovernor:
+    """Steps through quality tiers by the rolling average frame time, with hysteresis.
+
+    observe() takes frame times measured the same way as for StressRamp. A rolling average
+    over `window` frames above down_at * budget drops one tier at once; stepping back up
+    needs up_windows consecutive full windows below up_at * budget. Averages between the
+    two thresholds hold the current tier and reset that count, so a frame rate hovering
+    near budget doesn't flip tiers back and forth. The window restarts after every change,
+    so one slow spell costs at most one tier per window.
+    """
+
+    def __init__(self, tiers=TIERS, budget: float = None, window: int = cfg.QUALITY_WINDOW,
+                 down_at: float = cfg.QUALITY_DOWN_AT, up_at: float = cfg.QUALITY_UP_AT,
+                 up_windows: int = cfg.QUALITY_UP_WINDOWS):
+        if not up_at < down_at:
+            raise ValueError(f"up_at ({up_at}) must be below down_at ({down_at})")
+        self.tiers = tuple(tiers)
+        self.budget = budget if budget is not None else 1.0 / cfg.FPS
+        self.down_at = down_at
+        self.up_at = up_at
+        self.up_windows = up_windows
+        self.index = 0
+        self.frames = 0
+        self.average = 0.0  # of the last full window
+        self._samples = deque(maxlen=window)
+        self._total = 0.0
+        self._calm = 0  # consecutive windows below the step-up threshold
+        self.changes: List[Tuple[int, str, float]] = []  # (frame, new tier, window average)
+
+    @property
+    def tier(self) -> QualityTier:
+        return self.tiers[self.index]
+
+    def observe(self, frame_time: float) -> bool:
+        """Record one frame; returns True when the tier changed."""
+        self.frames += 1
+        samples = self._samples
+        if len(samples) == samples.maxlen:
+            self._total -= samples[0]
+        samples.append(frame_time)
+        self._total += frame_time
+        if len(samples) < samples.maxlen:
+            return False
+        avg = self.average = self._total / len(samples)
+        if avg > self.down_at * self.budget:
+            self._calm = 0
+            if self.index == len(self.tiers) - 1:
+                return False
+            self.index += 1
+        elif avg < self.up_at * self.budget and self.index > 0:
+            # a full window, not a sliding one, counts towards stepping up
+            self._calm += 1
+            self._restart()
+            if self._calm < self.up_windows:
+                return False
+            self._calm = 0
+            self.index -= 1
+        else:
+            self._calm = 0
+            return False
+        self._restart()
+        self.changes.append((self.frames, self.tier.name, avg))
+        return True
+
+    def _restart(self):
+        self._samples.clear()
+        self._total = 0.0
@@ -0,0 +1,100 @@
+# Batched and dirty-rectangle presentation for Jet Runner
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+import jet_runner.config as cfg
+
+
+class DirtyRectRenderer:
+    """Restores and presents only the screen regions touched in the previous and current frame.
+
+    Every frame the regions drawn last frame are restored from a cached background, the game draws
+    as usual, and present() pushes the union of old and new regions with display.update(rects).
+    When that area exceeds max_fraction of the screen it falls back to a full flip.
+    """
+
+    def __init__(self, screen: pygame.Surface, max_fraction: float = cfg.DIRTY_RECT_MAX_FRACTION):
+        self.screen = screen
+        self.max_fraction = max_fraction
+        self.background = pygame.Surface(screen.get_size())
+        if pygame.display.get_surface() is not None:
+            self.background = self.background.convert()
+        self.background.fill(cfg.COLOR_BG)
+        self._prev: List[pygame.Rect] = []
+        self._full = True  # the first frame has nothing to restore from
+        self.partial_frames = 0
+        self.full_frames = 0
+
+    def invalidate(self):
+        """Force the next frame to repaint and flip the whole screen."""
+        self._full = True
+
+    def begin(self):
+        if self._full:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            bg = self.background
+            self.screen.blits([(bg, r, r) for r in self._prev], doreturn=False)
+
+    def present(self, rects: List[Optional[pygame.Rect]]):
+        drawn = [r for r in rects if r]
+        dirty = self._prev + drawn
+        self._prev = drawn
+        area = sum(r.w * r.h for r in dirty)
+        w, h = self.screen.get_size()
+        if self._full or area > self.max_fraction * w * h:
+            self._full = False
+            self.full_frames += 1
+            pygame.display.flip()
+        else:
+            self.partial_frames += 1
+            pygame.display.update(dirty)
+
+
+# back to front; within a layer items are drawn in submission order (or grouped by surface)
+LAYERS = ("background", "scenery", "obstacles", "debris", "enemies", "bullets")
+
+
+class RenderQueue:
+    """Collects (surface, position) blits per layer and presents each layer with one Surface.blits call.
+
+    Entities submit what they would have blitted instead of drawing it, so a frame costs one
+    call into pygame per non-empty layer rather than one per entity. With sort_by_surface the
+    items of a layer are grouped by source surface first, which keeps the blitter on the same
+    source data but may change which of two overlapping sprites of that layer ends up on top.
+    counts holds the submissions per layer of the last presented frame, for profiling.
+    """
+
+    def __init__(self, layers: Iterable[str] = LAYERS, sort_by_surface: bool = False):
+        self.layers: Dict[str, List[Tuple[pygame.Surface, Tuple[int, int]]]] = {name: [] for name in layers}
+        self.sort_by_surface = sort_by_surface
+        self.counts: Dict[str, int] = dict.fromkeys(self.layers, 0)
+
+    def submit(self, layer: str, surface: pygame.Surface, pos):
+        self.layers[layer].append((surface, pos))
+
+    def extend(self, layer: str, items: Iterable):
+        self.layers[layer].extend(items)
+
+    def present(self, target: pygame.Surface, rects: bool = True) -> List[pygame.Rect]:
+        """Blit every layer onto target, back to front, and empty the queue.
+
+        Returns the touched rects (for dirty-rect presentation) unless rects is False.
+        """
+        touched = []
+        for name, items in self.layers.items():
+            self.counts[name] = len(items)
+            if not items:
+                continue
+            if self.sort_by_surface:
+                items.sort(key=lambda item: id(item[0]))
+            if rects:
+                touched.extend(target.blits(items))
+            else:
+                target.blits(items, doreturn=False)
+            items.clear()
+        return touched
+
+    def total(self) -> int:
+        return sum(self.counts.values())
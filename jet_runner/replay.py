@@ -0,0 +1,131 @@
+# Input recording and headless replay for Jet Runner
+import struct
+import zlib
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import jet_runner.config as cfg
+from jet_runner.stress import CAP_TYPES
+
+if TYPE_CHECKING:
+    from jet_runner.game import Game
+
+MAGIC = b"JRRC"
+VERSION = 3
+# magic, version, flags, fps, max_scenery_alpha, seed, ticks, final state hash,
+# spawn multiplier, enemy/obstacle/scenery caps (NO_CAP when uncapped)
+_HEADER = struct.Struct("<4sBBBBQI32sdIII")
+NO_CAP = 0xFFFFFFFF
+FLAG_FIXED_STEP = 1
+FLAG_ENEMY_BULLETS = 2
+FLAG_ALLOW_NEBULAE = 4
+FLAG_DIRTY_RECTS = 8  # stars spawned as scenery entities instead of the starfield
+
+# one byte per tick: bits 0-1 direction (0 none, 1 left, 2 right), bit 2 fire
+_DIR_CODES = {0.0: 0, -1.0: 1, 1.0: 2}
+_CODE_DIRS = (0.0, -1.0, 1.0)
+
+
+class Recorder:
+    """Collects the per-tick input state (and frame time, for variable-step runs) of one game."""
+
+    def __init__(self):
+        self.inputs = bytearray()
+        self.dt_ms = array("I")  # 32-bit ms, so stalls of minutes (sleep, debugger) still fit
+        self.fixed_step = False
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def record(self, dir_x: float, fire: bool, dt: float):
+        try:
+            code = _DIR_CODES[float(dir_x)]
+        except KeyError:
+            raise ValueError(f"only -1/0/1 directions can be recorded, got {dir_x!r}") from None
+        self.inputs.append(code | (4 if fire else 0))
+        if not self.fixed_step:
+            # Clock.tick reports whole milliseconds, so this round-trips exactly
+            self.dt_ms.append(int(round(dt * 1000.0)))
+
+    def save(self, path: str, game):
+        flags = (FLAG_FIXED_STEP if self.fixed_step else 0) \
+            | (FLAG_ENEMY_BULLETS if game.enemy_bullets else 0) \
+            | (FLAG_ALLOW_NEBULAE if game.allow_nebulae else 0) \
+            | (FLAG_DIRTY_RECTS if game.dirty_rects else 0)
+        caps = [game.caps.get(kind, NO_CAP) for kind in CAP_TYPES]
+        header = _HEADER.pack(MAGIC, VERSION, flags, cfg.FPS, game.max_scenery_alpha, game.seed,
+                              len(self.inputs), game.state_digest(), game.spawn_multiplier, *caps)
+        body = bytes(self.inputs) + (b"" if self.fixed_step else self.dt_ms.tobytes())
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(zlib.compress(body, 9))
+
+
+class Recording:
+    """A loaded recording: game settings, per-tick inputs and frame times, expected final state."""
+
+    def __init__(self, seed: int, fps: int, fixed_step: bool, enemy_bullets: bool, allow_nebulae: bool,
+                 max_scenery_alpha: int, inputs: bytes, dts: List[float], digest: bytes,
+                 spawn_multiplier: float = 1.0, caps: Dict[str, int] = None, dirty_rects: bool = False):
+        self.seed = seed
+        self.fps = fps
+        self.fixed_step = fixed_step
+        self.enemy_bullets = enemy_bullets
+        self.allow_nebulae = allow_nebulae
+        self.max_scenery_alpha = max_scenery_alpha
+        self.spawn_multiplier = spawn_multiplier
+        self.caps = dict(caps or {})
+        self.dirty_rects = dirty_rects
+        self.inputs = inputs
+        self.dts = dts
+        self.digest = digest
+
+    @classmethod
+    def load(cls, path: str) -> "Recording":
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a Jet Runner recording (version {VERSION})")
+        magic, version, flags, fps, max_alpha, seed, ticks, digest, multiplier, *caps = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a Jet Runner recording (version {VERSION})")
+        body = zlib.decompress(data[_HEADER.size:])
+        inputs = body[:ticks]
+        fixed = bool(flags & FLAG_FIXED_STEP)
+        if fixed:
+            dts = [1.0 / fps] * ticks
+        else:
+            ms = array("I")
+            ms.frombytes(body[ticks:])
+            dts = [v / 1000.0 for v in ms]
+        return cls(seed, fps, fixed, bool(flags & FLAG_ENEMY_BULLETS), bool(flags & FLAG_ALLOW_NEBULAE),
+                   max_alpha, inputs, dts, digest, multiplier,
+                   {kind: cap for kind, cap in zip(CAP_TYPES, caps) if cap != NO_CAP},
+                   bool(flags & FLAG_DIRTY_RECTS))
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def input_policy(self):
+        """Input policy that plays back the recorded inputs tick by tick."""
+        it = iter(self.inputs)
+
+        def policy(game):
+            code = next(it)
+            return _CODE_DIRS[code & 3], bool(code & 4)
+        return policy
+
+
+def replay(path: str) -> Tuple["Game", bool]:
+    """Re-run a recording headlessly at full speed; returns the game and whether its final state matched."""
+    from jet_runner.game import Game
+
+    rec = Recording.load(path)
+    if rec.fps != cfg.FPS and rec.fixed_step:
+        raise ValueError(f"recording was made at {rec.fps} FPS, config has {cfg.FPS}")
+    g = Game(headless=True, seed=rec.seed, enemy_bullets=rec.enemy_bullets, allow_nebulae=rec.allow_nebulae,
+             max_scenery_alpha=rec.max_scenery_alpha, spawn_multiplier=rec.spawn_multiplier, caps=rec.caps,
+             dirty_rects=rec.dirty_rects, input_policy=rec.input_policy(), verbose=False)
+    for dt in rec.dts:
+        g.tick(dt, fixed=rec.fixed_step)
+    return g, g.state_digest() == rec.digest
@@ -0,0 +1,254 @@
+# Fixed-tick simulation thread with interpolated rendering for Jet Runner
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional, Tuple
+
+import pygame
+
+import jet_runner.config as cfg
+from jet_runner import profiler as prof
+
+
+class Snapshot(NamedTuple):
+    """What one simulation tick looks like, captured on the simulation thread and never modified.
+
+    layers holds (layer, items, keys) back to front: items are (surface, (x, y)) blits and keys
+    name the object behind each item across ticks (None for layers without identities).
+    """
+    tick: int
+    time: float  # perf_counter() time the tick is due to be shown
+    layers: Tuple[Tuple[str, tuple, Optional[tuple]], ...]
+
+
+def take_snapshot(game, t: float) -> Snapshot:
+    layers = [(layer, tuple(items), None if keys is None else tuple(keys))
+              for layer, items, keys in game.sprite_layers(keys=True)]
+    player = tuple(game.player.blit_items())
+    layers.append(("player", player, tuple(range(len(player)))))
+    return Snapshot(game.ticks, t, tuple(layers))
+
+
+class SnapshotBuffer:
+    """Double buffer of the two newest snapshots, written by one thread and read by another.
+
+    publish() replaces the (previous, latest) pair with a single reference assignment, so a
+    reader of `pair` always gets two consistent snapshots without taking a lock.
+    """
+
+    def __init__(self):
+        self.pair: Tuple[Optional[Snapshot], Optional[Snapshot]] = (None, None)
+        self.published = 0
+
+    def publish(self, snapshot: Snapshot):
+        self.pair = (self.pair[1], snapshot)
+        self.published += 1
+
+
+class InputQueue:
+    """Input samples handed from the main thread to the simulation without locks.
+
+    deque.append and deque.popleft are atomic, and only the simulation thread pops. take()
+    returns the newest direction, with fire set if any sample since the previous take() fired,
+    so a tap between two ticks is not lost; with no new samples the last input is held.
+    """
+
+    def __init__(self, maxlen: int = cfg.SIM_INPUT_QUEUE):
+        self._samples = deque(maxlen=maxlen)
+        self._last = (0.0, False)
+
+    def put(self, dir_x: float, fire: bool):
+        self._samples.append((dir_x, fire))
+
+    def take(self):
+        samples = self._samples
+        if not samples:
+            return self._last
+        fire = False
+        while samples:
+            self._last = samples.popleft()
+            fire = fire or self._last[1]
+        return self._last[0], fire
+
+
+class SimulationThread:
+    """Advances a game by fixed 1/tick_rate steps on its own thread, publishing a Snapshot per tick.
+
+    While it runs the game belongs to this thread. Input comes from `inputs` unless the game
+    has an input_policy. max_seconds and max_ticks count simulated time and ticks. Ticks are
+    scheduled on the wall clock; when the thread falls more than SIM_MAX_LAG behind it drops
+    the backlog rather than spiralling (the game then runs slower than real time, with the same
+    results).
+    """
+
+    def __init__(self, game, max_seconds: float = None, max_ticks: int = None, tick_rate: int = cfg.FPS):
+        self.game = game
+        self.dt = 1.0 / tick_rate
+        self.max_seconds = max_seconds
+        self.max_ticks = max_ticks
+        self.inputs = InputQueue()
+        self.snapshots = SnapshotBuffer()
+        self.limit_reached = False
+        self.resyncs = 0
+        self.error: Optional[BaseException] = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="simulation", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _input(self, game):
+        return self.inputs.take()
+
+    def _run(self):
+        g = self.game
+        dt = self.dt
+        profiler = g.profiler
+        policy = g.input_policy
+        if policy is None:
+            g.input_policy = self._input
+        due = time.perf_counter()
+        try:
+            while g.running and not self._stop.is_set():
+                if profiler is not None:
+                    profiler.begin_frame()
+                g.tick(dt)
+                due += dt
+                self.snapshots.publish(take_snapshot(g, due))
+                if profiler is not None:
+                    profiler.end_frame((len(g.bullets), len(g.enemies), len(g.obstacles), len(g.debris), len(g.scenery)))
+                if (self.max_seconds is not None and g.elapsed >= self.max_seconds - 1e-9) or \
+                        (self.max_ticks is not None and g.ticks >= self.max_ticks):
+                    self.limit_reached = True
+                    break
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    self._stop.wait(delay)
+                elif delay < -cfg.SIM_MAX_LAG:
+                    due = time.perf_counter()
+                    self.resyncs += 1
+        except BaseException as e:  # re-raised on the main thread by run_threaded()
+            self.error = e
+        finally:
+            g.input_policy = policy
+
+
+def interpolate(items: tuple, keys: tuple, before: dict, alpha: float, max_step: float = cfg.SIM_LERP_MAX_STEP):
+    """items with each position blended from before[key] by alpha.
+
+    Items whose key is new, or that moved further than max_step (wrapped, teleported or a
+    recycled object), are drawn where they are now.
+    """
+    out = []
+    for (img, (x, y)), key in zip(items, keys):
+        old = before.get(key)
+        if old is not None:
+            ox, oy = old
+            if abs(x - ox) <= max_step and abs(y - oy) <= max_step:
+                x = round(ox + (x - ox) * alpha)
+                y = round(oy + (y - oy) * alpha)
+        out.append((img, (x, y)))
+    return out
+
+
+class InterpolatedRenderer:
+    """Draws a game from a (previous, latest) snapshot pair, positions blended by wall-clock time.
+
+    A snapshot is due at its `time`; frames drawn between two due times show the matching
+    blend of the two, so motion stays smooth at any render rate. HUD text reads the live game.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        # the game's own queue, so the profiler overlay's blit counts follow what is drawn
+        self.queue = game.render_queue
+        self.frames = 0
+        self.alpha = 1.0
+
+    def draw(self, pair, now: float) -> bool:
+        """Render the pair onto the game's screen; False while there is nothing to show yet."""
+        prev, cur = pair
+        if cur is None:
+            return False
+        if prev is None or cur.time <= prev.time:
+            alpha = 1.0
+        else:
+            alpha = min(1.0, max(0.0, (now - prev.time) / (cur.time - prev.time)))
+        self.alpha = alpha
+        old = {} if prev is None else {layer: (items, keys) for layer, items, keys in prev.layers}
+        q = self.queue
+        player = ()
+        for layer, items, keys in cur.layers:
+            before = old.get(layer)
+            if keys is not None and before is not None and before[1] is not None and alpha < 1.0:
+                items = interpolate(items, keys, dict(zip(before[1], (pos for _, pos in before[0]))), alpha)
+            if layer == "player":
+                player = items
+            else:
+                q.extend(layer, items)
+        g = self.game
+        screen = g.screen
+        screen.fill(cfg.COLOR_BG)
+        q.present(screen, rects=False)
+        # the player goes on top, outside the queue, as in Game.draw
+        screen.blits(player, doreturn=False)
+        g.hud.draw(screen)
+        if g.show_profiler:
+            g.profiler_hud.draw(screen)
+        if not g.headless:
+            pygame.display.flip()
+        self.frames += 1
+        return True
+
+
+def run_threaded(game, max_seconds: float = None, max_ticks: int = None) -> SimulationThread:
+    """Run game with the simulation on a SimulationThread while this thread handles events and renders.
+
+    Rendering is capped at cfg.FPS; it may fall behind or stall without changing the
+    simulation. Dirty-rect presentation is not used in this mode (every frame is redrawn).
+    """
+    sim = SimulationThread(game, max_seconds, max_ticks)
+    renderer = InterpolatedRenderer(game)
+    keyboard = game.input_policy is None
+    if game.recorder is not None:
+        game.recorder.fixed_step = True
+    game.ticks = 0
+    game.elapsed = 0.0
+    stress = game.stress
+    profiler = game.profiler
+    wall_start = time.perf_counter()
+    sim.start()
+    try:
+        while sim.is_alive():
+            game.clock.tick(cfg.FPS)
+            work_start = time.perf_counter()
+            game.handle_events()
+            if keyboard:
+                sim.inputs.put(*game.read_keyboard())
+            if game.render:
+                draw_start = time.perf_counter()
+                if renderer.draw(sim.snapshots.pair, draw_start) and game.capture is not None:
+                    game.capture.submit(game.screen)
+                if profiler is not None:
+                    # the simulation thread owns the frame; the draw joins the frame it ends next
+                    profiler.charge(prof.DRAW, time.perf_counter() - draw_start)
+            frame_time = time.perf_counter() - work_start
+            if stress is not None and stress.observe(game, frame_time):
+                game.running = False
+            if game.governor is not None and game.governor.observe(frame_time):
+                game._set_quality(game.governor.tier)
+    finally:
+        sim.stop()
+    if sim.error is not None:
+        raise sim.error
+    if sim.limit_reached:
+        game._report_stop(max_seconds, max_ticks, time.perf_counter() - wall_start)
+    game.running = False
+    return sim
@@ -3,63 +3,67 @@ import jet_runner.config as cfg
 from jet_runner.entities import Enemy, Obstacle, Scenery
 
 
-def spawn_enemy(width=cfg.WIDTH):
-    x = random.uniform(20, width-20)
+def spawn_enemy(width=cfg.WIDTH, rng=random):
+    x = rng.uniform(20, width-20)
     y = -20
-    w = random.uniform(24, 48)
-    h = random.uniform(18, 36)
-    vy = random.uniform(cfg.ENEMY_MIN_SPEED, cfg.ENEMY_MAX_SPEED)
-    pattern = random.choice(["straight", "sine", "zigzag"])
-    can_fire = random.random() < 0.35
-    hp = 1 if not can_fire else random.choice([1, 2])
-    return Enemy(x, y, w, h, vy, pattern, can_fire, hp)
+    w = rng.uniform(24, 48)
+    h = rng.uniform(18, 36)
+    vy = rng.uniform(cfg.ENEMY_MIN_SPEED, cfg.ENEMY_MAX_SPEED)
+    pattern = rng.choice(["straight", "sine", "zigzag"])
+    can_fire = rng.random() < 0.35
+    hp = 1 if not can_fire else rng.choice([1, 2])
+    return Enemy(x, y, w, h, vy, pattern, can_fire, hp, rng=rng)
 
 
-def spawn_obstacle(width=cfg.WIDTH):
-    x = random.uniform(16, width-16)
+def spawn_obstacle(width=cfg.WIDTH, rng=random):
+    x = rng.uniform(16, width-16)
     y = -20
-    size = random.uniform(22, 48)
-    vy = random.uniform(cfg.SCENERY_MIN_SPEED, cfg.SCENERY_MAX_SPEED)
-    damage = random.choice([1, 2])
-    return Obstacle(x, y, size, vy, damage)
+    size = rng.uniform(22, 48)
+    vy = rng.uniform(cfg.SCENERY_MIN_SPEED, cfg.SCENERY_MAX_SPEED)
+    damage = rng.choice([1, 2])
+    return Obstacle(x, y, size, vy, damage, rng=rng)
 
 
-def spawn_scenery(width=cfg.WIDTH, allow_nebulae: bool = False, max_alpha: int = 255):
-    x = random.uniform(10, width-10)
+def spawn_scenery(width=cfg.WIDTH, allow_nebulae: bool = False, max_alpha: int = 255, rng=random,
+                  include_stars: bool = False):
+    x = rng.uniform(10, width-10)
     y = -10
-    # choose a scenery kind to draw. Include nebula only if allowed.
+    # choose a scenery kind to draw. Include nebula only if allowed; stars normally come from
+    # the pre-rendered Starfield and are only spawned as entities when include_stars is set.
     if allow_nebulae:
         kinds = ["star", "planet", "comet", "nebula"]
         weights = [40, 25, 20, 15]
     else:
         kinds = ["star", "planet", "comet"]
         weights = [60, 25, 15]
-    kind = random.choices(kinds, weights=weights)[0]
+    if not include_stars:
+        kinds, weights = kinds[1:], weights[1:]
+    kind = rng.choices(kinds, weights=weights)[0]
     # size and velocity tuned per kind
     if kind == "star":
-        w = h = random.uniform(4, 10)
-        vy = random.uniform(cfg.SCENERY_MIN_SPEED * 0.5, cfg.SCENERY_MIN_SPEED)
+        w = h = rng.uniform(4, 10)
+        vy = rng.uniform(cfg.SCENERY_MIN_SPEED * 0.5, cfg.SCENERY_MIN_SPEED)
     elif kind == "planet":
-        w = h = random.uniform(28, 80)
-        vy = random.uniform(cfg.SCENERY_MIN_SPEED * 0.6, cfg.SCENERY_MIN_SPEED * 1.0)
+        w = h = rng.uniform(28, 80)
+        vy = rng.uniform(cfg.SCENERY_MIN_SPEED * 0.6, cfg.SCENERY_MIN_SPEED * 1.0)
     elif kind == "comet":
-        w = random.uniform(8, 18)
-        h = random.uniform(6, 12)
-        vy = random.uniform(cfg.SCENERY_MIN_SPEED * 1.0, cfg.SCENERY_MAX_SPEED * 1.2)
+        w = rng.uniform(8, 18)
+        h = rng.uniform(6, 12)
+        vy = rng.uniform(cfg.SCENERY_MIN_SPEED * 1.0, cfg.SCENERY_MAX_SPEED * 1.2)
     elif kind == "nebula":
-        w = random.uniform(60, 140)
-        h = random.uniform(20, 60)
-        vy = random.uniform(cfg.SCENERY_MIN_SPEED * 0.4, cfg.SCENERY_MIN_SPEED * 0.9)
+        w = rng.uniform(60, 140)
+        h = rng.uniform(20, 60)
+        vy = rng.uniform(cfg.SCENERY_MIN_SPEED * 0.4, cfg.SCENERY_MIN_SPEED * 0.9)
 
     # determine a depth (parallax) and alpha to make scenery feel in the background
     if kind == "star":
-        depth = random.uniform(0.2, 0.5)
+        depth = rng.uniform(0.2, 0.5)
     elif kind == "planet":
-        depth = random.uniform(0.3, 0.7)
+        depth = rng.uniform(0.3, 0.7)
     elif kind == "comet":
-        depth = random.uniform(0.6, 1.0)
+        depth = rng.uniform(0.6, 1.0)
     elif kind == "nebula":
-        depth = random.uniform(0.15, 0.35)
+        depth = rng.uniform(0.15, 0.35)
     else:
         depth = 0.5
 
@@ -73,4 +77,4 @@ def spawn_scenery(width=cfg.WIDTH, allow_nebulae: bool = False, max_alpha: int =
     alpha = int(max(10, min(max_alpha, base_alpha)))
 
     palette = None
-    return Scenery(x, y, w, h, vy, kind=kind, palette=palette, depth=depth, alpha=alpha)
+    return Scenery(x, y, w, h, vy, kind=kind, palette=palette, depth=depth, alpha=alpha, rng=rng)
@@ -0,0 +1,57 @@
+# Pre-rendered surface caching for Jet Runner drawing
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+import pygame
+
+
+def to_display_format(surf: pygame.Surface) -> pygame.Surface:
+    """Convert surf to the display's pixel format for faster blits, if a display exists."""
+    if pygame.display.get_surface() is not None:
+        # opaque (e.g. colour-keyed) surfaces stay opaque
+        return surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+    return surf
+
+
+class SurfaceCache:
+    """Bounded LRU cache of pre-rendered, display-format surfaces with hit/miss counters."""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._items: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key: Hashable, build: Callable[[Hashable], pygame.Surface]) -> pygame.Surface:
+        """Return the surface cached for key, rendering it with build(key) on a miss."""
+        items = self._items
+        surf = items.get(key)
+        if surf is not None:
+            items.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = to_display_format(build(key))
+        items[key] = surf
+        if len(items) > self.max_size:
+            items.popitem(last=False)
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
@@ -0,0 +1,186 @@
+# Structure-of-arrays entity storage for Jet Runner
+import math
+from typing import Iterable, List
+
+import numpy as np
+
+# per-entity columns kept in contiguous arrays, with the value used when an entity doesn't set one
+FIELDS = ("x", "y", "vx", "vy", "lifetime", "age")
+DEFAULTS = {"x": 0.0, "y": 0.0, "vx": 0.0, "vy": 0.0, "lifetime": math.inf, "age": 0.0}
+
+
+class StoreField:
+    """Descriptor that reads/writes an entity attribute through its slot in an EntityStore.
+
+    While the entity isn't stored the value lives in a private instance slot, so entities can still
+    be constructed, updated and drawn standalone exactly as before.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is None:
+            return getattr(obj, self.local)
+        return store.cols[self.name][obj._slot]
+
+    def __set__(self, obj, value):
+        store = obj._store
+        if store is None:
+            setattr(obj, self.local, value)
+        else:
+            store.cols[self.name][obj._slot] = value
+
+
+class StoreView:
+    """Mixin for entities that can be backed by an EntityStore slot.
+
+    Subclasses that want __slots__ must include StoreView.SLOTS in their own. Subclasses may
+    add columns by extending FIELDS and DEFAULTS (with a StoreField each) and storing them in
+    an EntityStore subclass with matching FIELDS/DEFAULTS.
+    """
+    __slots__ = ()
+    FIELDS = FIELDS
+    DEFAULTS = DEFAULTS
+    SLOTS = ("_store", "_slot") + tuple("_" + f for f in FIELDS)
+
+    x = StoreField()
+    y = StoreField()
+    vx = StoreField()
+    vy = StoreField()
+    lifetime = StoreField()
+    age = StoreField()
+
+    def __init__(self, *args, **kwargs):
+        self._store = None
+        self._slot = -1
+        for f in self.FIELDS:
+            setattr(self, "_" + f, self.DEFAULTS[f])
+        super().__init__(*args, **kwargs)
+
+
+class EntityStore:
+    """Contiguous NumPy storage for simple moving entities (bullets, debris, scenery).
+
+    Iterates like the list it replaces, yielding the entity objects as views onto their slot.
+    step() integrates every entity in one vectorized pass and cull() drops the ones that left
+    the [y_min, y_max] band or ran out of lifetime, preserving order.
+
+    FIELDS are the columns copied to and from the entity objects; DEFAULTS names every column,
+    including derived ones a subclass keeps only in the store.
+    """
+    FIELDS = FIELDS
+    DEFAULTS = DEFAULTS
+
+    def __init__(self, y_min: float = -math.inf, y_max: float = math.inf, capacity: int = 64, pool=None):
+        self.y_min = y_min
+        self.y_max = y_max
+        # entities culled or discarded are handed back to this Pool, if set
+        self.pool = pool
+        self.items: List = []
+        self.cols = {f: np.full(capacity, d) for f, d in self.DEFAULTS.items()}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    @property
+    def capacity(self) -> int:
+        return len(self.cols["x"])
+
+    def _grow(self, need: int):
+        cap = self.capacity
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2)
+        for f, a in self.cols.items():
+            b = np.full(new_cap, self.DEFAULTS[f])
+            b[:cap] = a
+            self.cols[f] = b
+
+    def append(self, item):
+        if item._store is not None:
+            item._store.remove(item)
+        n = len(self.items)
+        self._grow(n + 1)
+        for f in self.FIELDS:
+            self.cols[f][n] = getattr(item, f)
+        item._store = self
+        item._slot = n
+        self.items.append(item)
+
+    def extend(self, items: Iterable):
+        for item in items:
+            self.append(item)
+
+    def _detach(self, item):
+        # copy the current values back so the entity stays usable on its own
+        slot = item._slot
+        item._store = None
+        item._slot = -1
+        for f in self.FIELDS:
+            setattr(item, "_" + f, float(self.cols[f][slot]))
+
+    def clear(self):
+        for item in self.items:
+            self._detach(item)
+        self.items = []
+
+    def step(self, dt: float):
+        """Integrate positions, ages and lifetimes of every stored entity."""
+        n = len(self.items)
+        if not n:
+            return
+        c = self.cols
+        c["x"][:n] += c["vx"][:n] * dt
+        c["y"][:n] += c["vy"][:n] * dt
+        c["age"][:n] += dt
+        c["lifetime"][:n] -= dt
+
+    def cull(self):
+        """Drop entities outside the vertical band or with no lifetime left."""
+        n = len(self.items)
+        if not n:
+            return
+        y = self.cols["y"][:n]
+        self._keep((y > self.y_min) & (y < self.y_max) & (self.cols["lifetime"][:n] > 0))
+
+    def discard(self, slots: Iterable[int]):
+        """Remove the entities at the given slots in one batch."""
+        mask = np.ones(len(self.items), dtype=bool)
+        mask[list(slots)] = False
+        self._keep(mask)
+
+    def remove(self, item):
+        if item._store is not self:
+            raise ValueError("entity is not in this store")
+        self.discard([item._slot])
+
+    def _keep(self, mask: np.ndarray):
+        if mask.all():
+            return
+        items = self.items
+        pool = self.pool
+        for i in np.flatnonzero(~mask).tolist():
+            self._detach(items[i])
+            if pool is not None:
+                pool.release(items[i])
+        idx = np.flatnonzero(mask)
+        k = len(idx)
+        for a in self.cols.values():
+            a[:k] = a[idx]
+        kept = [items[i] for i in idx.tolist()]
+        # only slots from the first removal onwards have moved
+        first = int(np.argmin(mask))
+        for slot in range(first, k):
+            kept[slot]._slot = slot
+        self.items = kept
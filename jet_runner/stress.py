@@ -0,0 +1,52 @@
+# Stress mode: spawn-rate ramping to find where Jet Runner stops holding its frame rate
+import statistics
+from typing import Dict, Optional
+
+import jet_runner.config as cfg
+
+# per-type population limits understood by Game(caps=...)
+CAP_TYPES = ("enemies", "obstacles", "scenery")
+
+
+class StressRamp:
+    """Grows a game's spawn multiplier every `window` frames until frames stop fitting the budget.
+
+    Game calls observe() with the work time of each frame (everything but the frame limiter's
+    sleep). When the median of a window exceeds budget the entity counts of that window are
+    kept in `result` and observe() returns True.
+    """
+
+    def __init__(self, budget: float = None, growth: float = cfg.STRESS_RAMP_GROWTH,
+                 window: int = cfg.STRESS_RAMP_WINDOW):
+        self.budget = budget if budget is not None else 1.0 / cfg.FPS
+        self.growth = growth
+        self.window = window
+        self.samples = []
+        self.totals = []
+        self.reached = 0.0  # highest multiplier observed so far
+        self.result: Optional[Dict] = None
+
+    def observe(self, game, frame_time: float) -> bool:
+        self.samples.append(frame_time)
+        self.reached = game.spawn_multiplier
+        counts = game.entity_counts()
+        self.totals.append(sum(counts.values()))
+        if len(self.samples) < self.window:
+            return False
+        median = statistics.median(self.samples)
+        if median > self.budget:
+            self.result = {"multiplier": game.spawn_multiplier, "entities": int(statistics.median(self.totals)),
+                           "counts": counts, "frame_ms": median * 1000.0, "budget_ms": self.budget * 1000.0}
+            return True
+        game.spawn_multiplier *= self.growth
+        self.samples.clear()
+        self.totals.clear()
+        return False
+
+    def report(self) -> str:
+        if self.result is None:
+            return f"Stress: frames stayed within {self.budget * 1000.0:.2f} ms up to spawn x{self.reached:.3g}"
+        r = self.result
+        per_type = " ".join(f"{k}={v}" for k, v in r["counts"].items())
+        return (f"Stress: {1.0 / self.budget:.0f} FPS lost at spawn x{r['multiplier']:.3g} with {r['entities']} entities "
+                f"({per_type}) - median frame {r['frame_ms']:.2f} ms > {r['budget_ms']:.2f} ms")
@@ -0,0 +1,14 @@
+# Worker-process setup shared by batch runs and vector environments
+import multiprocessing
+import os
+
+# keep worker start-up quiet; spawned workers inherit the environment
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+
+def context():
+    """Multiprocessing context for game workers.
+
+    spawn rather than fork: a forked child inherits the parent's SDL state and can hang.
+    """
+    return multiprocessing.get_context("spawn")
@@ -1,25 +1,103 @@
 import sys
 import argparse
 from jet_runner.game import Game
+from jet_runner.replay import replay
+from jet_runner.capture import FrameWriter, FORMATS
 
 
 def main(argv=None):
     p = argparse.ArgumentParser(description="Jet Runner")
     p.add_argument("--headless", action="store_true", help="Run without opening a window")
     p.add_argument("--duration", type=float, default=None, help="If set, run for this many seconds and exit")
+    p.add_argument("--fast-forward", dest="fast_forward", action="store_true",
+                   help="Headless only: fixed 1/FPS step with no frame limiter; --duration counts simulated seconds")
+    p.add_argument("--ticks", type=int, default=None, help="If set, run for this many simulation ticks and exit")
     p.add_argument("--no-enemy-bullets", dest="enemy_bullets", action="store_false",
                    help="Disable enemies firing bullets (they will still collide on contact)")
     p.add_argument("--enable-nebulae", dest="enable_nebulae", action="store_true",
                    help="Enable nebulae in background scenery")
     p.add_argument("--max-scenery-alpha", type=int, default=180,
                    help="Maximum alpha (0-255) used for scenery opacity; lower = more transparent")
+    p.add_argument("--dirty-rects", dest="dirty_rects", action="store_true",
+                   help="Redraw and present only changed screen regions (falls back to full flips when busy)")
+    p.add_argument("--hud-stats", dest="hud_stats", action="store_true",
+                   help="Show FPS and entity counts in the HUD")
+    p.add_argument("--profile", action="store_true",
+                   help="Record per-phase frame timings (F3 toggles the overlay) and print percentiles at exit")
+    p.add_argument("--profile-out", dest="profile_out", default=None,
+                   help="With --profile, write percentiles to this .json or .csv file at exit")
+    p.add_argument("--seed", type=int, default=None, help="Seed for every random decision in the game")
+    p.add_argument("--record", default=None, metavar="PATH", help="Record per-tick input to PATH for --replay")
+    p.add_argument("--replay", default=None, metavar="PATH",
+                   help="Re-run a recording headlessly at full speed and verify its final state")
+    p.add_argument("--spawn-multiplier", dest="spawn_multiplier", type=float, default=1.0,
+                   help="Stress: spawn this many enemies/obstacles/scenery per spawn interval (fractions carry over)")
+    p.add_argument("--max-enemies", dest="max_enemies", type=int, default=None, help="Stress: cap on live enemies")
+    p.add_argument("--max-obstacles", dest="max_obstacles", type=int, default=None, help="Stress: cap on live obstacles")
+    p.add_argument("--max-scenery", dest="max_scenery", type=int, default=None, help="Stress: cap on live scenery")
+    p.add_argument("--stress-ramp", dest="stress_ramp", action="store_true",
+                   help="Raise the spawn multiplier until frames exceed the 1/FPS budget, then report the entity count")
+    p.add_argument("--offscreen", action="store_true",
+                   help="Headless only: render every frame into a full-size offscreen surface")
+    p.add_argument("--capture", default=None, metavar="PATH",
+                   help="Write rendered frames to PATH (a raw RGB24 file, or a directory of PNGs)")
+    p.add_argument("--capture-format", dest="capture_format", choices=FORMATS, default="raw",
+                   help="Frame capture format (default: raw)")
+    p.add_argument("--adaptive-quality", dest="adaptive_quality", action="store_true",
+                   help="Lower scenery density, nebulae, translucency and enemy animation when frames run over budget")
+    p.add_argument("--threaded", action="store_true",
+                   help="Run the simulation at a fixed tick rate on its own thread and render interpolated snapshots")
+    p.add_argument("--sort-blits", dest="sort_blits", action="store_true",
+                   help="Group each render layer's blits by source surface (overlap order within a layer may change)")
     args = p.parse_args(argv)
+    if args.replay:
+        g, ok = replay(args.replay)
+        print(f"Replayed {g.ticks} ticks ({g.elapsed:.2f}s simulated) - score={g.player.score} "
+              f"health={g.player.health} - final state {'OK' if ok else 'MISMATCH'}")
+        return 0 if ok else 1
+    if args.fast_forward and not args.headless:
+        p.error("--fast-forward requires --headless")
+    if args.threaded and args.fast_forward:
+        p.error("--threaded cannot be combined with --fast-forward")
+    if args.offscreen and not args.headless:
+        p.error("--offscreen requires --headless")
 
     # clamp max alpha
     max_alpha = max(0, min(255, int(args.max_scenery_alpha)))
-    g = Game(headless=args.headless, enemy_bullets=args.enemy_bullets, allow_nebulae=bool(args.enable_nebulae), max_scenery_alpha=max_alpha)
-    g.run(max_seconds=args.duration)
+    capture = FrameWriter(args.capture, fmt=args.capture_format) if args.capture else None
+    try:
+        g = Game(headless=args.headless, enemy_bullets=args.enemy_bullets, allow_nebulae=bool(args.enable_nebulae), max_scenery_alpha=max_alpha,
+                 dirty_rects=args.dirty_rects, hud_stats=args.hud_stats, profile=args.profile or bool(args.profile_out),
+                 seed=args.seed, record=bool(args.record), spawn_multiplier=args.spawn_multiplier,
+                 caps={k: v for k, v in (("enemies", args.max_enemies), ("obstacles", args.max_obstacles),
+                                         ("scenery", args.max_scenery)) if v is not None},
+                 stress_ramp=args.stress_ramp, offscreen=args.offscreen, capture=capture, sort_blits=args.sort_blits,
+                 adaptive_quality=args.adaptive_quality)
+    except ValueError as e:
+        # settings Game rejects (seed, caps, spawn multiplier, options a recording cannot replay)
+        if capture is not None:
+            capture.close()
+        p.error(str(e))
+    try:
+        g.run(max_seconds=args.duration, max_ticks=args.ticks, fast_forward=args.fast_forward, threaded=args.threaded)
+    finally:
+        if capture is not None:
+            capture.close()
+            st = capture.stats()
+            print(f"Captured {st['written']} frames ({st['dropped']} dropped) to {args.capture}")
+        if g.stress is not None:
+            print(g.stress.report())
+        if args.record:
+            g.recorder.save(args.record, g)
+            print(f"Recorded {len(g.recorder)} ticks (seed={g.seed}) to {args.record}")
+        if g.profiler is not None:
+            print(g.profiler.format_table())
+            for name, st in g.pool_stats().items():
+                print(f"{name} pool: high_water={st['high_water']} created={st['created']} "
+                      f"reused={st['reused']} reuse_rate={st['reuse_rate']:.1%}")
+            if args.profile_out:
+                g.profiler.export(args.profile_out)
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,32 @@
+import pygame
+
+from jet_runner.assets import ASSETS, AssetManager, generate_jet
+from jet_runner.game import Game
+
+
+def test_player_sprites_are_loaded_once_per_process():
+    Game(headless=True)
+    loads = ASSETS.loads
+    a = Game(headless=True).player
+    b = Game(headless=True).player
+    assert ASSETS.loads == loads
+    assert a.sprite is b.sprite and a.sprite is not None
+
+
+def test_missing_assets_are_generated_in_memory_only(tmp_path):
+    assets = AssetManager(str(tmp_path))
+    img = assets.image("jet.png", generate_jet)
+    assert img.get_size() == (64, 64)
+    assert assets.image("jet.png", generate_jet) is img
+    assert assets.generated == 1 and assets.loads == 0
+    assert list(tmp_path.iterdir()) == []
+    assert assets.image("nothing.png") is None
+
+
+def test_images_are_converted_once_a_display_exists(tmp_path):
+    pygame.image.save(generate_jet(), str(tmp_path / "jet.png"))
+    assets = AssetManager(str(tmp_path))
+    Game(headless=True)
+    img = assets.image("jet.png")
+    assert assets.loads == 1 and assets.image("jet.png") is img
+    assert img.get_flags() & pygame.SRCALPHA
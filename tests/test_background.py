@@ -0,0 +1,40 @@
+import random
+
+import numpy as np
+import pygame
+
+import jet_runner.config as cfg
+from jet_runner import spawner
+from jet_runner.background import Starfield
+
+
+def render(field, offset):
+    field.offsets = [float(offset)] * len(field.offsets)
+    surf = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    surf.fill(cfg.COLOR_BG)
+    field.draw(surf)
+    return pygame.surfarray.array3d(surf)
+
+
+def test_layers_scroll_as_seamless_tiles():
+    field = Starfield(layers=((0.3, 80),), rng=random.Random(1))
+    base = render(field, 0)
+    assert (base != np.array(cfg.COLOR_BG)).any()
+    for offset in (1, 137, cfg.HEIGHT - 1):
+        assert np.array_equal(render(field, offset), np.roll(base, offset, axis=1))
+
+
+def test_offsets_advance_by_depth_and_wrap():
+    field = Starfield(rng=random.Random(1))
+    start = list(field.offsets)
+    field.update(1.0)
+    for s, o, speed in zip(start, field.offsets, field.speeds):
+        assert o == (s + speed) % cfg.HEIGHT
+    assert field.speeds == sorted(field.speeds)
+
+
+def test_spawner_leaves_stars_to_the_starfield():
+    rng = random.Random(3)
+    kinds = {spawner.spawn_scenery(allow_nebulae=True, rng=rng).kind for _ in range(300)}
+    assert kinds == {"planet", "comet", "nebula"}
+    assert "star" in {spawner.spawn_scenery(rng=rng, include_stars=True).kind for _ in range(50)}
@@ -0,0 +1,34 @@
+import pytest
+
+from jet_runner import batch
+
+
+def test_parse_sets_and_grid():
+    grid = batch.parse_sets(["SPAWN_ENEMY_INTERVAL=0.8,1.2", "enemy_bullets=True,False"])
+    assert grid == {"SPAWN_ENEMY_INTERVAL": [0.8, 1.2], "enemy_bullets": [True, False]}
+    jobs = batch.make_jobs(grid, games=3, duration=5.0, policy="idle", seed=10)
+    assert len(jobs) == 12
+    assert [j["seed"] for j in jobs[:3]] == [10, 11, 12]
+    with pytest.raises(ValueError):
+        batch.parse_sets(["NOT_A_SETTING=1"])
+    with pytest.raises(ValueError, match="not read"):
+        batch.parse_sets(["ENEMY_FIRE_CHANCE=0.1,0.5"])
+
+
+def test_batch_games_are_reproducible_and_restore_config():
+    import jet_runner.config as cfg
+    before = cfg.SPAWN_ENEMY_INTERVAL
+    jobs = batch.make_jobs({"SPAWN_ENEMY_INTERVAL": [0.5]}, games=2, duration=5.0, policy="random", seed=3)
+    first = batch.run_batch(jobs, workers=1)
+    again = batch.run_batch(jobs, workers=2)
+    strip = lambda rows: [{k: v for k, v in r.items() if k != "wall"} for r in rows]
+    assert strip(first) == strip(again)
+    assert cfg.SPAWN_ENEMY_INTERVAL == before
+    summary = batch.summarize(first, ["SPAWN_ENEMY_INTERVAL"])
+    assert summary[0]["games"] == 2 and summary[0]["SPAWN_ENEMY_INTERVAL"] == 0.5
+
+
+def test_rejects_empty_batch(capsys):
+    with pytest.raises(SystemExit):
+        batch.main(["--games", "0"])
+    assert "--games must be at least 1" in capsys.readouterr().err
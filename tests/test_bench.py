@@ -0,0 +1,23 @@
+from benchmarks.bench_suite import build_game, compare, run_suite
+
+
+def test_scenario_holds_n_of_each_entity():
+    g = build_game(20)
+    assert (len(g.enemies), len(g.obstacles), len(g.scenery), len(g.bullets), len(g.debris)) == (20,) * 5
+
+
+def test_compare_flags_only_slow_metrics():
+    results = run_suite(sizes=(5,), repeats=1)
+    assert set(results["n5"]) == {"update", "collisions", "draw"}
+    assert set(results["typical"]) == {"update", "draw"}
+    baseline = {"n5": {"update": 1e9, "collisions": 1e9, "draw": 1e-9}}
+    assert [(s, p) for s, p, _, _ in compare(results, baseline, 0.5)] == [("n5", "draw")]
+
+
+def test_compare_needs_raw_and_rescaled_regression():
+    baseline = {"n10": {"update": 1.0}, "calibration": 10.0}
+    # machine measured 2x faster: 1.2 ms is slow against the rescaled baseline only
+    assert compare({"n10": {"update": 1.2}, "calibration": 5.0}, baseline, 0.5) == []
+    # machine measured 2x slower: 1.8 ms is slow against the raw baseline only
+    assert compare({"n10": {"update": 1.8}, "calibration": 20.0}, baseline, 0.5) == []
+    assert compare({"n10": {"update": 3.5}, "calibration": 20.0}, baseline, 0.5) == [("n10", "update", 3.5, 3.0)]
@@ -0,0 +1,50 @@
+import pygame
+import pytest
+
+import jet_runner.config as cfg
+from jet_runner.capture import FrameWriter
+from jet_runner.game import Game
+
+
+def test_offscreen_headless_run_draws_full_size_frames():
+    g = Game(headless=True, seed=5, offscreen=True, verbose=False)
+    g.run(max_ticks=30, fast_forward=True)
+    assert g.screen.get_size() == (cfg.WIDTH, cfg.HEIGHT)
+    assert g.hud.renders > 0
+
+
+def test_raw_capture_matches_rendered_frames(tmp_path):
+    path = tmp_path / "frames.rgb"
+    writer = FrameWriter(str(path))
+    g = Game(headless=True, seed=5, capture=writer, verbose=False)
+    g.run(max_ticks=10, fast_forward=True)
+    writer.close()
+    frame = cfg.WIDTH * cfg.HEIGHT * 3
+    data = path.read_bytes()
+    assert writer.stats() == {"submitted": 10, "written": 10, "dropped": 0}
+    assert len(data) == 10 * frame
+    assert data[-frame:] == pygame.image.tobytes(g.screen, "RGB")
+
+
+def test_png_capture_and_dropped_frames(tmp_path):
+    surf = pygame.Surface((16, 8))
+    surf.fill((10, 200, 30))
+    writer = FrameWriter(str(tmp_path), size=(16, 8), fmt="png", queue_size=1)
+    accepted = sum(writer.submit(surf) for _ in range(50))
+    writer.close()
+    # with a single buffer in flight some frames may be dropped, but never blocked on
+    assert accepted + writer.dropped == 50 and writer.written == accepted
+    img = pygame.image.load(str(tmp_path / "frame_000000.png"))
+    assert img.get_at((3, 3))[:3] == (10, 200, 30)
+    with pytest.raises(ValueError):
+        FrameWriter(str(tmp_path), fmt="gif")
+
+
+def test_fast_forward_png_capture_waits_instead_of_dropping(tmp_path):
+    writer = FrameWriter(str(tmp_path), fmt="png", queue_size=1)
+    g = Game(headless=True, seed=5, capture=writer, verbose=False)
+    g.run(max_ticks=40, fast_forward=True)
+    writer.close()
+    assert not writer.realtime
+    assert writer.stats() == {"submitted": 40, "written": 40, "dropped": 0}
+    assert len(list(tmp_path.glob("frame_*.png"))) == 40
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.entities import Bullet, Enemy, Obstacle
+from benchmarks.bench_collisions import naive_collisions
+
+
+def populate(g, seed, n_bullets, n_enemies, n_obstacles):
+    rng = random.Random(seed)
+    random.seed(seed)
+    g.bullets = [Bullet(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), -cfg.BULLET_SPEED,
+                        owner="player" if rng.random() < 0.8 else "enemy") for _ in range(n_bullets)]
+    g.enemies = [Enemy(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), rng.uniform(24, 48),
+                       rng.uniform(18, 36), 100.0, hp=rng.choice([1, 2])) for _ in range(n_enemies)]
+    g.obstacles = [Obstacle(rng.uniform(0, cfg.WIDTH), rng.uniform(0, cfg.HEIGHT), rng.uniform(22, 60), 90.0,
+                            damage=rng.choice([1, 2])) for _ in range(n_obstacles)]
+    g.player.x = rng.uniform(40, cfg.WIDTH - 40)
+    # crowd the player so the player-vs-* passes get exercised too
+    px, py = g.player.x, g.player.y
+    for _ in range(3):
+        g.bullets.append(Bullet(px + rng.uniform(-20, 20), py, cfg.ENEMY_BULLET_SPEED, owner="enemy"))
+        g.enemies.append(Enemy(px + rng.uniform(-30, 30), py - 10, 30, 24, 100.0))
+        g.obstacles.append(Obstacle(px + rng.uniform(-30, 30), py + 10, 30, 90.0))
+
+
+def snapshot(g):
+    return (
+        [(b.x, b.y, b.owner) for b in g.bullets],
+        [(e.x, e.y, e.hp) for e in g.enemies],
+        [(o.x, o.y, o.hp) for o in g.obstacles],
+        [(d.x, d.y, d.w, d.h, d.vx, d.vy) for d in g.debris],
+        g.player.score,
+        g.player.health,
+    )
+
+
+@pytest.mark.parametrize("seed,counts", [
+    (1, (10, 5, 5)),
+    (2, (200, 40, 40)),
+    (3, (600, 120, 80)),
+])
+@pytest.mark.parametrize("min_targets", [0, 10**9], ids=["grid", "scan"])
+def test_broadphase_matches_naive(seed, counts, min_targets, monkeypatch):
+    monkeypatch.setattr(cfg, "BROADPHASE_MIN_TARGETS", min_targets)
+    naive = Game(headless=True)
+    grid = Game(headless=True)
+    populate(naive, seed, *counts)
+    populate(grid, seed, *counts)
+    assert snapshot(naive) == snapshot(grid)
+
+    random.seed(seed)
+    naive_collisions(naive)
+    random.seed(seed)
+    grid.handle_collisions()
+    assert snapshot(naive) == snapshot(grid)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from jet_runner.env import ACTIONS, JetRunnerEnv, VectorEnv, observation_spec
+
+
+def rollout(env, actions):
+    obs, _ = env.reset()
+    frames = [obs]
+    for a in actions:
+        obs, *_ = env.step(a)
+        frames.append(obs)
+    return np.stack(frames)
+
+
+def test_features_are_seeded_and_shaped():
+    actions = [i % len(ACTIONS) for i in range(120)]
+    a = rollout(JetRunnerEnv(seed=4), actions)
+    b = rollout(JetRunnerEnv(seed=4), actions)
+    shape, dtype = observation_spec("features")
+    assert a.shape[1:] == shape and a.dtype == dtype
+    assert np.array_equal(a, b)
+    assert a[-1, 1:, 0].any()  # some entity slots are filled by now
+
+
+def test_frame_observation_and_truncation():
+    env = JetRunnerEnv(obs="frame", seed=4, max_steps=3)
+    obs, info = env.reset()
+    assert obs.shape == observation_spec("frame")[0] and obs.any()
+    for _ in range(3):
+        obs, reward, terminated, truncated, info = env.step((1.0, True))
+    assert truncated and not terminated and info["ticks"] == 3
+    with pytest.raises(ValueError):
+        JetRunnerEnv(obs="pixels")
+
+
+def test_vector_env_matches_single_envs():
+    actions = np.array([[i % 6, (i + 3) % 6] for i in range(40)])
+    expected = [rollout(JetRunnerEnv(seed=10 + i), actions[:, i])[-1] for i in range(2)]
+    with VectorEnv(2, seed=10, workers=2) as venv:
+        obs, infos = venv.reset()
+        assert len(infos) == 2
+        for a in actions:
+            obs, rewards, terminated, truncated, infos = venv.step(a)
+        assert np.array_equal(obs, np.stack(expected))
@@ -1,6 +1,7 @@
 import pytest
 import pygame
 from jet_runner.game import Game
+import jet_runner.config as cfg
 
 
 def test_headless_runs_two_seconds():
@@ -10,3 +11,21 @@ def test_headless_runs_two_seconds():
     # After run, health should be <= initial and score >= 0
     assert g.player.health <= 5
     assert g.player.score >= 0
+
+
+def test_fast_forward_counts_simulated_time(capsys):
+    g = Game(headless=True)
+    # keep the player alive so the run isn't cut short by a game over
+    g.player.health = 10**6
+    g.run(max_seconds=30.0, fast_forward=True)
+    # 30 simulated seconds at a fixed 1/FPS step, far quicker than real time
+    assert g.ticks == 30 * cfg.FPS
+    out = capsys.readouterr().out
+    assert f"ticks={30 * cfg.FPS}" in out
+    assert "sim=30.00s" in out
+
+
+def test_max_ticks_stops_run():
+    g = Game(headless=True)
+    g.run(max_ticks=10, fast_forward=True)
+    assert g.ticks == 10
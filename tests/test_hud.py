@@ -0,0 +1,23 @@
+import pygame
+
+from jet_runner.hud import Hud, get_font
+
+
+def test_font_is_loaded_once():
+    assert get_font(22) is get_font(22)
+
+
+def test_lines_rerender_only_on_change():
+    screen = pygame.Surface((200, 100))
+    state = {"health": 5, "score": 0}
+    hud = Hud()
+    hud.add_line("status", lambda: (state["health"], state["score"]), "Health: {}  Score: {}")
+    hud.add_line("extra", lambda: (1,), "FPS: {}")
+    for _ in range(10):
+        rects = hud.draw(screen)
+    assert hud.renders == 2
+    assert len(rects) == 2 and rects[1].y > rects[0].y
+    state["score"] = 10
+    hud.draw(screen)
+    hud.draw(screen)
+    assert hud.renders == 3
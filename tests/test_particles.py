@@ -0,0 +1,49 @@
+import random
+
+import pygame
+
+import jet_runner.config as cfg
+from jet_runner.entities import Obstacle
+from jet_runner.particles import Particle, ParticleEmitter
+
+
+def make_particles(seed, n):
+    rng = random.Random(seed)
+    return [Particle(rng.uniform(-20, cfg.WIDTH + 20), rng.uniform(-20, cfg.HEIGHT + 20), rng.randint(4, 13),
+                     rng.randint(3, 10), rng.uniform(-80, 80), rng.uniform(20, 200), rng.uniform(0.1, 2.0),
+                     rng.choice(cfg.ASTEROID_PALETTES)[0]) for _ in range(n)]
+
+
+def test_emitter_steps_and_culls_like_per_particle_updates():
+    dt = 1 / cfg.FPS
+    expected = make_particles(1, 300)
+    emitter = ParticleEmitter(-200, cfg.HEIGHT + 200, capacity=16)
+    emitter.extend(expected)
+    for _ in range(90):
+        emitter.step(dt)
+        emitter.cull()
+        expected = [p._replace(x=p.x + p.vx * dt, y=p.y + p.vy * dt, lifetime=p.lifetime - dt) for p in expected]
+        expected = [p for p in expected if -200 < p.y < cfg.HEIGHT + 200 and p.lifetime > 0]
+        assert list(emitter) == expected
+    assert 0 < len(emitter) < 300
+
+
+def test_blits_draw_matches_per_fragment_ellipses():
+    pieces = make_particles(2, 500)
+    emitter = ParticleEmitter()
+    emitter.extend(pieces)
+    expected = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    for p in pieces:
+        pygame.draw.ellipse(expected, p.color, pygame.Rect(int(p.x - p.w / 2), int(p.y - p.h / 2), p.w, p.h))
+    got = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    rects = emitter.draw(got)
+    assert len(rects) == 500
+    assert pygame.image.tobytes(got, "RGB") == pygame.image.tobytes(expected, "RGB")
+
+
+def test_explode_into_emits_the_obstacle_fragments():
+    a = Obstacle(100, 200, 40, 90.0, rng=random.Random(5))
+    b = Obstacle(100, 200, 40, 90.0, rng=random.Random(5))
+    emitter = ParticleEmitter()
+    b.explode_into(emitter)
+    assert [(*frag, a.asteroid_palette[0]) for frag in a._fragments()] == [tuple(p) for p in emitter]
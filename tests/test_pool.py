@@ -0,0 +1,32 @@
+import jet_runner.config as cfg
+from jet_runner.entities import Bullet
+from jet_runner.pool import Pool
+from jet_runner.store import EntityStore
+
+
+def test_bullets_are_slotted():
+    assert not hasattr(Bullet(0, 0, 1.0), "__dict__")
+
+
+def test_store_releases_culled_entities_for_reuse():
+    pool = Pool(Bullet)
+    store = EntityStore(-50, cfg.HEIGHT + 50, pool=pool)
+    first = pool.acquire(10, -100, -500.0)
+    store.append(first)
+    store.cull()
+    assert len(store) == 0 and pool.stats()["free"] == 1
+    again = pool.acquire(20, 300, 220.0, owner="enemy")
+    assert again is first
+    assert (again.x, again.y, again.vy, again.owner, again.age) == (20, 300, 220.0, "enemy", 0.0)
+    st = pool.stats()
+    assert st["created"] == 1 and st["reused"] == 1 and st["high_water"] == 1
+    assert st["reuse_rate"] == 0.5
+
+
+def test_release_ignores_objects_the_pool_did_not_create():
+    pool = Pool(Bullet)
+    store = EntityStore(-50, cfg.HEIGHT + 50, pool=pool)
+    store.extend([pool.acquire(10, -100, -500.0), Bullet(20, -100, -500.0)])
+    store.cull()
+    st = pool.stats()
+    assert st["live"] == 0 and st["free"] == 1 and st["high_water"] == 1
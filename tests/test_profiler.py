@@ -0,0 +1,45 @@
+import csv
+import json
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.profiler import FrameProfiler, PHASES, COUNTS
+
+
+def test_ring_buffer_keeps_last_frames():
+    p = FrameProfiler(size=4)
+    for i in range(10):
+        p.begin_frame()
+        p.mark(0)
+        p.end_frame((i,) * len(COUNTS))
+    assert p.frames == 10
+    assert sorted(p.counts[:, 0].tolist()) == [6, 7, 8, 9]
+    summary = p.summary()
+    assert summary["window"] == 4
+    assert set(summary["phases"]) == set(PHASES) | {"frame"}
+
+
+def test_game_profile_export(tmp_path):
+    g = Game(headless=True, profile=True)
+    g.player.health = 10**6
+    g.run(max_ticks=120, fast_forward=True)
+    assert g.profiler.frames == 120
+    js = tmp_path / "prof.json"
+    g.profiler.export(str(js))
+    data = json.loads(js.read_text())
+    assert data["phases"]["collisions"]["p99"] >= data["phases"]["collisions"]["p50"]
+    cv = tmp_path / "prof.csv"
+    g.profiler.export(str(cv))
+    rows = list(csv.reader(cv.open()))
+    assert rows[0][:5] == ["kind", "name", "p50", "p95", "p99"]
+    assert len(rows) == 1 + len(PHASES) + 1 + len(COUNTS)
+
+
+def test_frame_limiter_sleep_is_not_profiled():
+    g = Game(headless=True, profile=True, verbose=False)
+    g.player.health = 10**6
+    g.run(max_ticks=20)
+    phases = g.profiler.summary()["phases"]
+    budget_ms = 1000.0 / cfg.FPS
+    assert phases["events"]["p50"] < 0.1 * budget_ms
+    assert phases["frame"]["p50"] < 0.5 * budget_ms
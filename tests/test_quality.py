@@ -0,0 +1,70 @@
+import pygame
+import pytest
+
+import jet_runner.config as cfg
+from jet_runner.entities import Scenery
+from jet_runner.game import Game
+from jet_runner.policies import IdlePolicy
+from jet_runner.quality import TIERS, QualityGovernor
+
+
+def _feed(gov, frame_time, frames):
+    return [gov.observe(frame_time) for _ in range(frames)]
+
+
+def test_governor_steps_down_and_up_with_hysteresis():
+    gov = QualityGovernor(budget=0.01, window=10, down_at=0.9, up_at=0.6, up_windows=3)
+    assert sum(_feed(gov, 0.02, 10)) == 1 and gov.tier.name == "medium"
+    _feed(gov, 0.02, 100)
+    assert gov.tier == TIERS[-1]
+    # inside the hysteresis band nothing moves
+    assert not any(_feed(gov, 0.007, 100))
+    # stepping up needs up_windows consecutive calm windows; a window in the band starts over
+    assert not any(_feed(gov, 0.001, 12) + _feed(gov, 0.007, 10))
+    steps = _feed(gov, 0.001, 40)
+    assert steps.index(True) == 21 and sum(steps) == 1
+    assert [c[1] for c in gov.changes] == ["medium", "low", "medium"]
+    with pytest.raises(ValueError):
+        QualityGovernor(down_at=0.5, up_at=0.8)
+
+
+def test_low_tier_thins_scenery_and_drops_nebulae():
+    def run(tier):
+        g = Game(headless=True, seed=5, allow_nebulae=True, input_policy=IdlePolicy(), verbose=False)
+        g.quality = tier
+        kinds = []
+        for _ in range(600):
+            n = len(g.scenery)
+            g.update(1 / cfg.FPS)
+            kinds.extend(s.kind for s in list(g.scenery)[n:])
+        return kinds
+
+    high, low = run(TIERS[0]), run(TIERS[-1])
+    assert len(low) < len(high) * 0.5
+    assert "nebula" in high and "nebula" not in low
+
+
+def test_game_reports_tier_changes_in_hud():
+    g = Game(headless=True, seed=5, adaptive_quality=True, input_policy=IdlePolicy(), verbose=False)
+    g.governor = QualityGovernor(budget=1e-9, window=3)
+    g.run(max_ticks=3, fast_forward=True)
+    assert g.quality.name == "medium"
+    surf = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    g.hud.draw(surf)
+    assert [ln.last for ln in g.hud.lines if ln.name == "quality"] == [("medium",)]
+
+
+def test_adaptive_games_cannot_be_recorded():
+    with pytest.raises(ValueError, match="adaptive_quality"):
+        Game(headless=True, adaptive_quality=True, record=True, verbose=False)
+
+
+def test_opaque_scenery_matches_translucent_over_background():
+    s = Scenery(100, 100, 50, 50, 10, kind="planet", alpha=120)
+    translucent = pygame.Surface((200, 200))
+    opaque = pygame.Surface((200, 200))
+    for target, flat in ((translucent, False), (opaque, True)):
+        target.fill(cfg.COLOR_BG)
+        target.blit(*s.blit_item(flat))
+    assert s.blit_item(True)[0].get_colorkey() is not None
+    assert pygame.image.tobytes(opaque, "RGB") == pygame.image.tobytes(translucent, "RGB")
@@ -0,0 +1,77 @@
+import random
+
+import pygame
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.render import DirtyRectRenderer, RenderQueue
+
+
+def test_dirty_rects_match_full_redraw():
+    random.seed(7)
+    g = Game(headless=True)
+    g.player.health = 10**6
+    # like a dirty-rect game: stars come as scenery entities, not the scrolling starfield
+    g.starfield = None
+    dirty_screen = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    full_screen = pygame.Surface((cfg.WIDTH, cfg.HEIGHT))
+    renderer = DirtyRectRenderer(dirty_screen)
+    for tick in range(240):
+        g.update(1 / cfg.FPS)
+        if tick % 4:
+            continue
+        g.screen, g.dirty = dirty_screen, renderer
+        g.draw()
+        g.screen, g.dirty = full_screen, None
+        g.draw()
+        assert pygame.image.tobytes(dirty_screen, "RGB") == pygame.image.tobytes(full_screen, "RGB")
+    assert renderer.partial_frames > 0
+
+
+def _draw_each(g, surf):
+    # the per-entity path the render queue replaces
+    surf.fill(cfg.COLOR_BG)
+    if g.starfield is not None:
+        g.starfield.draw(surf)
+    for group in (g.scenery, g.obstacles):
+        for e in group:
+            e.draw(surf)
+    g.debris.draw(surf)
+    for group in (g.enemies, g.bullets):
+        for e in group:
+            e.draw(surf)
+    g.player.draw(surf)
+
+
+def test_render_queue_matches_per_entity_draws():
+    g = Game(headless=True, seed=11, input_policy=lambda game: (0.0, True))
+    g.player.health = 10**6
+    g.hud = type(g.hud)()  # no text lines: compare the scene only
+    ref = pygame.Surface((cfg.WIDTH, cfg.HEIGHT)).convert()
+    for tick in range(300):
+        g.update(1 / cfg.FPS)
+        if tick % 30:
+            continue
+        g.draw()
+        _draw_each(g, ref)
+        assert pygame.image.tobytes(g.screen, "RGB") == pygame.image.tobytes(ref, "RGB")
+        counts = g.render_queue.counts
+        assert counts["background"] == 2 * len(cfg.STARFIELD_LAYERS)
+        assert counts["enemies"] == len(g.enemies) and counts["bullets"] == len(g.bullets)
+    assert len(g.bullets) and not any(g.render_queue.layers.values())
+
+
+def test_render_queue_sorted_layers_keep_layer_order():
+    a = pygame.Surface((4, 4))
+    a.fill((255, 0, 0))
+    b = pygame.Surface((4, 4))
+    b.fill((0, 255, 0))
+    q = RenderQueue(layers=("low", "high"), sort_by_surface=True)
+    q.submit("high", b, (0, 0))
+    q.extend("low", [(a, (0, 0)), (b, (10, 0)), (a, (20, 0))])
+    target = pygame.Surface((32, 8))
+    rects = q.present(target)
+    assert len(rects) == 4 and q.counts == {"low": 3, "high": 1} and q.total() == 4
+    # the higher layer is drawn last even though it was submitted first
+    assert target.get_at((1, 1))[:3] == (0, 255, 0)
+    assert target.get_at((21, 1))[:3] == (255, 0, 0)
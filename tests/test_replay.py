@@ -0,0 +1,89 @@
+import pytest
+
+from jet_runner.game import Game
+from jet_runner.policies import RandomPolicy
+from jet_runner.replay import Recorder, Recording, replay
+
+
+def _play(tmp_path, fast_forward, ticks):
+    g = Game(headless=True, seed=42, input_policy=RandomPolicy(seed=1), record=True, verbose=False)
+    g.run(max_ticks=ticks, fast_forward=fast_forward)
+    path = tmp_path / "game.jrr"
+    g.recorder.save(str(path), g)
+    return g, path
+
+
+def test_same_seed_same_game():
+    a = Game(headless=True, seed=9, input_policy=RandomPolicy(seed=2), verbose=False)
+    b = Game(headless=True, seed=9, input_policy=RandomPolicy(seed=2), verbose=False)
+    a.run(max_ticks=600, fast_forward=True)
+    b.run(max_ticks=600, fast_forward=True)
+    assert a.state_digest() == b.state_digest()
+
+
+def test_fixed_step_replay_matches(tmp_path):
+    g, path = _play(tmp_path, fast_forward=True, ticks=1200)
+    rec = Recording.load(str(path))
+    assert len(rec) == g.ticks and rec.fixed_step
+    replayed, ok = replay(str(path))
+    assert ok
+    assert replayed.player.score == g.player.score and replayed.kills == g.kills
+
+
+def test_variable_step_replay_matches(tmp_path):
+    g, path = _play(tmp_path, fast_forward=False, ticks=20)
+    replayed, ok = replay(str(path))
+    assert ok and replayed.ticks == 20
+
+
+def test_tampered_recording_mismatches(tmp_path):
+    g, path = _play(tmp_path, fast_forward=True, ticks=600)
+    data = bytearray(path.read_bytes())
+    data[12] ^= 1  # flip a bit of the seed
+    path.write_bytes(bytes(data))
+    _, ok = replay(str(path))
+    assert not ok
+
+
+def test_replay_keeps_spawn_multiplier_and_caps(tmp_path):
+    g = Game(headless=True, seed=5, input_policy=RandomPolicy(seed=1), record=True, verbose=False,
+             spawn_multiplier=3.0, caps={"enemies": 2})
+    g.run(max_ticks=600, fast_forward=True)
+    path = tmp_path / "stress.jrr"
+    g.recorder.save(str(path), g)
+    rec = Recording.load(str(path))
+    assert rec.spawn_multiplier == 3.0 and rec.caps == {"enemies": 2}
+    replayed, ok = replay(str(path))
+    assert ok and len(replayed.enemies) <= 2
+
+
+def test_replay_keeps_dirty_rect_scenery(tmp_path):
+    g = Game(headless=True, seed=5, input_policy=RandomPolicy(seed=1), record=True, verbose=False, dirty_rects=True)
+    g.run(max_ticks=600, fast_forward=True)
+    assert g.starfield is None and any(s.kind == "star" for s in g.scenery)
+    path = tmp_path / "dirty.jrr"
+    g.recorder.save(str(path), g)
+    assert Recording.load(str(path)).dirty_rects
+    _, ok = replay(str(path))
+    assert ok
+
+
+@pytest.mark.parametrize("seed", [-7, 2 ** 64])
+def test_unrecordable_seed_rejected(seed):
+    with pytest.raises(ValueError, match="seed"):
+        Game(headless=True, seed=seed, verbose=False)
+
+
+def test_long_frame_recorded(tmp_path):
+    rec = Recorder()
+    rec.record(0.0, False, 70.0)
+    assert list(rec.dt_ms) == [70000]
+    # a variable-step game with a stall (resume from sleep, debugger) still replays
+    g = Game(headless=True, seed=3, input_policy=RandomPolicy(seed=1), record=True, verbose=False)
+    for dt in (0.016, 70.0, 0.017):
+        g.tick(dt, fixed=False)
+    path = tmp_path / "stall.jrr"
+    g.recorder.save(str(path), g)
+    assert Recording.load(str(path)).dts == [0.016, 70.0, 0.017]
+    _, ok = replay(str(path))
+    assert ok
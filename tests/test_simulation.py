@@ -0,0 +1,53 @@
+import pygame
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.policies import RandomPolicy
+from jet_runner.simulation import InputQueue, InterpolatedRenderer, Snapshot, interpolate
+
+
+def test_threaded_run_matches_fixed_step_run():
+    a = Game(headless=True, seed=4, input_policy=RandomPolicy(seed=3), verbose=False)
+    a.run(max_ticks=40, fast_forward=True)
+    b = Game(headless=True, seed=4, input_policy=RandomPolicy(seed=3), verbose=False, offscreen=True)
+    b.run(max_ticks=40, threaded=True)
+    assert b.ticks == 40 and not b.running
+    assert a.state_digest() == b.state_digest()
+
+
+def test_threaded_profile_times_draws_and_counts_blits():
+    g = Game(headless=True, seed=4, input_policy=RandomPolicy(seed=3), verbose=False, offscreen=True, profile=True)
+    g.run(max_ticks=60, threaded=True)
+    assert g.profiler.summary()["phases"]["draw"]["max"] > 0.0
+    # the overlay reads the game's queue, which the threaded renderer draws through
+    assert g.render_queue.counts["background"] > 0
+
+
+def test_input_queue_keeps_taps_and_holds_last_input():
+    q = InputQueue()
+    assert q.take() == (0.0, False)
+    q.put(-1.0, True)
+    q.put(1.0, False)
+    assert q.take() == (1.0, True)
+    assert q.take() == (1.0, False)
+
+
+def test_interpolation_blends_known_objects_only():
+    img = object()
+    items = ((img, (10, 20)), (img, (200, 0)), (img, (5, 5)))
+    before = {1: (0, 0), 2: (0, 0)}
+    assert interpolate(items, (1, 2, 3), before, 0.5) == [(img, (5, 10)), (img, (200, 0)), (img, (5, 5))]
+
+
+def test_renderer_draws_between_snapshots():
+    g = Game(headless=True, seed=1, verbose=False)
+    g.hud.lines = []
+    sprite = pygame.Surface((4, 4))
+    sprite.fill((255, 255, 255))
+    prev = Snapshot(1, 1.0, (("enemies", ((sprite, (0, 0)),), (7,)),))
+    cur = Snapshot(2, 2.0, (("enemies", ((sprite, (40, 0)),), (7,)),))
+    r = InterpolatedRenderer(g)
+    assert not r.draw((None, None), 0.0)
+    assert r.draw((prev, cur), 1.25) and r.alpha == 0.25
+    assert g.screen.get_at((11, 1))[:3] == (255, 255, 255)
+    assert g.screen.get_at((1, 1))[:3] == cfg.COLOR_BG
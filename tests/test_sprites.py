@@ -0,0 +1,97 @@
+import pygame
+
+from jet_runner.entities import Scenery
+from jet_runner.sprites import SurfaceCache
+
+
+def _surf(key):
+    return pygame.Surface((2, 2), flags=pygame.SRCALPHA)
+
+
+def test_surface_cache_lru_and_counters():
+    cache = SurfaceCache(max_size=2)
+    a = cache.get("a", _surf)
+    assert cache.get("a", _surf) is a
+    cache.get("b", _surf)
+    cache.get("a", _surf)  # "b" is now least recently used
+    cache.get("c", _surf)
+    assert len(cache) == 2
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 3 and stats["evictions"] == 1
+    assert cache.get("a", _surf) is a
+
+
+def test_scenery_draw_reuses_cached_surfaces():
+    screen = pygame.Surface((480, 640))
+    Scenery.cache.clear()
+    items = [Scenery(100, 100, 60, 30, 20.0, kind=k, alpha=120) for k in ("star", "planet", "comet", "nebula")]
+    for s in items:
+        s.draw(screen)
+    misses = Scenery.cache.misses
+    hits = Scenery.cache.hits
+    for s in items[1:]:
+        s.draw(screen)
+    assert Scenery.cache.misses == misses
+    assert Scenery.cache.hits == hits + 3
+
+
+def test_nebula_texture_is_seeded_soft_noise():
+    from jet_runner.entities import _render_nebula
+    palette = ((60, 60, 180), (200, 80, 160), (200, 200, 255))
+    a = _render_nebula(120, 50, palette, 150, seed=3)
+    b = _render_nebula(120, 50, palette, 150, seed=3)
+    assert pygame.image.tobytes(a, "RGBA") == pygame.image.tobytes(b, "RGBA")
+    alpha = pygame.surfarray.array_alpha(a)
+    # opaque-ish core, fully transparent corners, never above the scenery alpha
+    assert alpha.max() <= 150 and alpha.max() > 40
+    assert alpha[0, 0] == alpha[-1, -1] == 0
+    assert pygame.image.tobytes(_render_nebula(120, 50, palette, 150, seed=4), "RGBA") != pygame.image.tobytes(a, "RGBA")
+
+
+def test_player_sprites_scaled_once_until_resized(monkeypatch):
+    from jet_runner.entities import Player
+    screen = pygame.Surface((480, 640))
+    p = Player(240, 580)
+    p.sprite = pygame.Surface((64, 64), flags=pygame.SRCALPHA)
+    p.flame_sprite = pygame.Surface((20, 30), flags=pygame.SRCALPHA)
+    calls = []
+    real = pygame.transform.smoothscale
+    monkeypatch.setattr(pygame.transform, "smoothscale", lambda *a: calls.append(a) or real(*a))
+    for cooldown in (0.0, 0.2, 0.0):
+        p.fire_cooldown = cooldown
+        p.draw(screen)
+    assert len(calls) == 2  # jet + flame, once
+    p.w = 60
+    p.draw(screen)
+    assert len(calls) == 4
+
+
+def test_enemy_atlas_frame_matches_primitive_drawing():
+    from jet_runner.entities import Enemy, _draw_enemy
+    import jet_runner.config as cfg
+    # size on the quantization grid and age on a phase boundary -> identical pixels
+    e = Enemy(100, 100, 30, 24, 100.0)
+    e.palette = cfg.ENEMY_PALETTES[1]
+    e.age = 0.0
+    atlas = pygame.Surface((200, 200))
+    direct = pygame.Surface((200, 200))
+    e.draw(atlas)
+    _draw_enemy(direct, e.x, e.y, e.w, e.h, e.palette, e.age)
+    assert pygame.image.tobytes(atlas, "RGB") == pygame.image.tobytes(direct, "RGB")
+
+
+def test_obstacle_surface_matches_primitive_drawing():
+    from jet_runner.entities import Obstacle, _draw_asteroid
+    import jet_runner.config as cfg
+    ob = Obstacle(100.5, 120.25, 37.6, 90.0)
+    # a seed on a bucket boundary renders the exact same craters
+    ob.seed = 5 / cfg.ASTEROID_SEED_BUCKETS
+    cached = pygame.Surface((240, 240))
+    direct = pygame.Surface((240, 240))
+    ob.draw(cached)
+    _draw_asteroid(direct, ob.rect(), ob.asteroid_palette, ob.seed)
+    assert pygame.image.tobytes(cached, "RGB") == pygame.image.tobytes(direct, "RGB")
+    img = ob._img
+    ob.y += 10
+    ob.draw(cached)
+    assert ob._img is img
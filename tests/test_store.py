@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+import jet_runner.config as cfg
+from jet_runner.entities import Bullet, Enemy, EnemyStore, Scenery
+from jet_runner.store import EntityStore
+
+
+def test_step_matches_per_object_update():
+    dt = 1 / 60
+    store = EntityStore(-200, cfg.HEIGHT + 200)
+    for i in range(20):
+        b = Bullet(10.0 * i, 5.0 * i, 40.0 + i)
+        b.vx = 30.0 - i
+        b.lifetime = 0.05 * i
+        store.append(b)
+    expected = [(10.0 * i, 5.0 * i, 0.05 * i) for i in range(20)]
+    for _ in range(5):
+        store.step(dt)
+        expected = [(x + (30.0 - i) * dt, y + (40.0 + i) * dt, life - dt) for i, (x, y, life) in enumerate(expected)]
+    assert [(b.x, b.y, b.lifetime) for b in store] == expected
+
+
+def test_cull_preserves_order_and_detaches():
+    store = EntityStore(-50, cfg.HEIGHT + 50)
+    bullets = [Bullet(i, y, -500.0) for i, y in enumerate([10, -60, 300, cfg.HEIGHT + 60, 20])]
+    store.extend(bullets)
+    store.cull()
+    assert [b.x for b in store] == [0, 2, 4]
+    assert [b._slot for b in store] == [0, 1, 2]
+    # culled entities keep their last values and keep working standalone
+    gone = bullets[1]
+    assert gone._store is None and gone.y == -60
+    gone.update(0.1)
+    assert gone.y == -110
+
+
+def test_views_write_through():
+    store = EntityStore()
+    s = Scenery(5, 5, 8, 8, 20.0, kind="star")
+    store.append(s)
+    s.y = 100.0
+    store.step(0.5)
+    assert s.y == 110.0 and s.age == 0.5
+    assert store.cols["y"][0] == 110.0
+
+
+def test_enemy_store_matches_per_enemy_update():
+    rng = random.Random(11)
+    def make():
+        r = random.Random(11)
+        return [Enemy(r.uniform(0, 400), r.uniform(0, 600), 30, 24, r.uniform(80, 200),
+                      pattern=r.choice(["straight", "sine", "zigzag", "hover"]), can_fire=r.random() < 0.5,
+                      rng=random.Random(1)) for _ in range(60)]
+    loose = make()
+    store = EnemyStore()
+    store.extend(make())
+    for _ in range(200):
+        dt = rng.uniform(0.01, 0.03)
+        for e in loose:
+            e.update(dt)
+        ready = store.step(dt)
+        assert [store.items.index(e) for e in ready] == \
+            [i for i, e in enumerate(loose) if e.can_fire and e.fire_cd <= 0.0]
+        for e in ready:
+            e.fire_cd = 1.0
+        for e in loose:
+            if e.can_fire and e.fire_cd <= 0.0:
+                e.fire_cd = 1.0
+    for a, b in zip(loose, store):
+        assert (a.x, a.y, a.vx, a.age, a.fire_cd) == pytest.approx((b.x, b.y, b.vx, b.age, b.fire_cd))
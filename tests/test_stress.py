@@ -0,0 +1,59 @@
+import pytest
+
+import jet_runner.config as cfg
+from jet_runner.game import Game
+from jet_runner.stress import StressRamp
+from jet_runner.policies import IdlePolicy
+
+
+def test_multiplier_spawns_per_interval_with_fraction_carry():
+    g = Game(headless=True, seed=3, spawn_multiplier=2.5, input_policy=IdlePolicy(), verbose=False)
+    g.update(cfg.SPAWN_ENEMY_INTERVAL)
+    assert len(g.enemies) == 2
+    g.update(cfg.SPAWN_ENEMY_INTERVAL)
+    assert len(g.enemies) == 5
+
+
+def test_caps_limit_population():
+    g = Game(headless=True, seed=3, spawn_multiplier=10, caps={"obstacles": 4}, input_policy=IdlePolicy(),
+             verbose=False)
+    for _ in range(3):
+        g.update(cfg.SPAWN_OBSTACLE_INTERVAL)
+    assert len(g.obstacles) == 4
+    with pytest.raises(ValueError):
+        Game(headless=True, caps={"bosses": 1})
+
+
+@pytest.mark.parametrize("multiplier", [-1.0, float("nan"), float("inf")])
+def test_invalid_spawn_multiplier_rejected(multiplier):
+    with pytest.raises(ValueError, match="spawn_multiplier"):
+        Game(headless=True, spawn_multiplier=multiplier, verbose=False)
+
+
+@pytest.mark.parametrize("cap", [-1, 2 ** 32, 2.5])
+def test_unrecordable_caps_rejected(cap):
+    with pytest.raises(ValueError, match="cap for enemies"):
+        Game(headless=True, caps={"enemies": cap}, verbose=False)
+
+
+def test_ramp_reports_when_budget_is_exceeded():
+    g = Game(headless=True, seed=3, stress_ramp=True, input_policy=IdlePolicy(), verbose=False)
+    # nothing fits in a nanosecond budget, so the first full window ends the run
+    g.stress = StressRamp(budget=1e-9, window=5)
+    g.run(max_ticks=100, fast_forward=True)
+    assert g.ticks == 5
+    assert g.stress.result["multiplier"] == 1.0
+    assert "FPS lost" in g.stress.report()
+
+
+def test_ramp_grows_multiplier_while_within_budget():
+    g = Game(headless=True, seed=3, stress_ramp=True, input_policy=IdlePolicy(), verbose=False)
+    g.stress = StressRamp(budget=10.0, growth=2.0, window=5)
+    g.run(max_ticks=20, fast_forward=True)
+    assert g.spawn_multiplier == 16.0 and g.stress.result is None
+
+
+def test_ramp_cannot_be_recorded():
+    # the ramp follows wall-clock frame times, so a replay would diverge
+    with pytest.raises(ValueError, match="stress_ramp"):
+        Game(headless=True, stress_ramp=True, record=True, verbose=False)